@@ -16,6 +16,7 @@ setup(
     license='MIT',
     url='https://github.com/roclark/sportsipy',
     packages=find_packages(),
+    package_data={'sportsipy.fb': ['*.tsv']},
     python_requires='>=3.7',
     keywords='stats sports api sportsipy machine learning',
     install_requires=[
@@ -24,6 +25,9 @@ setup(
         "pyquery >= 1.4.0",
         "requests >= 2.18.4"
     ],
+    extras_require={
+        "brotli": ["brotli >= 1.0.9"]
+    },
     classifiers=(
         'Programming Language :: Python :: 3.7',
         'Programming Language :: Python :: 3.8',
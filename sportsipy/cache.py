@@ -0,0 +1,55 @@
+import os
+from . import utils
+
+
+def enable(directory):
+    """
+    Save every parsed boxscore and player to a directory for later reuse.
+
+    Downloading a page is only part of the cost of pulling it, as parsing
+    every field from the HTML often takes longer than the download itself.
+    Once enabled, each parsed Boxscore and Player is saved to the directory
+    and is restored from there the next time the same page is requested,
+    skipping the parsing entirely.
+
+    Pages are still downloaded, and a saved object is only reused if the
+    contents of its page are identical and it was parsed by the same version
+    of the league's parser. Updating sportsipy, or any change to a league's
+    parsing schemes, automatically invalidates every object saved by an older
+    parser.
+
+    Parameters
+    ----------
+    directory : string
+        A ``string`` of the path to the directory to save parsed objects in.
+        The directory is created if it doesn't exist.
+    """
+    directory = os.path.expanduser(directory)
+    os.makedirs(directory, exist_ok=True)
+    utils._parsed_cache_directory = directory
+
+
+def disable():
+    """
+    Stop saving and reusing parsed boxscores and players.
+
+    Objects which were already saved are left in place and are reused again
+    once the cache is re-enabled for the same directory.
+    """
+    utils._parsed_cache_directory = None
+
+
+def clear():
+    """
+    Delete every parsed object saved in the enabled directory.
+
+    Objects saved by older versions of a parser are never reused but are
+    left on disk until they are cleared.
+    """
+    directory = utils._parsed_cache_directory
+    if directory is None:
+        return
+    for root, _, files in os.walk(directory):
+        for filename in files:
+            if filename.endswith('.pickle'):
+                os.remove(os.path.join(root, filename))
@@ -1,5 +1,243 @@
-from difflib import get_close_matches
-from .squad_ids import SQUAD_IDS
+import threading
+import time
+from bisect import bisect_left
+from collections import Counter, OrderedDict
+from collections.abc import Mapping
+from .constants import SQUAD_URL
+from difflib import SequenceMatcher
+from os.path import dirname, join
+from pyquery import PyQuery as pq
+from .. import utils
+
+
+# The number of candidates from the trigram index which are compared in
+# detail against a requested squad name. Only the candidates sharing the most
+# trigrams with the name are likely to be close matches.
+CANDIDATE_LIMIT = 100
+SQUAD_IDS_FILE = join(dirname(__file__), 'squad_ids.tsv')
+LEAGUE_IDS_FILE = join(dirname(__file__), 'league_ids.tsv')
+# The tables and indices below are loaded the first time they are needed.
+_squad_table = None
+_league_table = None
+_sorted_squad_ids = None
+_league_squads = None
+# The trigram index of every squad name, built the first time a name can't be
+# matched exactly.
+_squad_name_index = None
+# The maximum number of parsed squad pages to keep at once. Each page is
+# several megabytes once parsed, so only the most recently used pages are
+# kept until they are explicitly released.
+SQUAD_DOCUMENT_CACHE_SIZE = 8
+# The number of seconds a parsed squad page is reused before it is downloaded
+# again, so long-running processes don't keep serving outdated stats.
+SQUAD_DOCUMENT_MAX_AGE = 300
+_squad_documents = OrderedDict()
+_squad_documents_lock = threading.Lock()
+
+
+class _SortedTable(Mapping):
+    """
+    A read-only mapping backed by a sorted data file.
+
+    Each line of the file contains a key and value separated by a tab, with
+    the lines sorted by key. The keys and values are kept in two parallel
+    lists which are searched with a binary search, which is much cheaper to
+    load and hold in memory than compiling a large dictionary literal.
+
+    Parameters
+    ----------
+    filename : string
+        A ``string`` of the path to the sorted data file.
+    """
+    def __init__(self, filename):
+        with open(filename, 'r', encoding='utf8') as data_file:
+            rows = [line.split('\t') for line in data_file.read().splitlines()]
+        self._keys = [row[0] for row in rows]
+        self._values = [row[1] for row in rows]
+
+    def _position(self, key):
+        """
+        Find the position of the key in the table, or None if it is missing.
+        """
+        position = bisect_left(self._keys, key)
+        if position < len(self._keys) and self._keys[position] == key:
+            return position
+        return None
+
+    def __getitem__(self, key):
+        position = self._position(key)
+        if position is None:
+            raise KeyError(key)
+        return self._values[position]
+
+    def __contains__(self, key):
+        return self._position(key) is not None
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __len__(self):
+        return len(self._keys)
+
+
+def _squad_ids():
+    """
+    Retrieve the master list of squad names and their IDs.
+
+    The list contains thousands of squads and is only loaded the first time a
+    squad needs to be looked up to avoid slowing down the import of sportsipy.
+
+    Returns
+    -------
+    _SortedTable
+        Returns a read-only mapping where each key is the parsed name of a
+        squad and each value is the squad's 8-digit ID.
+    """
+    global _squad_table
+
+    if _squad_table is None:
+        _squad_table = _SortedTable(SQUAD_IDS_FILE)
+    return _squad_table
+
+
+def _league_ids():
+    """
+    Retrieve the master list of squad IDs and their league postfixes.
+
+    Similar to the squad IDs, the list is only loaded the first time it is
+    needed.
+
+    Returns
+    -------
+    _SortedTable
+        Returns a read-only mapping where each key is the 8-digit ID of a
+        squad and each value is the postfix of the league the squad competes
+        in.
+    """
+    global _league_table
+
+    if _league_table is None:
+        _league_table = _SortedTable(LEAGUE_IDS_FILE)
+    return _league_table
+
+
+def _is_squad_id(squad_id):
+    """
+    Determine whether a string is a known squad ID.
+
+    Parameters
+    ----------
+    squad_id : string
+        A ``string`` of the lowercase 8-digit ID to check.
+
+    Returns
+    -------
+    boolean
+        Returns ``True`` if the ID belongs to a squad in the master list.
+    """
+    global _sorted_squad_ids
+
+    if _sorted_squad_ids is None:
+        _sorted_squad_ids = sorted(set(_squad_ids().values()))
+    position = bisect_left(_sorted_squad_ids, squad_id)
+    return position < len(_sorted_squad_ids) and \
+        _sorted_squad_ids[position] == squad_id
+
+
+def _league_squad_ids(league_id):
+    """
+    Find the squads which compete in a league.
+
+    Parameters
+    ----------
+    league_id : string
+        A ``string`` of the league's ID, such as '10728' for the Premier
+        League.
+
+    Returns
+    -------
+    list
+        Returns a sorted ``list`` of the 8-digit IDs of every squad in the
+        league, or an empty ``list`` if the league is unknown.
+    """
+    global _league_squads
+
+    if _league_squads is None:
+        league_squads = {}
+        for squad_id, league in _league_ids().items():
+            league_squads.setdefault(league, []).append(squad_id)
+        _league_squads = league_squads
+    return list(_league_squads.get(str(league_id), []))
+
+
+def _pull_squad_document(squad_id, squad_page=None):
+    """
+    Retrieve the parsed squad page for the requested squad.
+
+    The Team, Schedule, and Roster classes are all built from the same squad
+    page. To prevent each of them from downloading and parsing the page again,
+    the page is parsed once with all HTML comments removed (as several of the
+    stats tables are hidden in comments) and kept in a cache keyed by the
+    squad ID until it is released with ``release_squad_page``. Pages older
+    than ``SQUAD_DOCUMENT_MAX_AGE`` seconds are downloaded again.
+
+    Parameters
+    ----------
+    squad_id : string
+        A ``string`` of the squad's 8-digit ID.
+    squad_page : string (optional)
+        Optionally specify the filename of a local file to use to pull data
+        instead of downloading from fbref.com. The parsed file replaces any
+        cached page for the squad.
+
+    Returns
+    -------
+    PyQuery object
+        Returns a PyQuery object of the squad page without HTML comments.
+
+    Raises
+    ------
+    HTTPError
+        Raises an ``HTTPError`` if the page could not be downloaded.
+    """
+    if not squad_page:
+        with _squad_documents_lock:
+            if squad_id in _squad_documents:
+                doc, pulled = _squad_documents[squad_id]
+                if time.monotonic() - pulled < SQUAD_DOCUMENT_MAX_AGE:
+                    _squad_documents.move_to_end(squad_id)
+                    return doc
+                del _squad_documents[squad_id]
+    doc = utils._pull_page(SQUAD_URL % squad_id, squad_page)
+    doc = pq(utils._remove_html_comment_tags(doc))
+    with _squad_documents_lock:
+        _squad_documents[squad_id] = (doc, time.monotonic())
+        _squad_documents.move_to_end(squad_id)
+        while len(_squad_documents) > SQUAD_DOCUMENT_CACHE_SIZE:
+            _squad_documents.popitem(last=False)
+    return doc
+
+
+def release_squad_page(squad_id=None):
+    """
+    Release the parsed squad page for one or all squads.
+
+    Once the Team, Schedule, and Roster for a squad have been created, the
+    parsed squad page is no longer needed. Releasing it frees the memory used
+    by the page, and the page will be downloaded again the next time it is
+    requested.
+
+    Parameters
+    ----------
+    squad_id : string (optional)
+        A ``string`` of the 8-digit ID of the squad to release. If not
+        specified, the pages for every squad are released.
+    """
+    with _squad_documents_lock:
+        if squad_id is None:
+            _squad_documents.clear()
+        else:
+            _squad_documents.pop(squad_id.lower(), None)
 
 
 def _parse_squad_name(team_id):
@@ -27,6 +265,107 @@ def _parse_squad_name(team_id):
     return name
 
 
+def _trigrams(name):
+    """
+    Split a name into the set of three-character sequences it contains.
+
+    The name is padded with spaces so the beginning and end of the name are
+    weighted more heavily, as they are for most team names.
+
+    Parameters
+    ----------
+    name : string
+        A ``string`` of the parsed name to split.
+
+    Returns
+    -------
+    set
+        Returns a ``set`` of every three-character ``string`` in the name.
+    """
+    padded = '  %s ' % name
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _build_squad_name_index(names):
+    """
+    Create an index of squad names by the trigrams they contain.
+
+    Parameters
+    ----------
+    names : iterable
+        An iterable of every parsed squad name to include in the index.
+
+    Returns
+    -------
+    tuple
+        Returns a ``tuple`` of the ``list`` of indexed names, a ``list`` of the
+        number of trigrams in each name, and a ``dictionary`` where each key is
+        a trigram and each value is a ``list`` of the positions of the names
+        containing the trigram.
+    """
+    names = list(names)
+    sizes = []
+    index = {}
+    for position, name in enumerate(names):
+        trigrams = _trigrams(name)
+        sizes.append(len(trigrams))
+        for trigram in trigrams:
+            index.setdefault(trigram, []).append(position)
+    return names, sizes, index
+
+
+def _closest_squad_names(name, count=5, cutoff=0.6):
+    """
+    Find the squad names which most closely match the requested name.
+
+    Comparing the name against every known squad is slow, so the trigram
+    index is first used to find the squads sharing the most trigrams with the
+    name. Only those candidates are then ranked by their similarity to the
+    name, in the same way as ``difflib.get_close_matches``.
+
+    Parameters
+    ----------
+    name : string
+        A ``string`` of the parsed name to match.
+    count : int (optional)
+        An ``int`` of the maximum number of names to return.
+    cutoff : float (optional)
+        A ``float`` between 0 and 1 of the minimum similarity a squad name
+        must have to the requested name to be included.
+
+    Returns
+    -------
+    list
+        Returns a ``list`` of the closest squad names, ordered from the best
+        match to the worst.
+    """
+    global _squad_name_index
+
+    if _squad_name_index is None:
+        _squad_name_index = _build_squad_name_index(_squad_ids().keys())
+    names, sizes, index = _squad_name_index
+    trigrams = _trigrams(name)
+    shared = Counter()
+    for trigram in trigrams:
+        shared.update(index.get(trigram, []))
+    # Rank candidates by the Dice coefficient of their trigrams.
+    candidates = sorted(shared,
+                        key=lambda position: -2.0 * shared[position] /
+                        (len(trigrams) + sizes[position]))
+    matcher = SequenceMatcher()
+    matcher.set_seq2(name)
+    scores = []
+    for position in candidates[:CANDIDATE_LIMIT]:
+        matcher.set_seq1(names[position])
+        if matcher.real_quick_ratio() >= cutoff and \
+           matcher.quick_ratio() >= cutoff:
+            score = matcher.ratio()
+            if score >= cutoff:
+                scores.append((score, names[position]))
+    scores.sort(reverse=True)
+    return [match for _, match in scores[:count]]
+
+
 def lookup_squad_id(name, quiet=False):
     """
     Attempt to match a team name with a squad ID.
@@ -79,16 +418,16 @@ def lookup_squad_id(name, quiet=False):
         ``dictionary`` is returned with the key-value pairs for the top 5
         closest teams as keys and their respective IDs as values.
     """
+    squad_ids = _squad_ids()
     filtered_name = _parse_squad_name(name)
-    if filtered_name in SQUAD_IDS:
-        return SQUAD_IDS[filtered_name]
-    closest_matches = get_close_matches(filtered_name, SQUAD_IDS.keys(), 5)
+    if filtered_name in squad_ids:
+        return squad_ids[filtered_name]
+    closest_matches = _closest_squad_names(filtered_name)
     squad_match_ids = {}
     output = 'Exact match not found - Printing closest matches:\n'
-    print(closest_matches)
     for team in closest_matches:
-        output += team.title() + ' - ' + SQUAD_IDS[team] + '\n'
-        squad_match_ids[team.title()] = SQUAD_IDS[team]
+        output += team.title() + ' - ' + squad_ids[team] + '\n'
+        squad_match_ids[team.title()] = squad_ids[team]
     if not quiet:
         print(output)
     return squad_match_ids
@@ -117,7 +456,7 @@ def _lookup_team(team_id):
     string
         Returns a ``string`` of the squad's 8-digit ID.
     """
-    if team_id.lower() in SQUAD_IDS.values():
+    if _is_squad_id(team_id.lower()):
         return team_id.lower()
     name = lookup_squad_id(team_id)
     if type(name) == str:
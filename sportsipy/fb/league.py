@@ -0,0 +1,191 @@
+from .fb_utils import _league_squad_ids, release_squad_page
+from .team import Team
+from .. import utils
+from ..utils import pd
+
+
+class League:
+    """
+    Every squad competing in a single competition.
+
+    Finds all of the squads in the requested competition and creates an
+    instance of the Team class for each of them, along with the team's
+    Schedule and Roster. Each squad's page is only downloaded once and is
+    shared by its Team, Schedule and Roster, while several squads are pulled
+    at the same time to limit the total time spent waiting on downloads.
+
+    Parameters
+    ----------
+    league_id : string
+        A ``string`` of the competition's ID on fbref.com, such as '10728' for
+        the Premier League.
+    workers : int (optional)
+        An ``int`` of the maximum number of squads to pull at once.
+    """
+    def __init__(self, league_id, workers=utils.MAX_WORKERS):
+        self._league_id = str(league_id)
+        self._teams = []
+        self._schedules = {}
+        self._rosters = {}
+
+        squad_ids = _league_squad_ids(self._league_id)
+        if not squad_ids:
+            raise ValueError('No squads found for league ID "%s"' %
+                             self._league_id)
+        squads = utils._map_concurrently(self._pull_squad, squad_ids, workers)
+        for team, schedule, roster in squads:
+            self._teams.append(team)
+            self._schedules[team.squad_id] = schedule
+            self._rosters[team.squad_id] = roster
+
+    def __str__(self):
+        """
+        Return the string representation of the class.
+        """
+        teams = [f'{team.name} ({team.squad_id})'.strip()
+                 for team in self._teams]
+        return '\n'.join(teams)
+
+    def __repr__(self):
+        """
+        Return the string representation of the class.
+        """
+        return self.__str__()
+
+    def __getitem__(self, squad_id):
+        """
+        Return a specified squad.
+
+        Returns a squad's Team instance as requested by its 8-digit squad ID.
+
+        Parameters
+        ----------
+        squad_id : string
+            A ``string`` of the requested squad's 8-digit ID, such as
+            '361ca564' for Tottenham Hotspur.
+
+        Returns
+        -------
+        Team instance
+            If the requested squad can be found, its Team instance is
+            returned.
+
+        Raises
+        ------
+        ValueError
+            If the requested squad is not in the league.
+        """
+        for team in self._teams:
+            if team.squad_id == squad_id.lower():
+                return team
+        raise ValueError('Squad ID "%s" not found in league' % squad_id)
+
+    def __iter__(self):
+        """
+        Returns an iterator of the Team instances for every squad in the
+        league.
+        """
+        return iter(self._teams)
+
+    def __len__(self):
+        """
+        Returns the number of squads in the league.
+        """
+        return len(self._teams)
+
+    def _pull_squad(self, squad_id):
+        """
+        Pull the team, schedule and roster for a single squad.
+
+        The Team instance downloads the squad page which is then reused to
+        create the Schedule and Roster instances without requesting the page
+        again. The page is released once all three have been created.
+
+        Parameters
+        ----------
+        squad_id : string
+            A ``string`` of the squad's 8-digit ID.
+
+        Returns
+        -------
+        tuple
+            Returns a ``tuple`` of the squad's Team, Schedule and Roster
+            instances.
+        """
+        try:
+            team = Team(squad_id)
+            schedule = team.schedule
+            roster = team.roster
+        finally:
+            release_squad_page(squad_id)
+        return team, schedule, roster
+
+    @property
+    def league_id(self):
+        """
+        Returns a ``string`` of the competition's ID on fbref.com, such as
+        '10728' for the Premier League.
+        """
+        return self._league_id
+
+    @property
+    def teams(self):
+        """
+        Returns a ``list`` of the Team instances for every squad in the
+        league.
+        """
+        return self._teams
+
+    @property
+    def schedules(self):
+        """
+        Returns a ``dictionary`` where each key is a ``string`` of a squad's
+        8-digit ID and each value is the squad's Schedule instance.
+        """
+        return self._schedules
+
+    @property
+    def rosters(self):
+        """
+        Returns a ``dictionary`` where each key is a ``string`` of a squad's
+        8-digit ID and each value is the squad's Roster instance.
+        """
+        return self._rosters
+
+    @property
+    def dataframe(self):
+        """
+        Returns a pandas ``DataFrame`` containing the stats for every player
+        on every squad in the league, with an additional 'squad_id' column
+        identifying the player's squad. The index for the DataFrame is the
+        player ID. Returns None if no players could be found.
+        """
+        frames = []
+        for team in self._teams:
+            for player in self._rosters[team.squad_id]:
+                frame = player.dataframe
+                frame['squad_id'] = team.squad_id
+                frames.append(frame)
+        if not frames:
+            return None
+        return pd.concat(frames)
+
+    @property
+    def schedule_dataframe(self):
+        """
+        Returns a pandas ``DataFrame`` containing every game played by every
+        squad in the league, with an additional 'squad_id' column identifying
+        the squad the game belongs to. The index for the DataFrame is the
+        match report ID. Returns None if no games have been played.
+        """
+        frames = []
+        for team in self._teams:
+            for game in self._schedules[team.squad_id]:
+                frame = game.dataframe
+                if frame is None:
+                    continue
+                frame['squad_id'] = team.squad_id
+                frames.append(frame)
+        if not frames:
+            return None
+        return pd.concat(frames)
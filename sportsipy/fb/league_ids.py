@@ -1,1364 +1,6 @@
-LEAGUE_IDS = {
-    '8e8ff33e': '10077',
-    '9c4c0cc1': '10076',
-    'b7f03da0': '10922',
-    'ff7f69d8': '10088',
-    '193ff7aa': '10739',
-    '92aca032': '10924',
-    'f60413f7': '3153',
-    '9478ac3f': '10741',
-    '268a561a': '10080',
-    '18d3c3a3': '10743',
-    '8424bb18': '10765',
-    'aabd9798': '10923',
-    'a862ea1d': '10753',
-    '38e60d08': '3212',
-    'e297cd13': '10729',
-    '052449ee': '10081',
-    '66cc304a': '10062',
-    'ca460650': '10090',
-    '61fca1ee': '10923',
-    '277cdbe7': '10062',
-    'cbd9f3f6': '10766',
-    'dd694b37': '10079',
-    '2a8183b3': '10731',
-    'a549d6c6': '10744',
-    '7bbdea71': '10836',
-    'f7ac9c26': '10924',
-    '0e2ae537': '10075',
-    '1f2cc52a': '10062',
-    'b6e0c777': '10924',
-    '87389b8b': '10092',
-    '9feaeb2a': '10062',
-    'aed59852': '10753',
-    '27840bc2': '10062',
-    '9811e0ce': '10922',
-    '80b1ef30': '10741',
-    'ac36c181': '10760',
-    '9eb5fbc7': '10070',
-    '2864c5a0': '10759',
-    '2c45d10e': '3259',
-    '37363f62': '3284',
-    '5adc7e67': '5170',
-    '66da6009': '3211',
-    '38ec619e': '10075',
-    '48ab0f5f': '10093',
-    'c2948176': '10075',
-    '9ae196bd': '10754',
-    'e14f61a5': '10767',
-    'dcbc2e42': '10093',
-    '17859612': '10731',
-    '60aa17d7': '10082',
-    'c5703518': '10087',
-    'bf9fcad9': '10923',
-    '1be8d2e3': '10743',
-    'abdef23c': '10753',
-    '8a4abba3': '10081',
-    'a1979431': '10087',
-    'ccb036c4': '10092',
-    '9182296c': '10062',
-    '5c50c933': '10765',
-    'fbcd7d37': '3212',
-    'b1a7a7b9': '10086',
-    'c2f85bbb': '10070',
-    'eb752497': '10062',
-    '130f43fa': '10090',
-    'c30e88bc': '3236',
-    '83f55dbe': '10072',
-    'd7d06475': '10758',
-    '4deda092': '10749',
-    'a5c668fb': '10088',
-    '85c458aa': '10952',
-    '5c9e307a': '10070',
-    '81d817a3': '10090',
-    'fb80957a': '10092',
-    '8550eb99': '3236',
-    '69a0fb10': '10090',
-    'c734e22f': '10749',
-    '25f1fd26': '10750',
-    '7f59c601': '10729',
-    'f1eb9593': '10734',
-    'd6ca45c4': '10062',
-    'be3375e1': '3240',
-    'b76f6237': '10923',
-    '38bf50d2': '10064',
-    '0b7f9005': '10062',
-    '972e2539': '3266',
-    '54195385': '10761',
-    'b7e3e46e': '10735',
-    '3640715c': '10735',
-    'bd9dc140': '10762',
-    'e442aad0': '10952',
-    '8266975e': '2939',
-    '454cd859': '10923',
-    '59ff3f83': '10062',
-    '75fae011': '10729',
-    '69574c30': '10070',
-    'ddb51267': '10757',
-    'd976a235': '10952',
-    '39abd503': '2939',
-    'fb5a807f': '10085',
-    '646f985b': '10085',
-    'aa13fd54': '10062',
-    '35f1b818': '10090',
-    '98d49ef1': '9996',
-    '2a60ed82': '3240',
-    '46024eeb': '10090',
-    'ad63267c': '10071',
-    'c96d819b': '3284',
-    '87a920fa': '3211',
-    '80beba99': '10758',
-    '62657aa0': '10734',
-    'e59ddc76': '10733',
-    '534ac6d0': '10739',
-    'b435dbf5': '10733',
-    '4fffe901': '10753',
-    '64e81410': '10090',
-    '87c3235f': '10766',
-    '8867a809': '10080',
-    '1a4fb68c': '10088',
-    'feb66a71': '2939',
-    'c4e86b86': '10078',
-    'd60ff0db': '10062',
-    '6df8a6d5': '10085',
-    'e2fb1e72': '10092',
-    '5ae09109': '10761',
-    '44b79033': '10735',
-    'ab41cb90': '10090',
-    '5c7eb1c7': '9996',
-    'e0242ef1': '10766',
-    '3f5150ef': '10754',
-    'e2d73ee6': '10089',
-    '8bb8811f': '10758',
-    'ecf53eea': '10922',
-    'c63fddc1': '10062',
-    'f90efe28': '10062',
-    'e4108102': '10085',
-    'fb10988f': '10729',
-    'c99ff6e5': '10840',
-    '5049d576': '10074',
-    '1920cf18': '10742',
-    '9800b6a1': '10731',
-    '98973a5c': '10062',
-    'c4989550': '10834',
-    '51ec22be': '10832',
-    '990519b8': '10077',
-    'd9f93f02': '10745',
-    '8ed09812': '10092',
-    '10a76628': '10093',
-    '8cac5dfa': '10752',
-    'e4cd6f9a': '10084',
-    'd721b332': '10075',
-    '0e268336': '3290',
-    '81a74688': '10074',
-    '6466f662': '10076',
-    '786155b2': '10062',
-    '1e972a99': '10748',
-    '2818f8bc': '10737',
-    'ad2be733': '10796',
-    '06c1606c': '3211',
-    '3f4fe568': '10758',
-    '1cbf5f9e': '10732',
-    'e3ab73b4': '10922',
-    '415ce479': '10925',
-    '9db96189': '10757',
-    '09f00144': '10748',
-    '8cec06e1': '10728',
-    '2b29dfc4': '10075',
-    'f9e3296b': '3212',
-    'a73408a7': '10747',
-    'b075ba2a': '10076',
-    'fc629994': '10070',
-    '8e306dc6': '10952',
-    'c85cd2da': '10925',
-    'e5927bd8': '3211',
-    'd8b46897': '10090',
-    '7a54bb4f': '10761',
-    'd7e82505': '10753',
-    '6218ebd4': '10090',
-    '25cb27df': '10740',
-    '9892d3af': '3266',
-    '5f56a9a6': '10062',
-    'd11febf7': '10073',
-    '598bc722': '10737',
-    '0e92bf17': '5169',
-    '6dc6f493': '10062',
-    'b4461076': '10062',
-    '70c92f33': '10765',
-    '162ec40d': '10747',
-    '3fdc81dd': '10092',
-    '6236a52b': '10093',
-    '03ff5eeb': '10073',
-    'c1132314': '10080',
-    '9ea31445': '721',
-    'ce786972': '3236',
-    '7700eac9': '10754',
-    '4c319052': '10076',
-    '5b8cfb05': '10078',
-    '2a6178ac': '10976',
-    '09080694': '10924',
-    '98e8af82': '10735',
-    '60c6b05f': '10728',
-    '5d67715c': '10923',
-    '54864664': '10745',
-    'bc509855': '10088',
-    'd35ed67b': '10840',
-    '24c7f1a7': '10089',
-    '67cdee3a': '10076',
-    '9172ba36': '10733',
-    '456c5e63': '10924',
-    '6c15d7e1': '10734',
-    '25dbe099': '10762',
-    '74229020': '10761',
-    '1492ae0a': '10071',
-    'd9f72365': '10922',
-    '488c6ba1': '10766',
-    '66f38ee7': '10079',
-    '3af5df16': '10077',
-    'cdd0bbb6': '2435',
-    '2a0a0536': '10062',
-    '697fa142': '10757',
-    'd53c0b06': '10732',
-    'e89d5a28': '10749',
-    '4d987358': '10062',
-    '22df8478': '10729',
-    'e76a63dd': '10923',
-    '13dabbde': '10894',
-    '5cb328f2': '10745',
-    '16ebf136': '10750',
-    '3a3a612e': '10089',
-    '7c6f2c78': '10735',
-    '0e4527f3': '10757',
-    'e4babb95': '10752',
-    '8e55bf2c': '10892',
-    'ed392b02': '10074',
-    'd6e6321c': '10733',
-    '0bca3a9e': '10742',
-    'f25da7fb': '10731',
-    '016ace97': '10894',
-    '776909d3': '3266',
-    'aa20a5e5': '10923',
-    '529ba333': '10090',
-    '2eaa8331': '10759',
-    'b49d1b16': '10892',
-    '712c528f': '10072',
-    '890cfc60': '10741',
-    '483ffd93': '2371',
-    '8385b101': '10075',
-    '939201df': '10894',
-    '6082332e': '3153',
-    '1ebc1a5b': '10090',
-    'e982e0a9': '2433',
-    '293cb36b': '10729',
-    '7fcb6e83': '10073',
-    '4073db4f': '10071',
-    '7bc956f9': '10089',
-    '03d10d77': '10733',
-    'a42ddf2f': '10743',
-    '7a8db6d4': '10733',
-    '2f78fc78': '10752',
-    'ecd11ca2': '10740',
-    '1df6b87e': '10728',
-    '2898ec06': '3284',
-    '8dfb7350': '10732',
-    '01b96636': '10074',
-    'c241ee1a': '10745',
-    '3692fadf': '10088',
-    '47d0a8b1': '10062',
-    '6928de6d': '10922',
-    'a18a87d7': '10734',
-    'f5b64cb1': '10744',
-    '69d84c29': '10744',
-    '6569155a': '10923',
-    'dc56fe14': '10730',
-    '2dbba1ba': '10088',
-    'd01a653b': '5170',
-    'bb935adb': '10080',
-    'b037fc40': '10075',
-    'c4e01248': '10079',
-    '01f618d1': '10892',
-    '62f836ba': '10062',
-    'cdbccdc1': '10085',
-    'abe09747': '9995',
-    '80595417': '10836',
-    '7cf2360b': '3236',
-    '475b29b6': '10062',
-    'e00d111d': '3266',
-    '1ad3bd9b': '10062',
-    '6400d626': '10759',
-    'd6ffefd1': '10740',
-    'e2befd26': '10730',
-    '3458af25': '10747',
-    '02cd81bf': '10765',
-    '61d9850e': '10761',
-    '19dc476f': '10744',
-    '86842c45': '10074',
-    '3755f67e': '10922',
-    '3c4fb635': '10754',
-    'd07537b9': '10728',
-    '92a6e903': '10083',
-    '48e1a6dd': '2423',
-    'e2d8892c': '10732',
-    '9f6b44d4': '10080',
-    'e850256c': '10922',
-    'f0ae6677': '10082',
-    'a29db84b': '10083',
-    'c9d59c6c': '10743',
-    'ece66b78': '10072',
-    '18050b20': '10754',
-    '5bfb9659': '10728',
-    'df9a10a1': '10952',
-    'c6f65a93': '10076',
-    'ab358912': '10735',
-    '8a3f95b9': '10747',
-    'e5c4db74': '10085',
-    'f8a195cc': '10086',
-    '713d0672': '10754',
-    '9ec14616': '10087',
-    '49cf900f': '10062',
-    '5b499073': '10923',
-    '7701ed02': '10093',
-    '84bbaea6': '3266',
-    'b281fa3b': '10076',
-    'd344b030': '9996',
-    '32f8bc7d': '10922',
-    '1b8dd8e3': '10088',
-    'c889f292': '10078',
-    '563b8846': '10089',
-    'e77513f5': '10087',
-    'a5298e9f': '10750',
-    'a4302376': '3212',
-    '48d29768': '9995',
-    'd1f6a4fe': '10085',
-    'aac46d36': '10079',
-    '094c5701': '10765',
-    '2f5578dd': '3259',
-    '151d706e': '10760',
-    '8edf8646': '10062',
-    'd2dc922e': '10073',
-    '4aee1804': '10753',
-    '22c72f0b': '10922',
-    'bf882670': '3284',
-    '463e4c8f': '10062',
-    '69dee2b0': '10836',
-    '33e6936d': '10080',
-    '12062e3e': '10922',
-    '65ea0ebf': '10075',
-    '8f401f0f': '10062',
-    '5d274ee4': '10743',
-    '22327064': '10734',
-    'ee94b722': '10093',
-    '62da6f23': '10894',
-    '21499441': '10922',
-    'ecb862be': '10765',
-    '2af58c3d': '3236',
-    '24d3177f': '10062',
-    'd42d8b2f': '10840',
-    '962bc612': '3236',
-    '2b41acb5': '10070',
-    'bb1044a9': '10749',
-    'e3719fe4': '10834',
-    '5ed30186': '10080',
-    'eb4b278c': '10760',
-    '541a280b': '10742',
-    'a0435291': '10731',
-    'e9ea41b2': '10090',
-    '3074d7b1': '10730',
-    '9c3c38e4': '10077',
-    'c63dd2d5': '10758',
-    '37a68655': '10923',
-    '3f8c4b5f': '10761',
-    '2d84bb17': '3211',
-    'd6bfd124': '3266',
-    '2a428619': '10739',
-    'c187b7ab': '10064',
-    '8cf14206': '10083',
-    '43d17b20': '10761',
-    '4372a20b': '10081',
-    'f6d47c93': '10740',
-    '9a1cbee5': '9996',
-    '47c64c55': '10728',
-    'c16e44ce': '10748',
-    '707b3614': '10892',
-    '4a2ec81c': '10765',
-    '9551340f': '8947',
-    'ffc21552': '10062',
-    '51e48db2': '10733',
-    'a1711190': '10062',
-    '769d9b07': '3266',
-    'fdaa51b4': '3254',
-    '34e7850d': '8947',
-    '5d36c8f0': '10747',
-    '6b849eeb': '3259',
-    'f052bc76': '10074',
-    '238b245d': '9995',
-    '6f7e1f03': '10072',
-    '372caef1': '9996',
-    '011c18c5': '10742',
-    'c12c3ccf': '10753',
-    '0cc34cf4': '10832',
-    '79cadc09': '10925',
-    '40bb0ce9': '5170',
-    '0b55fe1b': '10922',
-    '93d5086f': '10838',
-    '5522dff5': '10766',
-    '489de62a': '10078',
-    '0cd8eef2': '10734',
-    '1be8cdcb': '10089',
-    'd9097887': '10765',
-    '0ade1cd8': '10062',
-    '2f335e17': '10072',
-    '098a7982': '3259',
-    '3f2d6531': '10093',
-    'df734df9': '3211',
-    '8ed04be8': '10070',
-    'bd8769d1': '10733',
-    'd680d257': '10072',
-    'acad13f6': '10062',
-    '05791fbc': '10734',
-    'd76b7bed': '10733',
-    '3d377a8c': '2939',
-    '41d91186': '10922',
-    '81d83299': '10923',
-    'd21391f1': '10062',
-    'bcb0c370': '10757',
-    'd076914e': '10090',
-    '1e3f180f': '10753',
-    '51f44221': '10757',
-    'cd051869': '10729',
-    '7c5f1859': '10062',
-    '37232aec': '10082',
-    '0c1c166a': '10062',
-    '605aca82': '3212',
-    '4d0b6235': '10073',
-    '1f33fbc7': '10740',
-    'd48ad4ff': '10730',
-    '27b20cea': '10749',
-    'a757999c': '10729',
-    'a2d435b3': '10728',
-    'e233bdc0': '10062',
-    '4ba7cbea': '10729',
-    '2aa12281': '10735',
-    'fc536746': '10731',
-    '9f1a0d0f': '3236',
-    'a33a1d8d': '10079',
-    'dd289621': '10750',
-    '05aff519': '10073',
-    'f49c0f7a': '10762',
-    '943aa94a': '10062',
-    'fe686760': '10892',
-    '108607cf': '10752',
-    'c9607f44': '10741',
-    '1740a29b': '10761',
-    '7d8a4e62': '10092',
-    '7fdd64e0': '10732',
-    'cab13f30': '10752',
-    '45a67fe8': '10923',
-    'd6a369a2': '10733',
-    '57d14db5': '10762',
-    'f3522e08': '10062',
-    '9c87251a': '10765',
-    'c6ce4b54': '3236',
-    'c67deffd': '10062',
-    '979102f4': '10084',
-    '422bb734': '10072',
-    '77021edb': '10062',
-    'ad326e5f': '3266',
-    '5ac76942': '10740',
-    '1d0836d6': '10086',
-    '4a2c27a3': '10741',
-    'd5ae3703': '10072',
-    '7adbf480': '10832',
-    '1b719877': '10062',
-    '2d935efe': '10062',
-    'b2a8da6b': '10923',
-    '76ffc013': '10733',
-    '26d18deb': '10062',
-    '86431469': '10092',
-    'c7a9f859': '10737',
-    'ceda2145': '3211',
-    '02d8c2aa': '3236',
-    '9522e7b4': '10838',
-    'd6dbeb95': '10062',
-    '25622401': '10761',
-    '8acf845e': '10062',
-    '30c24d2d': '10925',
-    '8b9bf22a': '10733',
-    'd9676424': '10761',
-    'd921c99f': '10753',
-    'bd8a11ee': '10064',
-    '70766eab': '10070',
-    '8783f4ee': '10070',
-    'ab17f2e9': '10073',
-    'd669ece9': '10075',
-    'c0dcc2ac': '10071',
-    '4d4fc0b8': '10084',
-    'b74092de': '10733',
-    'ed54a8b3': '10924',
-    'bcdc5828': '10093',
-    'e6b8138d': '10085',
-    'bae3112e': '10080',
-    '865839d8': '10076',
-    'bb9efd50': '10735',
-    'bd03cdde': '10079',
-    'ad2649a5': '10747',
-    '7e746554': '10754',
-    '7c327694': '10062',
-    '07bb3d02': '10062',
-    '03e29091': '10922',
-    'f7d86a43': '10090',
-    '5625a7da': '10742',
-    'e0b973a6': '10076',
-    'd69d0df7': '10760',
-    '2ff539f3': '10074',
-    '8de86c22': '10925',
-    '9b9a8c22': '10076',
-    '140e320a': '10748',
-    '28147f65': '10892',
-    '70f446ce': '10923',
-    'f622e63c': '10740',
-    '1b2fb5e6': '10062',
-    'b363e21f': '10079',
-    '4f4b03ee': '10922',
-    '13cb8449': '10734',
-    'fa263bb1': '10765',
-    'f46a80fc': '10076',
-    'f205258a': '10073',
-    'd8be8b3e': '10894',
-    'cb45d9cb': '3266',
-    '41247cac': '10062',
-    'b81aa4fa': '10750',
-    '740be0b0': '10073',
-    '4fbfc68e': '10062',
-    'a4a1c462': '10922',
-    'b17b8146': '10734',
-    'e39cf61a': '3259',
-    '9b54c4af': '10088',
-    'cd5d7aa6': '3244',
-    '3ce4e72c': '10745',
-    'a8290768': '3236',
-    '87705c62': '10832',
-    '76d8bafa': '3240',
-    'c4260e09': '10730',
-    '9c584cf2': '10079',
-    '5a8dc328': '10742',
-    '6514b7f2': '9996',
-    'b88463bd': '10740',
-    '12192a4c': '10745',
-    '72804f2b': '10757',
-    '4a0ff629': '10062',
-    '3ded797c': '10079',
-    'b9ca1839': '10085',
-    '724d8770': '8947',
-    '874efae9': '2939',
-    '651b3d20': '10923',
-    '6d139ec5': '10757',
-    '84d9701c': '10072',
-    '3249478a': '9995',
-    '40339a93': '10077',
-    'd3675a62': '10062',
-    'e8e4577c': '10834',
-    '06d05f19': '10840',
-    'b1b46fc3': '10759',
-    '4f7b798d': '10747',
-    '5e0cc307': '10062',
-    '8c71aef1': '10077',
-    '0e6891d5': '3211',
-    '3693fee3': '10923',
-    '5d020380': '10834',
-    '6c3c25bd': '10084',
-    'e4502862': '10744',
-    '6f6ee141': '2939',
-    '90773bc8': '10924',
-    'db2b616c': '10752',
-    'd423a378': '10759',
-    'c40d810e': '10074',
-    '099c6eb5': '10757',
-    'cddd0f18': '10062',
-    '99f258c2': '10749',
-    '45f87065': '10753',
-    '77193015': '10748',
-    '024b201d': '10076',
-    '9fc3b195': '3259',
-    '814a41b5': '3284',
-    '4db00b00': '3236',
-    '78c617cc': '10072',
-    'ceeb5465': '10062',
-    '797d38d2': '10749',
-    '076128d7': '10740',
-    '33c6b26e': '10748',
-    'e442fa76': '10744',
-    '6e1d6d95': '10064',
-    'e8d2adc4': '10748',
-    'ba68a0c5': '10760',
-    'f1e61de0': '3284',
-    '5379325a': '10757',
-    'bec05adb': '10739',
-    'd081b697': '10073',
-    '1d2fe027': '10736',
-    '6df34a06': '10923',
-    '9bf4eaf4': '3211',
-    '763b322d': '10080',
-    '0d49cda3': '10062',
-    'd7b02abb': '10838',
-    'e69cb5b6': '10071',
-    '5b3adc57': '3284',
-    '1c781004': '10729',
-    '3b27de1f': '3236',
-    'd1903ffe': '10092',
-    'e31d1cd9': '10731',
-    'b5effd9e': '10073',
-    'd2bc69d1': '10924',
-    'f98f6335': '10766',
-    '3148d79f': '10734',
-    'd9dd39c9': '10923',
-    '91aa83f9': '10092',
-    'fd6114db': '10732',
-    'bdfa5bda': '10062',
-    'd2f21b23': '10747',
-    '48dd5b1b': '3244',
-    'a4988f5e': '10923',
-    '84985282': '10089',
-    '6b355862': '10062',
-    'bc357bf7': '10737',
-    '2abfe087': '10729',
-    'fcf5b1e1': '10733',
-    'b0333581': '10086',
-    '05111478': '10923',
-    '7978e9a3': '10922',
-    '38988e1a': '10765',
-    '66db845c': '10077',
-    '33382a12': '10062',
-    '0341388b': '5170',
-    'b1278397': '10745',
-    '9e7203c6': '10062',
-    '5d0bc197': '10062',
-    'c2e6b53b': '10748',
-    'd4c130bc': '10952',
-    'dee3bbc8': '3240',
-    '2091c619': '10072',
-    '31f1bcca': '10735',
-    'b58231eb': '10922',
-    'cf74a709': '10730',
-    '15f49df1': '2939',
-    '426658a6': '10758',
-    '43e28cc5': '10092',
-    'abdce579': '10072',
-    'd60423ef': '10742',
-    '7cbf5cb4': '10733',
-    '0d885416': '10090',
-    '366f89ff': '9996',
-    'ee7c297c': '10731',
-    '924759ab': '2897',
-    'da8d9837': '10062',
-    '6dd8415f': '10093',
-    '8c635914': '10742',
-    'ab75e049': '10754',
-    'bea5c710': '10731',
-    '6dc9bfb4': '10086',
-    'ec7fdeb7': '10742',
-    'ae306ede': '10081',
-    'e155ce69': '10062',
-    '1a921e1f': '10079',
-    '6fc21c65': '10741',
-    'f8106fc0': '3259',
-    'c1d9f388': '10074',
-    'd1b5a1e1': '3284',
-    '8012940b': '10062',
-    '0f9294bd': '10740',
-    '89ff5424': '10062',
-    '7be91482': '3266',
-    '577e2606': '10086',
-    '9cc24b7e': '3266',
-    'be35aa4d': '10840',
-    'ad0e69a2': '10924',
-    'b404f71e': '10892',
-    '6045b728': '10076',
-    'a9a75e6a': '10062',
-    '7cc68edf': '10922',
-    '277c7160': '10075',
-    '50e620c4': '10923',
-    '3ac615e7': '10062',
-    '2524d69a': '10088',
-    'd10036ca': '10089',
-    '2c9bebcd': '10765',
-    'fa11a9cc': '10742',
-    '9ec5e2c9': '10735',
-    '1eebf7c3': '10753',
-    'ee0bccc5': '10758',
-    'a5e92def': '10087',
-    'c94d9135': '10062',
-    'dd6945f1': '9995',
-    '386c1777': '10757',
-    'fd7dad55': '10743',
-    '5b9f913c': '10064',
-    '9d33239e': '3290',
-    '4fcc2996': '10836',
-    '05c86972': '10081',
-    '13b57ed6': '10074',
-    '19538871': '10728',
-    'a8661628': '10735',
-    '86b7acd2': '10750',
-    '734efbe5': '10083',
-    '99a46175': '10077',
-    '282655b3': '3290',
-    '51e5a603': '10748',
-    '7624981f': '10062',
-    '352504c0': '10084',
-    '25aa43e7': '10062',
-    'acee7b53': '10082',
-    'b09787c5': '10733',
-    '0f8ef17f': '10093',
-    '38c56c1f': '9995',
-    '7f608a0a': '10062',
-    '4dcf77da': '10759',
-    '69236f98': '10732',
-    'a8ad42f7': '2423',
-    '6f2c108c': '10745',
-    'd1eee0c9': '10765',
-    'c63f6c0c': '10740',
-    'becc1dd0': '10832',
-    '8724a375': '10923',
-    '4472d406': '10753',
-    '59d62656': '10062',
-    '5af9af80': '10922',
-    '57ea79cd': '10760',
-    '98cc9e1b': '3284',
-    'ff280e9e': '10070',
-    '73a27a73': '10760',
-    'c96d05af': '10062',
-    '234afecc': '2435',
-    '57b6cfb8': '10767',
-    '26ebba72': '10089',
-    'e3c537a1': '10729',
-    'e813709a': '10952',
-    '8b4cbfb9': '2939',
-    '1ae5d154': '9995',
-    'ffbaa3d2': '10735',
-    '0beae1a9': '10085',
-    '226ca873': '10079',
-    '60d44c62': '3236',
-    '259d3345': '10761',
-    '5c2737db': '10761',
-    '3568ad4c': '10750',
-    'd2d3631c': '10062',
-    '81476932': '10089',
-    'd4c6c2dc': '10062',
-    '4cefb8c7': '10734',
-    '950a95f2': '3211',
-    '0217e4d8': '10748',
-    '2002cccc': '10062',
-    '91df880d': '10925',
-    'b3072e00': '10732',
-    'cb8b86a2': '10090',
-    '73905dde': '8947',
-    'f6d9c820': '10758',
-    '11b6dba8': '5170',
-    '149a2f71': '10062',
-    '6e7c9b0b': '10747',
-    '6cf72eb0': '10752',
-    '4d6fce81': '10924',
-    'eab4234c': '10730',
-    '9babc1f9': '10070',
-    '3196586b': '10062',
-    'eb7e5ea0': '10735',
-    '014e7411': '10062',
-    'c380c86e': '10749',
-    'a0a57b76': '10092',
-    '36d353db': '10757',
-    'f9940243': '10090',
-    'def379c5': '10074',
-    '81e923a1': '10894',
-    '209d7fa2': '10739',
-    'ca6492f2': '10083',
-    '912e4c40': '10758',
-    '0c2512a2': '10085',
-    '29bff345': '10743',
-    '6e6b8b3f': '10087',
-    'aca0450a': '10734',
-    'd6611ea0': '10767',
-    'c4481dff': '10062',
-    'a26209d7': '10070',
-    '658bf2de': '10730',
-    'a4500116': '10747',
-    '1334a86c': '10088',
-    'dde3e804': '10757',
-    'd298ef2c': '10732',
-    '142886c3': '9995',
-    'c1f8ae36': '10077',
-    '7c76bc53': '10743',
-    'd84fbee9': '10923',
-    'fdba14df': '10747',
-    '8e1ea572': '10070',
-    'bba7d733': '10729',
-    'fad74de7': '10062',
-    '411b1108': '10834',
-    '97d80fef': '3284',
-    'f61e60c9': '10766',
-    '6f0be699': '9995',
-    '89d54d32': '9996',
-    '1c8804ab': '10088',
-    'e3db180b': '10739',
-    'a5b8480c': '10082',
-    '3b46215f': '10062',
-    'f3a5726c': '10741',
-    'bc31a6e4': '10760',
-    'ec463dd1': '10087',
-    'bdc20e84': '10071',
-    '910380a5': '3284',
-    '0ce4436d': '10073',
-    'f0ac8ee6': '10737',
-    '033ea6b8': '10737',
-    '361ca564': '10728',
-    'c76c8c7d': '10070',
-    '48ac1e43': '10071',
-    '9f44dae3': '2939',
-    'e986ece7': '10750',
-    'e04b1b89': '10838',
-    'c582b57f': '10747',
-    'e4a775cb': '10729',
-    '4573a712': '10838',
-    '3772159d': '3284',
-    'f0e6fb14': '10073',
-    '41c139b6': '5170',
-    '7c4744f7': '10734',
-    '3a980b79': '10084',
-    '7637881d': '10740',
-    '291257b3': '10892',
-    'a2fa3506': '3153',
-    '50e85bfc': '10086',
-    'f812e711': '10079',
-    '404b88be': '10064',
-    '19926992': '10062',
-    '71a3700b': '10894',
-    '5e876ee6': '10744',
-    'fc22273c': '10090',
-    '967b10be': '10079',
-    '84902199': '10080',
-    'e5b472a1': '10062',
-    'c1b0f61b': '10744',
-    '9133b975': '10760',
-    '42cc5a38': '10092',
-    '701c353a': '3284',
-    '12d53956': '10753',
-    '23ced855': '10922',
-    '41c6978d': '10765',
-    '92adb2d6': '10071',
-    '7f2012ad': '10836',
-    '3d2f4487': '10093',
-    '8ab37ab8': '10075',
-    '44e34781': '10062',
-    'f0479d7b': '10739',
-    '6640d390': '10062',
-    '2ec629d8': '10062',
-    'b162ebe7': '10073',
-    '42b37a13': '10749',
-    '8efa4cdf': '10734',
-    '6f98eba9': '10767',
-    '8057504e': '10083',
-    '2a099e55': '10083',
-    '3084b150': '10062',
-    '13ecb521': '10922',
-    'a77c513e': '10744',
-    'd7e6c419': '10084',
-    '09921eac': '3290',
-    '9d04848a': '10750',
-    '7c81865f': '10740',
-    '6a9477ca': '3236',
-    '632f1838': '10743',
-    'a58173b2': '10071',
-    '55002f83': '10062',
-    'ee742bf0': '10081',
-    'd8deaf72': '2939',
-    '4577342f': '3290',
-    'a63dd24b': '10922',
-    'd854372e': '10080',
-    'de550500': '10832',
-    'ee73b6b7': '10089',
-    'f780fd06': '10748',
-    '7ef53dcf': '3236',
-    '95f8ef61': '10092',
-    'f2b23808': '3212',
-    'b4de690d': '10832',
-    'fff2fd6b': '10925',
-    '0c72364a': '10062',
-    'e474ed57': '10062',
-    '68bf70d1': '10062',
-    'e927ded0': '10062',
-    '6dcdb7f5': '10093',
-    'c123d3e2': '10062',
-    '257195fa': '10742',
-    'eea856da': '10744',
-    '2fbdf057': '10760',
-    '740cb7d4': '10070',
-    '17366e53': '10088',
-    'f1e6c5f1': '10748',
-    'b9cd3c9a': '10761',
-    '1d3d37ae': '5170',
-    'd5d8ceaf': '10765',
-    'aa3eb1d3': '3259',
-    '28dabcec': '10092',
-    'e0b3aa47': '10747',
-    '5c9eb756': '10744',
-    'd692d73b': '10062',
-    'd9e1bd51': '10743',
-    'af8be55a': '10076',
-    '8818240f': '10080',
-    '132ebc33': '10732',
-    '0049d422': '10735',
-    '90537983': '10922',
-    '6dcc14bf': '10071',
-    'c1e93cb7': '10081',
-    '9aa97c75': '3211',
-    '33ba9d7b': '10745',
-    '6eda181d': '10922',
-    '11be4c0a': '3266',
-    'c6c493e6': '10731',
-    'a8535c0e': '10093',
-    'b42c6323': '10745',
-    'deda22cf': '10753',
-    'fb4ca611': '10739',
-    'fb08dbb3': '10732',
-    'eccc5069': '10062',
-    '375d66f1': '10729',
-    '4fea542b': '10078',
-    '3a7a27c6': '10766',
-    '79c65a57': '10081',
-    'cd6bc444': '10062',
-    'b2b47a98': '10728',
-    '633fbb6e': '10062',
-    '21daff91': '10080',
-    '8c78c63b': '10062',
-    '3986b791': '10739',
-    '28d9b675': '10836',
-    '43c2583e': '10729',
-    '2b9f86b0': '10734',
-    '263c3bad': '10922',
-    '4b682260': '10759',
-    '29f5eff9': '10062',
-    '01ef4cf1': '10922',
-    '231a3620': '2939',
-    'dc1dd993': '10062',
-    '21bf1e40': '10080',
-    '26ab47ee': '10729',
-    '639950ae': '10072',
-    '8a314045': '10087',
-    '477991c5': '10062',
-    'e570aeff': '3266',
-    'e2bede9e': '10922',
-    'd6eb477c': '10074',
-    '264fce29': '10084',
-    '4cc7a87b': '10740',
-    '5f01284a': '10733',
-    '157b7fee': '10072',
-    '6ca73159': '10734',
-    'e17dbcf6': '10892',
-    '4df07e8f': '10062',
-    'd90d4f6c': '2919',
-    '2d860997': '10925',
-    '768fae36': '2939',
-    '73fd2313': '10743',
-    '6b62b007': '10749',
-    'dd87c217': '10092',
-    '95b895fe': '10748',
-    '6a5ea615': '10062',
-    'd255322a': '10062',
-    'bba63bc9': '10081',
-    'c0cc20c3': '10077',
-    '87f2fc2b': '10078',
-    'a1393014': '10832',
-    '415b4465': '10090',
-    '2151f19e': '10062',
-    'ce4c058d': '10922',
-    'bb14adb3': '10739',
-    '7848bd64': '10731',
-    '3b922c89': '10092',
-    '3264f876': '10742',
-    '5835aae0': '3259',
-    '2e91bf26': '3236',
-    'bf41d73a': '3236',
-    '8279cc83': '10062',
-    'f516c444': '10923',
-    '448d7865': '10092',
-    'c2153ae4': '10082',
-    '4463fecb': '3290',
-    'cb89181d': '10754',
-    'bff39cf5': '10740',
-    '01f5194d': '10077',
-    'edd0d381': '10762',
-    '50f2a074': '10758',
-    'd4a88ef6': '10074',
-    '40aa7280': '10761',
-    '7880a87b': '10923',
-    'd20821dd': '10758',
-    '93e94415': '10760',
-    'ea339fbc': '10083',
-    '80328a1e': '10748',
-    '752db496': '10743',
-    '8ef52968': '10733',
-    '17892952': '10729',
-    'c07cf5b5': '2939',
-    'f98930d1': '10072',
-    'bf0a4852': '10062',
-    '6ed99f94': '10922',
-    'e44db2c6': '10752',
-    '928d3821': '3266',
-    '36acd614': '10062',
-    'cbde2682': '10766',
-    '3c6b5320': '10761',
-    'e33d6108': '10070',
-    'c70d9476': '3284',
-    '17f5e100': '10062',
-    '9ce68f8a': '10834',
-    'a55b20b2': '10923',
-    'c880e925': '10922',
-    '6c254a38': '10923',
-    'e334d850': '10739',
-    '2fdb4aef': '10741',
-    '67256fb4': '10062',
-    '9e85547f': '3236',
-    '0cdc4311': '10737',
-    '9dcf2f81': '10062',
-    '20f2ebda': '3290',
-    'c458eb43': '10088',
-    '098f39a8': '10080',
-    '5b4413b6': '10925',
-    '01ed6ca7': '10092',
-    '4e29993c': '10085',
-    '105360fe': '10730',
-    '146a68ce': '10739',
-    '03c57e2b': '10731',
-    'e615d0fe': '10089',
-    'c0d3eab4': '10732',
-    '87ffd947': '10085',
-    '9ae9b58c': '10089',
-    '432f2430': '10760',
-    '44b88a4e': '10743',
-    'a338349f': '10752',
-    'd7319d80': '10078',
-    'e87167c6': '10089',
-    '32d508ca': '10072',
-    '2923cad2': '10062',
-    'e090f40b': '10729',
-    '2b390eca': '10731',
-    '2a49d3f3': '10092',
-    'dd9eb64c': '10062',
-    '822b124d': '10092',
-    'd2c87802': '10732',
-    '0d978394': '10922',
-    '7455853d': '10740',
-    'e5e323aa': '10092',
-    '40624544': '10062',
-    '9f29d583': '3259',
-    '815ac9e3': '10062',
-    'dd5ca9bd': '10743',
-    '95f42e44': '3259',
-    '15cf8f40': '10090',
-    'c1c51bdf': '10083',
-    '3b2880c1': '10092',
-    '121dcdda': '10062',
-    'baa296ad': '10073',
-    'edddfa63': '10741',
-    '42e847bc': '10757',
-    'b72bc283': '10840',
-    'dfaecdda': '10757',
-    '131bc303': '10760',
-    'd7ba2e36': '10085',
-    '654f3ca6': '10733',
-    '4e32ce87': '10923',
-    'f6c2b357': '10086',
-    'bd08295c': '10739',
-    'c1638861': '10092',
-    'dc728978': '10084',
-    '41916f68': '10834',
-    '69eacba4': '10757',
-    '6d14c1f7': '10922',
-    'e5b6b0c1': '10761',
-    'dc06109e': '10088',
-    '22460fcd': '10093',
-    '8cef69d2': '10062',
-    '0e57c34a': '10075',
-    'fac75dc4': '10079',
-    'f56127be': '10924',
-    'f70f4c6e': '10092',
-    'b2a0ca5d': '10757',
-    '4c2b6cd7': '10745',
-    '41736050': '10092',
-    'b8a68959': '3284',
-    'd884c383': '10741',
-    'e5ce7354': '10080',
-    'fdb457fa': '10062',
-    'f722bd04': '10758',
-    '3cc399a5': '10073',
-    'ff04e205': '10753',
-    '40d8842e': '10071',
-    'bbfd364f': '10760',
-    '5f0284ea': '10922',
-    '8e20e13d': '5169',
-    '52d65cea': '10834',
-    '8d727f54': '10071',
-    'fb8c42a7': '10074',
-    '6baef27f': '3266',
-    'e3816a4b': '10074',
-    '7a41008f': '10737',
-    '33f95fe0': '10073',
-    '21680aa4': '10736',
-    '5f778322': '10752',
-    '8aa1135c': '10742',
-    '70068101': '10076',
-    'b9288690': '10062',
-    'ffc8a1d6': '10076',
-    '3b7d96a4': '10092',
-    '08610664': '10760',
-    'e78963ab': '10070',
-    'e41e516f': '10924',
-    '5903e501': '3153',
-    '1e2ef6be': '10062',
-    'a6a4e67d': '10834',
-    '19c3f8c4': '10739',
-    '90eb0dcc': '10082',
-    '613577b8': '10840',
-    '9ae758c2': '3298',
-    '1d8099f8': '10730',
-    '986a26c1': '10733',
-    '5f618561': '10922',
-    '5700c020': '10740',
-    '5809ddc3': '10748',
-    'e03e5172': '10081',
-    'a7854d10': '10076',
-    '67645960': '3259',
-    '6a6967fc': '10745',
-    '16b2606a': '10076',
-    'ea115eb3': '10762',
-    '445d3104': '10734',
-    'a70e4fff': '10062',
-    '257cf097': '10084',
-    'acbb6a5b': '10737',
-    'd06bc460': '10754',
-    '50eaaf29': '10923',
-    '7a798c4b': '10762',
-    '00032902': '3290',
-    'a036ca44': '10922',
-    '005a8517': '2939',
-    '1a1aef59': '10092',
-    '1c896955': '10735',
-    'e172e84f': '10080',
-    'e9d60d0c': '10086',
-    '34078b64': '10753',
-    '42dff5fb': '10075',
-    'f13a527f': '10733',
-    '8d6fd021': '10731',
-    '03d0f9c5': '10089',
-    '27e981a3': '10748',
-    '563b1491': '10062',
-    'ac9a09b4': '3211',
-    'f5922ca5': '10729',
-    'f83960ae': '10732',
-    'fa2752bc': '10834',
-    'a8481ab9': '10088',
-    'b54d31b3': '10836',
-    'dad7970b': '3236',
-    '278db974': '10757',
-    'ecb276d9': '10062',
-    'd4f8af71': '10085',
-    'fccf2756': '10074',
-    '1850e3f9': '10754',
-    'a2c7af20': '10093',
-    '98ce363d': '10742',
-    '224b0274': '10742',
-    'c7038b7d': '10923',
-    '82754ed5': '10092',
-    'cdaf4e6d': '10759',
-    '16fa293c': '10080',
-    '85c3a70f': '10074',
-    '5dbb5542': '10092',
-    '97fb83f1': '10062',
-    '32ae5aa8': '10062',
-    'b964e6bb': '10894',
-    '01888db1': '10739',
-    '89f584e1': '10087',
-    'a224b06a': '10737',
-    'a4570206': '5169',
-    'd5348c80': '10741',
-    '257fad2b': '10952',
-    '20c344f6': '10062',
-    '6724656e': '10745',
-    'adf57493': '10085',
-    '120cfbbd': '10734',
-    '4faa6f09': '10762',
-    '34640cc6': '10923',
-    'c48512d3': '10075',
-    '33c895d4': '10728',
-    'c4fae78d': '10062',
-    '3e358749': '3259',
-    '67909e74': '10925',
-    '827a03db': '10760',
-    'bf4acd28': '10072',
-    '97171221': '3220',
-    'e7f2df64': '10922',
-    '66906381': '10766',
-    '45b403c3': '10070',
-    'ae1e2d7d': '10740',
-    '6d0be563': '10092',
-    'ee5932d2': '10071',
-    '2d783ae1': '10078',
-    '8f8b1984': '9996',
-    'fc4bf6b5': '10922',
-    '0587babf': '10092',
-    '47538775': '10076',
-    'deac08c7': '10062',
-    'ecd34b98': '10748',
-    '9f3f1c88': '10093',
-    '60e145ad': '10754',
-    '195546c7': '10062',
-    '3351802f': '10062',
-    'e88fc6e5': '10761',
-    '946f0eef': '10062',
-    'f18001a3': '10080',
-    'ef4d93b3': '10079',
-    '09ec62b7': '3284',
-    '74780d66': '10086',
-    'db9f975e': '10062',
-    'dcc91a7b': '10731',
-    '6777e16d': '10762',
-    '44117292': '10090',
-    'db891982': '9996',
-    'cb188c0c': '10732',
-    '9eef2995': '10735',
-    '18d9d2a7': '10745',
-    '689bb876': '10062',
-    'f3cd3a26': '10070',
-    'ecb514d5': '10062',
-    '946a30cb': '10749',
-    'f0c0c2c2': '10742',
-    '53a2f082': '10731',
-    '7c2d1adb': '10088',
-    '90e07850': '10093',
-    '15c4c0d2': '10922',
-    'e18a73da': '10760',
-    'f73b15cf': '10923',
-    'd51bc6dd': '193',
-    '9130bd3b': '10761',
-    '3dc1ffe5': '10062',
-    'add600ae': '10737',
-    '802d1b47': '10734',
-    'dd320a9c': '3236',
-    '47b3e736': '10082',
-    '045c971f': '10735',
-    '81134e0b': '3212',
-    '72f9f06e': '10076',
-    '22a5a99c': '10759',
-    '3f319bc9': '10744',
-    '2a38baa5': '9996',
-    'c3352ce7': '10743',
-    'c2ccd8f5': '10082',
-    '3df0eb96': '10062',
-    'c539e393': '10737',
-    '4a04a02b': '10734',
-    'ce50e2f4': '10922',
-    'fd4e0f7d': '10732',
-    '9f13771c': '10086',
-    'd41b5f53': '10761',
-    '0a14831e': '10077',
-    'c650f805': '10092',
-    '6f4d0e0b': '10062',
-    '507b611f': '10092',
-    'f4bbcd04': '10082',
-    'c659a2f9': '3259',
-    'd7a486cd': '10732',
-    '5f232eb1': '10072',
-    '421387cf': '10730',
-    'ab7b2fe7': '10766',
-    '1b295b25': '10733',
-    '9269a831': '10757',
-    '0230c3aa': '3259',
-    '943e8050': '10728',
-    '071dd6bd': '10924',
-    '604617a2': '10733',
-    'df6f068b': '10922',
-    'ae107695': '10084',
-    '37b7e9e2': '10744',
-    'c4223ca7': '10075',
-    '1837b9f6': '10075',
-    '2de656d5': '10744',
-    '99ea75a6': '10090',
-    'd943111d': '10922',
-    'd9fdd9d9': '10072',
-    '97f67652': '10062',
-    'b35f18af': '10766',
-    'e2948349': '10079',
-    '247c4b67': '10737',
-    '3149e189': '10734',
-    '1f68d780': '10073',
-    'c0cb86fe': '10922',
-    '32a1480e': '10733',
-    'aed4d20f': '10079',
-    'e4563d62': '3290',
-    'fd962109': '10728',
-    '3c94e2df': '2939',
-    'e58fd7d6': '10084',
-    '4acb0537': '10090',
-    'e2f6ddd0': '10062',
-    '8bbab7cf': '10750',
-    'f463d7c8': '10062',
-    '5282d1ee': '10062',
-    '41da1cf3': '10734',
-    '8602292d': '10728',
-    'e0279c6f': '10760',
-    'f6af6f6f': '10744',
-    'c8ad3091': '10740',
-    '60b5e41f': '10745',
-    '3e3fbf36': '10074',
-    '1ae56060': '10080',
-    'd1077778': '10085',
-    '2341d395': '10062',
-    '27cc9c62': '10735',
-    'afccbca8': '10085',
-    'ae23a242': '10081',
-    '2972399d': '10087',
-    '8917b8a9': '10085',
-    'e3696882': '10836',
-    '4bee7ba3': '3211',
-    'd96bbc04': '10734',
-    '795ca75e': '5169',
-    '82bb8427': '10077',
-    'ebf5a2a9': '10922',
-    'd73f7c60': '10080',
-    'b56c2667': '2939',
-    '82d18831': '10081',
-    '2b4a0e5e': '10062',
-    '7a899329': '10750',
-    '0e72edf2': '10730',
-    '0db64b70': '10838',
-    'baec986d': '10092',
-    'e56e174a': '10766',
-    'aeae4fe1': '10082',
-    'b71c6529': '10139',
-    'd6997457': '9995',
-    '8ff9e3b3': '10730',
-    '06183666': '10765',
-    '1c49bc64': '10062',
-    '9e60e560': '3266',
-    'fe550dbf': '3259',
-    '2583cf18': '10093',
-    '6be8cbbb': '10085',
-    '858d58b2': '10079',
-    '89e806ff': '10767',
-    'f7e3dfe9': '10729',
-    'c882b88e': '10739',
-    'bbbdfd99': '10077',
-    '1284d3f9': '10077',
-    '6962939c': '2939',
-    '8774e267': '10086',
-    '7366bd9c': '10080',
-    'b70ec3fa': '10082',
-    'c6f58d53': '10070',
-    '3c079def': '10090',
-    '03b65ba9': '10743',
-    'af4ccd77': '3212',
-    'c3139207': '10838',
-    'fe423bcc': '10747',
-    'a9d0ab0e': '10072',
-    '590e9120': '10734',
-    'bbd9ac49': '10735'
-}
+# The master list of squad IDs and league postfixes is stored in
+# league_ids.tsv and loaded on first use by fb_utils. This module is kept so
+# existing imports of LEAGUE_IDS continue to work.
+from .fb_utils import _league_ids
+
+LEAGUE_IDS = dict(_league_ids())
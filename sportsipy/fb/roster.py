@@ -1,16 +1,26 @@
-import pandas as pd
 import re
-from .constants import ROSTER_SCHEME, SQUAD_URL
+from .constants import ROSTER_SCHEME
 from ..decorators import float_property_decorator, int_property_decorator
-from .fb_utils import _lookup_team
-from .league_ids import LEAGUE_IDS
-from pyquery import PyQuery as pq
-from sportsipy.utils import (_get_stats_table,
-                             _parse_field,
-                             _remove_html_comment_tags)
+from .fb_utils import _league_ids, _lookup_team, _pull_squad_document
+from sportsipy.utils import _parse_field, pd
 from urllib.error import HTTPError
 
 
+# The stats tables on a squad page which contain player stats, in the order
+# they are merged. A value is taken from the first table which contains it.
+STATS_TABLES = ['stats_standard_',
+                'stats_keeper_',
+                'stats_keeper_adv_',
+                'stats_shooting_',
+                'stats_passing_',
+                'stats_playing_time_',
+                'stats_misc_']
+# Map every attribute in the roster scheme to the 'data-stat' name of the
+# table cell holding its value, such as 'matches_played' to 'games'.
+ROSTER_STATS = {field: re.search(r'data-stat="([^"]+)"', scheme).group(1)
+                for field, scheme in ROSTER_SCHEME.items()}
+
+
 class SquadPlayer:
     """
     Get player information and stats.
@@ -21,10 +31,13 @@ class SquadPlayer:
 
     Parameters
     ----------
-    player_data : PyQuery object
-        A PyQuery object containing all fields of information for a single
-        player, represented as one long row by concatenating all tables which
-        hold values for the requested player.
+    player_data : dictionary or PyQuery object
+        A ``dictionary`` of the player's stats where each key is the
+        'data-stat' name of a table cell and each value is the cell's text, as
+        created by the Roster class. Alternatively, a PyQuery object
+        containing all fields of information for a single player, represented
+        as one long row by concatenating all tables which hold values for the
+        requested player.
     player_id : string
         A ``string`` representation of the player's unique 8-digit ID as shown
         on fbref.com.
@@ -199,9 +212,10 @@ class SquadPlayer:
 
         Parameters
         ----------
-        player_data : PyQuery object
-            A PyQuery object representing all of the player's stats fields
-            combined as a singular row.
+        player_data : dictionary or PyQuery object
+            A ``dictionary`` of the player's stats including the link to their
+            country, or a PyQuery object representing all of the player's
+            stats fields combined as a singular row.
 
         Returns
         -------
@@ -209,10 +223,12 @@ class SquadPlayer:
             Returns a ``string`` of the player's home country, such as
             'England'.
         """
-        country = player_data(ROSTER_SCHEME['nationality'])
+        if isinstance(player_data, dict):
+            country = player_data.get('nationality')
+        else:
+            country = player_data(ROSTER_SCHEME['nationality']).attr('href')
         if not country:
             return None
-        country = country.attr('href')
         country = re.sub(r'.*\/', '', country)
         country = country.replace('-Football', '')
         return country
@@ -228,11 +244,10 @@ class SquadPlayer:
 
         Parameters
         ----------
-        player_data : string
-            A ``string`` representation of all of the player's stats fields
-            combined as a singular row.
-        player_id : string
-            A ``string`` of the player's unique 8-digit ID.
+        player_data : dictionary or PyQuery object
+            A ``dictionary`` of the player's stats keyed by the 'data-stat'
+            name of each table cell, or a PyQuery object of all of the
+            player's stats fields combined as a singular row.
         """
         for field in self.__dict__:
             # The short field truncates the leading '_' in the attribute name.
@@ -241,6 +256,8 @@ class SquadPlayer:
                 continue
             if short_field == 'nationality':
                 value = self._parse_nationality(player_data)
+            elif isinstance(player_data, dict):
+                value = player_data.get(ROSTER_STATS[short_field])
             else:
                 value = _parse_field(ROSTER_SCHEME, player_data, short_field)
             setattr(self, field, value)
@@ -1477,6 +1494,10 @@ class Roster:
     Player class for each player, containing a detailed list of the player's
     statistics and information for the season.
 
+    Without a document, the roster reuses the cached squad page, which is
+    only downloaded again once it is older than ``SQUAD_DOCUMENT_MAX_AGE``
+    seconds or has been released with ``release_squad_page``.
+
     Parameters
     ----------
     squad_id : string
@@ -1489,6 +1510,7 @@ class Roster:
     """
     def __init__(self, squad_id, doc=None):
         self._players = []
+        self._player_index = None
 
         self._squad_id = _lookup_team(squad_id)
         player_data_dict = self._pull_stats(doc)
@@ -1522,14 +1544,20 @@ class Roster:
             If the requested player cannot be matched with a player in the
             squad.
         """
-        for player_instance in self._players:
-            if not player_instance.name or not player_instance.player_id:
-                continue  # pragma: no cover
-            if player.lower() == player_instance.player_id.lower():
-                return player_instance
-            if player.lower().strip() == player_instance.name.lower().strip():
-                return player_instance
-        raise ValueError('No player found with the requested name or ID')
+        # The index is built on the first lookup and reused afterwards.
+        if getattr(self, '_player_index', None) is None:
+            self._player_index = self._index_players()
+        players_by_id, players_by_name = self._player_index
+        matches = [match for match in
+                   [players_by_id.get(player.lower()),
+                    players_by_name.get(player.lower().strip())]
+                   if match]
+        if not matches:
+            raise ValueError('No player found with the requested name or ID')
+        # If the requested string matches one player's ID and another player's
+        # name, return whichever player is listed first on the roster.
+        _, player_instance = min(matches, key=lambda match: match[0])
+        return player_instance
 
     def __str__(self):
         """
@@ -1556,6 +1584,33 @@ class Roster:
         """
         return len(self._players)
 
+    def _index_players(self):
+        """
+        Index every player on the roster by their ID and name.
+
+        Creates a pair of dictionaries which map each player's lowercase
+        8-digit ID and normalized name to the player so a player can be found
+        without comparing against every player on the roster. Players without
+        both a name and an ID can't be requested and are skipped.
+
+        Returns
+        -------
+        tuple
+            Returns a ``tuple`` of two dictionaries where each key is either
+            the player's ID or name, and each value is a ``tuple`` of the
+            player's position on the roster and the player instance.
+        """
+        players_by_id = {}
+        players_by_name = {}
+        for position, player in enumerate(self._players):
+            if not player.name or not player.player_id:
+                continue
+            players_by_id.setdefault(player.player_id.lower(),
+                                     (position, player))
+            players_by_name.setdefault(player.name.lower().strip(),
+                                       (position, player))
+        return players_by_id, players_by_name
+
     def _player_id(self, player_data):
         """
         Parse the player's ID from a row.
@@ -1586,20 +1641,22 @@ class Roster:
 
     def _add_stats_data(self, stats_table, player_data_dict):
         """
-        Add each player's stats rows to a dictionary.
+        Add each player's stats to a dictionary.
 
         Given the player stats are spread throughout many tables, they should
         be combined by player for a single reference for each player for easier
-        lookups.
+        lookups. Every cell in each row is read once and recorded by its
+        'data-stat' name. If a stat is included in multiple tables, the value
+        from the first table is kept.
 
         Parameters
         ----------
         stats_table : generator
             A generator of all row items in a given table.
-        player_data_dict : {str: {'data': str}} dictionary
+        player_data_dict : {str: {str: str}} dictionary
             A dictionary where every key is the player's ID and every value is
-            another dictionary with a 'data' key which contains the string
-            version of the row data for the matched player.
+            another dictionary of the player's stats keyed by the 'data-stat'
+            name of each cell.
 
         Returns
         -------
@@ -1608,15 +1665,21 @@ class Roster:
             row information included.
         """
         for player_data in stats_table:
-            if 'class="thead"' in str(player_data):
-                continue  # pragma: no cover
+            # Header rows repeated within the table don't link to a player
+            # and are skipped along with any other rows without an ID.
             player_id = self._player_id(player_data)
             if not player_id:
                 continue
-            try:
-                player_data_dict[player_id]['data'] += player_data
-            except KeyError:
-                player_data_dict[player_id] = {'data': player_data}
+            stats = player_data_dict.setdefault(player_id, {})
+            for cell in player_data.children().items():
+                stat = cell.attr('data-stat')
+                if not stat or stat in stats:
+                    continue
+                if stat == 'nationality':
+                    # The nationality is parsed from the country's link.
+                    stats[stat] = cell('a').attr('href')
+                else:
+                    stats[stat] = cell.text()
         return player_data_dict
 
     def _pull_stats(self, doc):
@@ -1637,35 +1700,31 @@ class Roster:
         -------
         dictionary
             Returns a ``dictionary`` where every key is the player's ID and
-            every value is another dictionary with a 'data' key which contains
-            the string version of the row data for the matched player.
+            every value is another dictionary of the player's stats keyed by
+            the 'data-stat' name of each cell.
         """
         if not doc:
             try:
-                doc = pq(SQUAD_URL % self._squad_id)
-                doc = pq(_remove_html_comment_tags(doc))
+                doc = _pull_squad_document(self._squad_id)
             except HTTPError:
                 return None
-        stats_table = []
         player_data_dict = {}
+        # Find every stats table on the page in a single pass instead of
+        # searching the page for each table individually.
+        tables = {table.attr('id'): table
+                  for table in doc('table[id^="stats_"]').items()}
 
         # Some leagues have a special ID for the tables. First lookup that ID
         # if it exists, but if not, use 'ks_combined' as the default.
-        postfix = LEAGUE_IDS.get(self._squad_id, 'ks_combined')
-
-        for table_id in ['table#stats_standard_',
-                         'table#stats_keeper_',
-                         'table#stats_keeper_adv_',
-                         'table#stats_shooting_',
-                         'table#stats_passing_',
-                         'table#stats_playing_time_',
-                         'table#stats_misc_']:
-            table = _get_stats_table(doc, table_id + 'ks_combined')
-            if not table:
-                table = _get_stats_table(doc, table_id + postfix)
-                if not table:
-                    continue
-            player_data_dict = self._add_stats_data(table, player_data_dict)
+        postfix = _league_ids().get(self._squad_id, 'ks_combined')
+
+        for table_id in STATS_TABLES:
+            table = tables.get(table_id + 'ks_combined',
+                               tables.get(table_id + postfix))
+            if table is None:
+                continue
+            player_data_dict = self._add_stats_data(table('tbody tr').items(),
+                                                    player_data_dict)
         return player_data_dict
 
     def _instantiate_players(self, player_data_dict):
@@ -1678,11 +1737,11 @@ class Roster:
 
         Parameters
         ----------
-        player_data_dict : {str: {'data': str}} dictionary
+        player_data_dict : {str: {str: str}} dictionary
             A dictionary where every key is the player's ID and every value is
-            another dictionary with a 'data' key which contains the string
-            version of the row data for the matched player.
+            another dictionary of the player's stats keyed by the 'data-stat'
+            name of each cell.
         """
         for player_id, player_data in player_data_dict.items():
-            player = SquadPlayer(player_data['data'], player_id)
+            player = SquadPlayer(player_data, player_id)
             self._players.append(player)
@@ -1,11 +1,10 @@
-import pandas as pd
 import re
-from .constants import SCHEDULE_SCHEME, SQUAD_URL
+from .constants import SCHEDULE_SCHEME
 from datetime import datetime
 from ..decorators import float_property_decorator, int_property_decorator
-from .fb_utils import _lookup_team
-from pyquery import PyQuery as pq
+from .fb_utils import _lookup_team, _pull_squad_document
 from sportsipy import utils
+from sportsipy.utils import pd
 from sportsipy.constants import (AWAY,
                                  DRAW,
                                  HOME,
@@ -186,6 +185,53 @@ class Game:
             value = utils._parse_field(SCHEDULE_SCHEME, game_data, short_name)
             setattr(self, field, value)
 
+    def _parse_datetime(self):
+        """
+        Parse the date and time the game took place.
+
+        The result is saved by the 'datetime' property, so the date is only
+        parsed once regardless of how many times it is requested.
+
+        Returns
+        -------
+        datetime
+            A datetime object of when the game took place.
+        """
+        try:
+            date = self.date.split('-')
+        except AttributeError:
+            return None
+        try:
+            time = re.sub(' .*', '', self.time)
+            time = time.split(':')
+        except TypeError:
+            time = None
+        if len(date) != 3:
+            return None
+        year, month, day = date
+        hour, minute = 0, 0
+        if time and len(time) == 2:
+            hour, minute = time
+        else:
+            time = None
+        try:
+            year = int(year)
+            month = int(month)
+            day = int(day)
+        except ValueError:
+            return None
+        try:
+            hour = int(hour)
+            minute = int(minute)
+        except ValueError:
+            # As long as we have a valid date, we can still create a meaningful
+            # datetime object, even if the time is invalid, so stick to the
+            # default hour and minute in case they can't be parsed.
+            hour = 0
+            minute = 0
+        datetime_ = datetime(year, month, day, hour, minute)
+        return datetime_
+
     @property
     def dataframe(self):
         """
@@ -267,40 +313,9 @@ class Game:
         started. If the time is not present, the default time of midnight on
         the given day will be used instead.
         """
-        try:
-            date = self.date.split('-')
-        except AttributeError:
-            return None
-        try:
-            time = re.sub(' .*', '', self.time)
-            time = time.split(':')
-        except TypeError:
-            time = None
-        if len(date) != 3:
-            return None
-        year, month, day = date
-        hour, minute = 0, 0
-        if time and len(time) == 2:
-            hour, minute = time
-        else:
-            time = None
-        try:
-            year = int(year)
-            month = int(month)
-            day = int(day)
-        except ValueError:
-            return None
-        try:
-            hour = int(hour)
-            minute = int(minute)
-        except ValueError:
-            # As long as we have a valid date, we can still create a meaningful
-            # datetime object, even if the time is invalid, so stick to the
-            # default hour and minute in case they can't be parsed.
-            hour = 0
-            minute = 0
-        datetime_ = datetime(year, month, day, hour, minute)
-        return datetime_
+        if self._datetime is None:
+            self._datetime = self._parse_datetime()
+        return self._datetime
 
     @property
     def venue(self):
@@ -471,6 +486,11 @@ class Schedule:
     Generates a team's schedule for the season including wins, losses, draws,
     and scores if applicable.
 
+    When no document is passed, the games are read from the same cached
+    squad page used by the Team class, which can be up to
+    ``SQUAD_DOCUMENT_MAX_AGE`` seconds old. Results of recently finished
+    games may therefore be missing until the page is released.
+
     Parameters
     ----------
     team_id : string
@@ -483,6 +503,8 @@ class Schedule:
     """
     def __init__(self, team_id, doc=None):
         self._games = []
+        self._games_by_date = None
+        self._datetimes = None
         self._pull_schedule(team_id, doc)
 
     def __getitem__(self, index):
@@ -535,14 +557,12 @@ class Schedule:
             If the requested date cannot be matched with a game in the
             schedule.
         """
-        for game in self._games:
-            if not game.datetime:
-                continue  # pragma: no cover
-            if game.datetime.year == date.year and \
-               game.datetime.month == date.month and \
-               game.datetime.day == date.day:
-                return game
-        raise ValueError('No games found for requested date')
+        if self._games_by_date is None:
+            self._games_by_date = self._index_games()
+        game = self._games_by_date.get((date.year, date.month, date.day))
+        if not game:
+            raise ValueError('No games found for requested date')
+        return game
 
     def __str__(self):
         """
@@ -570,6 +590,32 @@ class Schedule:
         """
         return len(self._games)
 
+    def _index_games(self):
+        """
+        Index every game in the schedule by the date it was played.
+
+        Maps the date of every game to the first game played on that date so
+        games can be found without searching the entire schedule and parsing
+        every game's date on each request.
+
+        Returns
+        -------
+        dictionary
+            A ``dictionary`` where each key is a ``tuple`` of the year, month,
+            and day, and each value is the first Game instance played on that
+            date.
+        """
+        games_by_date = {}
+        for game in self._games:
+            try:
+                date = game.datetime
+            except (AttributeError, TypeError, ValueError):
+                continue
+            if not date:
+                continue
+            games_by_date.setdefault((date.year, date.month, date.day), game)
+        return games_by_date
+
     def _add_games_to_schedule(self, schedule):
         """
         Add game information to the list of games.
@@ -593,9 +639,10 @@ class Schedule:
         Download and create objects for the team's schedule.
 
         Given the team's abbreviation, pull the squad page and parse all of the
-        games on the list. If a document is already provided (occurs when
-        called directly from the Team class), that can be used to save an extra
-        call to the website and games can be parsed from that object.
+        games on the list. If a document is already provided, that can be used
+        to save an extra call to the website and games can be parsed from that
+        object. Otherwise, the squad page is shared with the Team and Roster
+        classes for the same squad.
 
         A Game instance is created for every item in the team's schedule and
         appended to the '_games' property.
@@ -613,7 +660,7 @@ class Schedule:
         if not doc:
             squad_id = _lookup_team(team_id)
             try:
-                doc = pq(SQUAD_URL % squad_id)
+                doc = _pull_squad_document(squad_id)
             except HTTPError:
                 return
         schedule = utils._get_stats_table(doc, 'table#matchlogs_all')
@@ -622,3 +669,35 @@ class Schedule:
             utils._no_data_found()
             return
         self._add_games_to_schedule(schedule)
+
+    @property
+    def datetimes(self):
+        """
+        Returns a ``numpy array`` of the datetime every game in the schedule
+        took place as ``datetime64`` values, in the same order as the games.
+        Games without a valid date are ``NaT``. The array is only created once
+        and allows games to be filtered and sorted by date in bulk.
+        """
+        if self._datetimes is None:
+            self._datetimes = utils._datetime_array(self._games)
+        return self._datetimes
+
+    def games_between(self, start_date, end_date):
+        """
+        Return all games played within a range of dates.
+
+        Parameters
+        ----------
+        start_date : datetime
+            A datetime object of the earliest date and time to include.
+        end_date : datetime
+            A datetime object of the latest date and time to include.
+
+        Returns
+        -------
+        list
+            A ``list`` of Game instances played between the two dates,
+            inclusive, sorted in chronological order.
+        """
+        return utils._games_between(self._games, self.datetimes, start_date,
+                                    end_date)
@@ -1,13 +1,10 @@
 import re
-from .constants import SQUAD_URL
 from ..decorators import float_property_decorator, int_property_decorator
-from .fb_utils import _lookup_team
+from .fb_utils import _lookup_team, _pull_squad_document
 from pyquery import PyQuery as pq
 from .roster import Roster
 from .schedule import Schedule
-from .squad_ids import SQUAD_IDS
 from urllib.error import HTTPError
-from .. import utils
 
 
 class Team:
@@ -23,6 +20,13 @@ class Team:
     If a team cannot be identified for the given name or ID, a list of the
     closest matches will be returned as a dictionary instead.
 
+    The team's Schedule and Roster are built from the same page as the team
+    itself, so they never download it again. The page is also kept in a
+    shared cache for up to ``SQUAD_DOCUMENT_MAX_AGE`` seconds, so a Team
+    created shortly after another for the same squad may reflect the earlier
+    page. Call ``release_squad_page`` first to always download the latest
+    stats.
+
     Parameters
     ----------
     team_id : string
@@ -80,6 +84,14 @@ class Team:
         """
         return self.__str__()
 
+    def __getstate__(self):
+        """
+        Return the parsed values to pickle, excluding the squad page.
+        """
+        state = dict(self.__dict__)
+        state.pop('_doc', None)
+        return state
+
     def _parse_name(self, doc):
         """
         Parse the team's name and season.
@@ -308,7 +320,7 @@ class Team:
             be of the Squad page for the designated year.
         """
         try:
-            doc = utils._pull_page(SQUAD_URL % self.squad_id, squad_page)
+            doc = _pull_squad_document(self.squad_id, squad_page)
         except HTTPError:
             return
         self._doc = doc
@@ -1,11 +1,12 @@
-import pandas as pd
 import re
 from datetime import timedelta
 from pyquery import PyQuery as pq
 from urllib.error import HTTPError
 from .. import utils
+from ..utils import pd
 from ..constants import AWAY, HOME
 from ..decorators import float_property_decorator, int_property_decorator
+from . import constants
 from .constants import (BOXSCORE_ELEMENT_INDEX,
                         BOXSCORE_SCHEME,
                         BOXSCORE_URL,
@@ -342,8 +343,13 @@ class Boxscore:
     uri : string
         The relative link to the boxscore HTML page, such as
         'BOS/BOS201806070'.
+    html : string (optional)
+        The raw HTML contents of the boxscore page if it has already been
+        downloaded, such as while prefetching boxscores for a schedule. The
+        page is not downloaded again when specified. An empty string indicates
+        the page could not be downloaded.
     """
-    def __init__(self, uri):
+    def __init__(self, uri, html=None):
         self._uri = uri
         self._date = None
         self._time = None
@@ -353,6 +359,8 @@ class Boxscore:
         self._duration = None
         self._away_name = None
         self._home_name = None
+        self._away_link = None
+        self._home_link = None
         self._summary = None
         self._winner = None
         self._winning_name = None
@@ -430,15 +438,18 @@ class Boxscore:
         self._home_inherited_score = None
         self._home_win_probability_by_pitcher = None
         self._home_base_out_runs_saved = None
+        self._player_dict = {}
+        self._away_players = None
+        self._home_players = None
 
-        self._parse_game_data(uri)
+        self._parse_game_data(uri, html)
 
     def __str__(self):
         """
         Return the string representation of the class.
         """
-        return (f'Boxscore for {self._away_name.text()} at '
-                f'{self._home_name.text()} ({self.date})')
+        return (f'Boxscore for {self._away_name} at '
+                f'{self._home_name} ({self.date})')
 
     def __repr__(self):
         """
@@ -446,7 +457,13 @@ class Boxscore:
         """
         return self.__str__()
 
-    def _retrieve_html_page(self, uri):
+    def __getstate__(self):
+        """
+        Return the parsed values to pickle, excluding the raw HTML.
+        """
+        return utils._boxscore_state(self)
+
+    def _retrieve_html_page(self, uri, html=None):
         """
         Download the requested HTML page.
 
@@ -459,6 +476,10 @@ class Boxscore:
         uri : string
             The relative link to the boxscore HTML page, such as
             'BOS/BOS201806070'.
+        html : string (optional)
+            The raw HTML contents of the page if it has already been
+            downloaded. An empty string indicates the page could not be
+            downloaded.
 
         Returns
         -------
@@ -466,11 +487,16 @@ class Boxscore:
             The requested page is returned as a queriable PyQuery object with
             the comment tags removed.
         """
-        url = BOXSCORE_URL % uri
-        try:
-            url_data = pq(url)
-        except HTTPError:
-            return None
+        if html is not None:
+            if not html:
+                return None
+            url_data = html
+        else:
+            url = BOXSCORE_URL % uri
+            try:
+                url_data = utils._pull_page(url)
+            except HTTPError:
+                return None
         return pq(utils._remove_html_comment_tags(url_data))
 
     def _parse_game_date_and_location(self, boxscore):
@@ -564,11 +590,12 @@ class Boxscore:
 
     def _parse_name(self, field, boxscore):
         """
-        Retrieve the team's complete name tag.
+        Retrieve the team's name and link from the name tag.
 
         Both the team's full name (embedded in the tag's text) and the team's
-        abbreviation are stored in the name tag which can be used to parse
-        the winning and losing team's information.
+        abbreviation (embedded in the tag's link) are stored in the name tag
+        which can be used to parse the winning and losing team's information.
+        Only the strings are kept so the page can be released once parsed.
 
         Parameters
         ----------
@@ -579,11 +606,12 @@ class Boxscore:
 
         Returns
         -------
-        PyQuery object
-            The complete text for the requested tag.
+        tuple
+            Returns a ``tuple`` of the team's name and the ``string`` of the
+            link to the team's page, or None if the team isn't linked.
         """
-        scheme = BOXSCORE_SCHEME[field]
-        return boxscore(scheme)
+        name = boxscore(BOXSCORE_SCHEME[field])
+        return name.text(), name.attr('href')
 
     def _find_boxscore_tables(self, boxscore):
         """
@@ -697,11 +725,13 @@ class Boxscore:
             name = self._find_player_name(row)
             try:
                 player_dict[player_id]['data'] += str(row).strip()
+                utils._row_cells(row, player_dict[player_id]['cells'])
             except KeyError:
                 player_dict[player_id] = {
                     'name': name,
                     'data': str(row).strip(),
-                    'team': home_or_away
+                    'team': home_or_away,
+                    'cells': utils._row_cells(row)
                 }
         return player_dict
 
@@ -746,9 +776,10 @@ class Boxscore:
         Find all players for each team.
 
         Iterate through every player for both teams as found in the boxscore
-        tables and create a list of instances of the BoxscorePlayer class for
-        each player. Return lists of player instances comprising the away and
-        home team players, respectively.
+        tables, combining the stats from every table the player appears in.
+        The players are only instantiated once they are requested, while the
+        collected stats can be used to build a DataFrame of every player
+        directly.
 
         Parameters
         ----------
@@ -757,10 +788,11 @@ class Boxscore:
 
         Returns
         -------
-        tuple
-            Returns a ``tuple`` in the format (away_players, home_players)
-            where each element is a list of player instances for the away and
-            home teams, respectively.
+        dictionary
+            Returns a ``dictionary`` where each key is a string of the player's
+            ID and each value is a dictionary containing the player's name,
+            HTML data, collected stats, and a string constant indicating which
+            team the player is a member of.
         """
         player_dict = {}
         table_count = 0
@@ -776,10 +808,9 @@ class Boxscore:
                                                      player_dict,
                                                      home_or_away)
             table_count += 1
-        away_players, home_players = self._instantiate_players(player_dict)
-        return away_players, home_players
+        return player_dict
 
-    def _parse_game_data(self, uri):
+    def _parse_game_data(self, uri, html=None):
         """
         Parses a value for every attribute.
 
@@ -791,13 +822,23 @@ class Boxscore:
         Note that this method is called directly once Boxscore is invoked and
         does not need to be called manually.
 
+        If the parsed cache is enabled and the page has been parsed before, the
+        attributes are restored from the cache instead.
+
         Parameters
         ----------
         uri : string
             The relative link to the boxscore HTML page, such as
             'BOS/BOS201806070'.
+        html : string (optional)
+            The raw HTML contents of the page if it has already been
+            downloaded.
         """
-        boxscore = self._retrieve_html_page(uri)
+        html, key = utils._parsed_cache_key(BOXSCORE_URL % uri, constants,
+                                            html)
+        if utils._load_parsed_page(self, key):
+            return
+        boxscore = self._retrieve_html_page(uri, html)
         # If the boxscore is None, the game likely hasn't been played yet and
         # no information can be gathered. As there is nothing to grab, the
         # class instance should just be empty.
@@ -813,6 +854,9 @@ class Boxscore:
                short_field == 'losing_name' or \
                short_field == 'losing_abbr' or \
                short_field == 'uri' or \
+               short_field == 'player_dict' or \
+               short_field == 'away_players' or \
+               short_field == 'home_players' or \
                short_field == 'date' or \
                short_field == 'time' or \
                short_field == 'venue' or \
@@ -820,10 +864,14 @@ class Boxscore:
                short_field == 'time_of_day' or \
                short_field == 'duration':
                 continue
+            if short_field == 'away_link' or \
+               short_field == 'home_link':
+                continue
             if short_field == 'away_name' or \
                short_field == 'home_name':
-                value = self._parse_name(short_field, boxscore)
-                setattr(self, field, value)
+                name, link = self._parse_name(short_field, boxscore)
+                setattr(self, field, name)
+                setattr(self, field.replace('_name', '_link'), link)
                 continue
             if short_field == 'summary':
                 value = self._parse_summary(boxscore)
@@ -838,7 +886,10 @@ class Boxscore:
                                        index)
             setattr(self, field, value)
         self._parse_game_date_and_location(boxscore)
-        self._away_players, self._home_players = self._find_players(boxscore)
+        self._player_dict = self._find_players(boxscore)
+        self._away_players = None
+        self._home_players = None
+        utils._save_parsed_page(self, key)
 
     @property
     def dataframe(self):
@@ -946,6 +997,9 @@ class Boxscore:
         Returns a ``list`` of ``BoxscorePlayer`` class instances for each
         player on the away team.
         """
+        if self._away_players is None:
+            self._away_players, self._home_players = \
+                self._instantiate_players(self._player_dict)
         return self._away_players
 
     @property
@@ -954,8 +1008,26 @@ class Boxscore:
         Returns a ``list`` of ``BoxscorePlayer`` class instances for each
         player on the home team.
         """
+        if self._home_players is None:
+            self._away_players, self._home_players = \
+                self._instantiate_players(self._player_dict)
         return self._home_players
 
+    @property
+    def players_dataframe(self):
+        """
+        Returns a pandas DataFrame containing the box score stats for every
+        player on both teams, read directly from the boxscore tables without
+        creating a ``BoxscorePlayer`` instance for each player. Each row
+        includes the player's 'name' and a 'team' column of either 'Home' or
+        'Away', followed by every stat listed for the player. Stats are named
+        after the 'data-stat' attribute of their column in the boxscore
+        tables, such as 'pts', and are left as strings unless every value is
+        numeric. The index for the DataFrame is the player ID. Returns None if
+        no players could be found.
+        """
+        return utils._players_dataframe(self._player_dict)
+
     @property
     def date(self):
         """
@@ -1034,8 +1106,8 @@ class Boxscore:
         Astros'.
         """
         if self.winner == HOME:
-            return self._home_name.text()
-        return self._away_name.text()
+            return self._home_name
+        return self._away_name
 
     @property
     def winning_abbr(self):
@@ -1044,8 +1116,8 @@ class Boxscore:
         for the Houston Astros.
         """
         if self.winner == HOME:
-            return utils._parse_abbreviation(self._home_name)
-        return utils._parse_abbreviation(self._away_name)
+            return utils._parse_abbreviation(self._home_link)
+        return utils._parse_abbreviation(self._away_link)
 
     @property
     def losing_name(self):
@@ -1054,8 +1126,8 @@ class Boxscore:
         Dodgers'.
         """
         if self.winner == HOME:
-            return self._away_name.text()
-        return self._home_name.text()
+            return self._away_name
+        return self._home_name
 
     @property
     def losing_abbr(self):
@@ -1064,8 +1136,8 @@ class Boxscore:
         for the Los Angeles Dodgers.
         """
         if self.winner == HOME:
-            return utils._parse_abbreviation(self._away_name)
-        return utils._parse_abbreviation(self._home_name)
+            return utils._parse_abbreviation(self._away_link)
+        return utils._parse_abbreviation(self._home_link)
 
     @int_property_decorator
     def away_at_bats(self):
@@ -1636,9 +1708,16 @@ class Boxscores:
         including the boxscores specified in the 'end_date' parameter will be
         pulled. If left empty, or if 'end_date' is prior to 'date', only the
         games from the day specified in the 'date' parameter will be saved.
+    revalidate : boolean (optional)
+        Optionally remember the validators and compressed HTML of each
+        boxscores page and conditionally revalidate it on subsequent requests.
+        If the page hasn't changed, the saved HTML is used instead of
+        downloading the page again, though it is still parsed. Useful when
+        repeatedly pulling the games for a day which is still in progress.
     """
-    def __init__(self, date, end_date=None):
+    def __init__(self, date, end_date=None, revalidate=False):
         self._boxscores = {}
+        self._revalidate = revalidate
 
         self._find_games(date, end_date)
 
@@ -1732,7 +1811,7 @@ class Boxscores:
             A PyQuery object containing the HTML contents of the requested
             page.
         """
-        return pq(url)
+        return utils._pull_page(url, revalidate=self._revalidate)
 
     def _get_boxscore_uri(self, url):
         """
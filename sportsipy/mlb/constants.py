@@ -526,3 +526,8 @@ ROSTER_URL = 'https://www.baseball-reference.com/teams/%s/%s.shtml'
 
 NIGHT = 'Night'
 DAY = 'Day'
+
+# The version of the parser for this league's pages. Increment whenever the
+# way pages are parsed changes so previously parsed pages aren't reused. Any
+# change to the schemes above is detected automatically.
+PARSER_VERSION = 1
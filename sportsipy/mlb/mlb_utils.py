@@ -76,10 +76,12 @@ def _retrieve_all_teams(year, standings_file=None, teams_file=None):
         if not utils._url_exists(STANDINGS_URL % year) and \
            utils._url_exists(STANDINGS_URL % str(int(year) - 1)):
             year = str(int(year) - 1)
-    doc = utils._pull_page(STANDINGS_URL % year, standings_file)
+    standings_doc, doc = utils._pull_pages(
+        [(STANDINGS_URL % year, standings_file),
+         (TEAM_STATS_URL % year, teams_file)],
+        revalidate=True)
     div_prefix = 'div#all_expanded_standings_overall'
-    standings = utils._get_stats_table(doc, div_prefix)
-    doc = utils._pull_page(TEAM_STATS_URL % year, teams_file)
+    standings = utils._get_stats_table(standings_doc, div_prefix)
     div_prefix = 'div#all_teams_standard_%s'
     batting_stats = utils._get_stats_table(doc, div_prefix % 'batting')
     pitching_stats = utils._get_stats_table(doc, div_prefix % 'pitching')
@@ -1,4 +1,3 @@
-import pandas as pd
 import re
 from functools import wraps
 from lxml.etree import ParserError, XMLSyntaxError
@@ -26,11 +25,8 @@ def _cleanup(prop):
 
 
 def _int_property_decorator(func):
-    @property
-    @wraps(func)
-    def wrapper(*args):
-        index = args[0]._index
-        prop = func(*args)
+    def season_value(player, index):
+        prop = func(player)
         element_ind = 0
         if func.__name__ in PLAYER_ELEMENT_INDEX.keys():
             element_ind = PLAYER_ELEMENT_INDEX[func.__name__]
@@ -40,15 +36,18 @@ def _int_property_decorator(func):
         except (ValueError, TypeError, IndexError):
             # If there is no value, default to None
             return None
-    return wrapper
 
-
-def _float_property_decorator(func):
     @property
     @wraps(func)
     def wrapper(*args):
-        index = args[0]._index
-        prop = func(*args)
+        return season_value(args[0], args[0]._index)
+    wrapper.fget._season_value = season_value
+    return wrapper
+
+
+def _float_property_decorator(func):
+    def season_value(player, index):
+        prop = func(player)
         element_ind = 0
         if func.__name__ in PLAYER_ELEMENT_INDEX.keys():
             element_ind = PLAYER_ELEMENT_INDEX[func.__name__]
@@ -58,6 +57,12 @@ def _float_property_decorator(func):
         except (ValueError, TypeError, IndexError):
             # If there is no value, default to None
             return None
+
+    @property
+    @wraps(func)
+    def wrapper(*args):
+        return season_value(args[0], args[0]._index)
+    wrapper.fget._season_value = season_value
     return wrapper
 
 
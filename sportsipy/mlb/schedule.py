@@ -1,13 +1,12 @@
-import pandas as pd
 import re
 from ..decorators import int_property_decorator
-from .constants import (DAY,
+from .constants import (BOXSCORE_URL,
+                        DAY,
                         NIGHT,
                         SCHEDULE_SCHEME,
                         SCHEDULE_URL)
-from datetime import datetime
-from pyquery import PyQuery as pq
 from sportsipy import utils
+from sportsipy.utils import pd
 from sportsipy.constants import (WIN,
                                  LOSS,
                                  HOME,
@@ -116,6 +115,22 @@ class Game:
             value = utils._parse_field(SCHEDULE_SCHEME, game_data, short_name)
             setattr(self, field, value)
 
+    def _parse_datetime(self):
+        """
+        Parse the date and time the game took place.
+
+        The result is saved by the 'datetime' property, so the date is only
+        parsed once regardless of how many times it is requested.
+
+        Returns
+        -------
+        datetime
+            A datetime object of when the game took place.
+        """
+        date_string = '%s %s' % (self._date, self._year)
+        date_string = re.sub(r' \(\d+\)', '', date_string)
+        return utils._parse_datetime(date_string, '%A, %b %d %Y')
+
     @property
     def dataframe(self):
         """
@@ -186,9 +201,9 @@ class Game:
         Returns a datetime object of the month, day, year, and time the game
         was played.
         """
-        date_string = '%s %s' % (self._date, self._year)
-        date_string = re.sub(r' \(\d+\)', '', date_string)
-        return datetime.strptime(date_string, '%A, %b %d %Y')
+        if self._datetime is None:
+            self._datetime = self._parse_datetime()
+        return self._datetime
 
     @property
     def game_number_for_day(self):
@@ -382,6 +397,8 @@ class Schedule:
     """
     def __init__(self, abbreviation, year=None):
         self._games = []
+        self._games_by_date = None
+        self._datetimes = None
         self._pull_schedule(abbreviation, year)
 
     def __getitem__(self, index):
@@ -433,13 +450,13 @@ class Schedule:
             If the requested date cannot be matched with a game in the
             schedule.
         """
-        for game in self._games:
-            if game.datetime.year == date.year and \
-               game.datetime.month == date.month and \
-               game.datetime.day == date.day and \
-               game.game_number_for_day == game_number:
-                return game
-        raise ValueError('No games found for requested date')
+        if self._games_by_date is None:
+            self._games_by_date = self._index_games()
+        key = (date.year, date.month, date.day, game_number)
+        game = self._games_by_date.get(key)
+        if not game:
+            raise ValueError('No games found for requested date')
+        return game
 
     def __str__(self):
         """
@@ -465,6 +482,31 @@ class Schedule:
         """Returns the number of scheduled games for the given team."""
         return len(self._games)
 
+    def _index_games(self):
+        """
+        Index every game in the schedule by the date it was played.
+
+        Maps the date and game number of every game to the game itself so
+        games can be found without searching the entire schedule and parsing
+        every game's date on each request.
+
+        Returns
+        -------
+        dictionary
+            A ``dictionary`` where each key is a ``tuple`` of the year, month,
+            day, and game number for the day, and each value is the matching
+            Game instance.
+        """
+        games_by_date = {}
+        for game in self._games:
+            try:
+                date = game.datetime
+            except (AttributeError, TypeError, ValueError):
+                continue
+            key = (date.year, date.month, date.day, game.game_number_for_day)
+            games_by_date.setdefault(key, game)
+        return games_by_date
+
     def _pull_schedule(self, abbreviation, year):
         """
         Download and create objects for the team's schedule.
@@ -492,7 +534,8 @@ class Schedule:
                utils._url_exists(SCHEDULE_URL % (abbreviation,
                                                  str(int(year) - 1))):
                 year = str(int(year) - 1)
-        doc = pq(SCHEDULE_URL % (abbreviation, year))
+        doc = utils._pull_page(SCHEDULE_URL % (abbreviation, year),
+                               revalidate=True)
         schedule = utils._get_stats_table(doc, 'table#team_schedule')
         if not schedule:
             utils._no_data_found()
@@ -539,3 +582,117 @@ class Schedule:
         if frames == []:
             return None
         return pd.concat(frames)
+
+    def boxscores(self, window=utils.PREFETCH_WINDOW, processes=None):
+        """
+        Returns a generator of the Boxscore class for every game in the
+        schedule which has been played, in order. While one game's boxscore is
+        being parsed, the pages for up to ``window`` of the following games are
+        downloaded in the background so network time overlaps with parsing. No
+        more than ``window`` downloaded pages are held in memory at once.
+
+        Parameters
+        ----------
+        window : int (optional)
+            The maximum number of boxscore pages to download ahead of the game
+            currently being parsed.
+        processes : int (optional)
+            An ``int`` of the number of worker processes to parse the
+            boxscores in. Pages are still downloaded on background threads,
+            while each page is parsed in one of the worker processes so
+            parsing scales with the number of cores. At least one page per
+            process is downloaded ahead. The boxscores are parsed in the
+            current process if not specified.
+
+        Returns
+        -------
+        generator
+            A generator of Boxscore instances for every game in the schedule
+            which has been played.
+        """
+        # Games which haven't been played yet don't have a boxscore and are
+        # skipped, matching the 'dataframe_extended' property.
+        games = [game for game in self._games
+                 if game._runs_allowed is not None or
+                 game._runs_scored is not None]
+        urls = [BOXSCORE_URL % game.boxscore_index for game in games]
+        if processes:
+            window = max(window, processes)
+        pages = utils._prefetch_pages(urls, window)
+        if processes:
+            arguments = ((game.boxscore_index, html)
+                         for game, html in zip(games, pages))
+            yield from utils._parse_in_processes(Boxscore, arguments,
+                                                 processes, window)
+            return
+        for game, html in zip(games, pages):
+            yield Boxscore(game.boxscore_index, html)
+
+    def pipelined_dataframe_extended(self, window=utils.PREFETCH_WINDOW,
+                                     processes=None):
+        """
+        Returns a pandas DataFrame where each row is a representation of the
+        Boxscore class for every game in the schedule, identical to the
+        'dataframe_extended' property. Boxscore pages for upcoming games are
+        downloaded in the background while the current game is parsed, which
+        is considerably faster for full seasons.
+
+        Parameters
+        ----------
+        window : int (optional)
+            The maximum number of boxscore pages to download ahead of the game
+            currently being parsed.
+        processes : int (optional)
+            An ``int`` of the number of worker processes to parse the
+            boxscores in. Pages are still downloaded on background threads,
+            while each page is parsed in one of the worker processes so
+            parsing scales with the number of cores. At least one page per
+            process is downloaded ahead. The boxscores are parsed in the
+            current process if not specified.
+
+        Returns
+        -------
+        DataFrame
+            A pandas DataFrame of every boxscore in the schedule, indexed by
+            the boxscore string.
+        """
+        frames = []
+        for boxscore in self.boxscores(window, processes):
+            df = boxscore.dataframe
+            if df is not None:
+                frames.append(df)
+        if frames == []:
+            return None
+        return pd.concat(frames)
+
+    @property
+    def datetimes(self):
+        """
+        Returns a ``numpy array`` of the datetime every game in the schedule
+        took place as ``datetime64`` values, in the same order as the games.
+        Games without a valid date are ``NaT``. The array is only created once
+        and allows games to be filtered and sorted by date in bulk.
+        """
+        if self._datetimes is None:
+            self._datetimes = utils._datetime_array(self._games)
+        return self._datetimes
+
+    def games_between(self, start_date, end_date):
+        """
+        Return all games played within a range of dates.
+
+        Parameters
+        ----------
+        start_date : datetime
+            A datetime object of the earliest date and time to include.
+        end_date : datetime
+            A datetime object of the latest date and time to include.
+
+        Returns
+        -------
+        list
+            A ``list`` of Game instances played between the two dates,
+            inclusive, sorted in chronological order.
+        """
+        return utils._games_between(self._games, self.datetimes, start_date,
+                                    end_date)
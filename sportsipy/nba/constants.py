@@ -415,3 +415,8 @@ BOXSCORES_URL = ('https://www.basketball-reference.com/boxscores/'
 PLAYER_URL = 'https://www.basketball-reference.com/players/%s/%s.html'
 
 ROSTER_URL = 'https://www.basketball-reference.com/teams/%s/%s.html'
+
+# The version of the parser for this league's pages. Increment whenever the
+# way pages are parsed changes so previously parsed pages aren't reused. Any
+# change to the schemes above is detected automatically.
+PARSER_VERSION = 1
@@ -1,5 +1,4 @@
 from .constants import PARSING_SCHEME, SEASON_PAGE_URL
-from pyquery import PyQuery as pq
 from sportsipy import utils
 from urllib.error import HTTPError
 
@@ -72,7 +71,7 @@ def _retrieve_all_teams(year, season_file=None):
         # instead.
         if year == 2021:
             try:
-                doc = pq(SEASON_PAGE_URL % year)
+                doc = utils._pull_page(SEASON_PAGE_URL % year)
             except HTTPError:
                 year = str(int(year) - 1)
         # If stats for the requested season do not exist yet (as is the case
@@ -81,7 +80,8 @@ def _retrieve_all_teams(year, season_file=None):
         if not utils._url_exists(SEASON_PAGE_URL % year) and \
            utils._url_exists(SEASON_PAGE_URL % str(int(year) - 1)):
             year = str(int(year) - 1)
-    doc = utils._pull_page(SEASON_PAGE_URL % year, season_file)
+    doc = utils._pull_page(SEASON_PAGE_URL % year, season_file,
+                           revalidate=True)
     teams_list = utils._get_stats_table(doc, 'div#div_totals-team')
     opp_teams_list = utils._get_stats_table(doc, 'div#div_totals-opponent')
 
@@ -1,4 +1,3 @@
-import pandas as pd
 import re
 from functools import wraps
 from pyquery import PyQuery as pq
@@ -19,32 +18,38 @@ def _cleanup(prop):
 
 
 def _int_property_decorator(func):
-    @property
-    @wraps(func)
-    def wrapper(*args):
-        index = args[0]._index
-        prop = func(*args)
+    def season_value(player, index):
+        prop = func(player)
         try:
             value = _cleanup(prop[index])
             return int(value)
         except (TypeError, ValueError):
             # If there is no value, default to None
             return None
-    return wrapper
 
-
-def _float_property_decorator(func):
     @property
     @wraps(func)
     def wrapper(*args):
-        index = args[0]._index
-        prop = func(*args)
+        return season_value(args[0], args[0]._index)
+    wrapper.fget._season_value = season_value
+    return wrapper
+
+
+def _float_property_decorator(func):
+    def season_value(player, index):
+        prop = func(player)
         try:
             value = _cleanup(prop[index])
             return float(value)
         except (TypeError, ValueError):
             # If there is no value, default to None
             return None
+
+    @property
+    @wraps(func)
+    def wrapper(*args):
+        return season_value(args[0], args[0]._index)
+    wrapper.fget._season_value = season_value
     return wrapper
 
 
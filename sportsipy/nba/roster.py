@@ -1,4 +1,3 @@
-import pandas as pd
 import re
 from datetime import datetime
 from functools import wraps
@@ -6,6 +5,7 @@ from lxml.etree import ParserError, XMLSyntaxError
 from pyquery import PyQuery as pq
 from urllib.error import HTTPError
 from .. import utils
+from . import constants
 from .constants import NATIONALITY, PLAYER_SCHEME, PLAYER_URL, ROSTER_URL
 from .player import AbstractPlayer
 
@@ -23,47 +23,56 @@ def _cleanup(prop):
 
 
 def _int_property_decorator(func):
-    @property
-    @wraps(func)
-    def wrapper(*args):
-        index = args[0]._index
-        prop = func(*args)
+    def season_value(player, index):
+        prop = func(player)
         try:
             value = _cleanup(prop[index])
             return int(value)
         except (TypeError, ValueError):
             # If there is no value, default to None
             return None
-    return wrapper
-
 
-def _int_property_decorator_default_zero(func):
     @property
     @wraps(func)
     def wrapper(*args):
-        index = args[0]._index
-        prop = func(*args)
+        return season_value(args[0], args[0]._index)
+    wrapper.fget._season_value = season_value
+    return wrapper
+
+
+def _int_property_decorator_default_zero(func):
+    def season_value(player, index):
+        prop = func(player)
         try:
             value = _cleanup(prop[index])
             return int(value)
         except (TypeError, ValueError):
             # If there is no value, default to 0
             return 0
-    return wrapper
 
-
-def _float_property_decorator(func):
     @property
     @wraps(func)
     def wrapper(*args):
-        index = args[0]._index
-        prop = func(*args)
+        return season_value(args[0], args[0]._index)
+    wrapper.fget._season_value = season_value
+    return wrapper
+
+
+def _float_property_decorator(func):
+    def season_value(player, index):
+        prop = func(player)
         try:
             value = _cleanup(prop[index])
             return float(value)
         except (TypeError, ValueError):
             # If there is no value, default to None
             return None
+
+    @property
+    @wraps(func)
+    def wrapper(*args):
+        return season_value(args[0], args[0]._index)
+    wrapper.fget._season_value = season_value
     return wrapper
 
 
@@ -103,9 +112,14 @@ class Player(AbstractPlayer):
         name, 'FF', are the first 2 letters in the player's first name, and
         'NN' is a number starting at '01' for the first time that player ID has
         been used and increments by 1 for every successive player.
+    html : string (optional)
+        The raw HTML contents of the player's page if it has already been
+        downloaded, such as while pulling every player on a roster. The page
+        is not downloaded again when specified. An empty string indicates the
+        page could not be downloaded.
     """
 
-    def __init__(self, player_id):
+    def __init__(self, player_id, html=None):
         self._most_recent_season = ''
         self._index = None
         self._player_id = player_id
@@ -185,11 +199,18 @@ class Player(AbstractPlayer):
         self._personal_fouls_per_poss = None
         self._points_per_poss = None
 
-        player_data = self._pull_player_data()
+        key = None
+        if utils._parsed_cache_directory is not None:
+            html, key = utils._parsed_cache_key(self._build_url(), constants,
+                                                html)
+            if utils._load_parsed_page(self, key):
+                return
+        player_data = self._pull_player_data(html)
         AbstractPlayer.__init__(self, player_id, self._name, player_data)
         if not player_data:
             return
         self._find_initial_index()
+        utils._save_parsed_page(self, key)
 
     def __str__(self):
         """
@@ -220,24 +241,36 @@ class Player(AbstractPlayer):
         first_character = self._player_id[0]
         return PLAYER_URL % (first_character, self._player_id)
 
-    def _retrieve_html_page(self):
+    def _retrieve_html_page(self, html=None):
         """
         Download the requested player's stats page.
 
         Download the requested page and strip all of the comment tags before
         returning a pyquery object which will be used to parse the data.
 
+        Parameters
+        ----------
+        html : string (optional)
+            The raw HTML contents of the page if it has already been
+            downloaded. An empty string indicates the page could not be
+            downloaded.
+
         Returns
         -------
         PyQuery object
             The requested page is returned as a queriable PyQuery object with
             the comment tags removed.
         """
-        url = self._build_url()
-        try:
-            url_data = pq(url)
-        except (HTTPError, ParserError):
-            return None
+        if html is not None:
+            if not html:
+                return None
+            url_data = html
+        else:
+            url = self._build_url()
+            try:
+                url_data = utils._pull_page(url)
+            except (HTTPError, ParserError):
+                return None
         return pq(utils._remove_html_comment_tags(url_data))
 
     def _parse_season(self, row):
@@ -499,7 +532,7 @@ class Player(AbstractPlayer):
                     setattr(self, '_contract', contract)
                     break
 
-    def _pull_player_data(self):
+    def _pull_player_data(self, html=None):
         """
         Pull and aggregate all player information.
 
@@ -508,6 +541,12 @@ class Player(AbstractPlayer):
         all seasons plus the player's career stats into a single object which
         can easily be iterated upon.
 
+        Parameters
+        ----------
+        html : string (optional)
+            The raw HTML contents of the player's stats page if it has
+            already been downloaded.
+
         Returns
         -------
         dictionary
@@ -515,7 +554,7 @@ class Player(AbstractPlayer):
             is a string of the season and the value is the season's associated
             stats.
         """
-        player_info = self._retrieve_html_page()
+        player_info = self._retrieve_html_page(html)
         if not player_info:
             return
         self._parse_player_information(player_info)
@@ -571,6 +610,29 @@ class Player(AbstractPlayer):
             index += 1
         return self
 
+    def for_season(self, requested_season=''):
+        """
+        Return a view of the player's stats for a single season.
+
+        Unlike calling the class instance, the requested season is selected on
+        a lightweight copy of the player which shares the parsed stats, so the
+        player itself is never modified. This allows a single instance to be
+        shared between threads which each read a different season.
+
+        Parameters
+        ----------
+        requested_season : string (optional)
+            A string of the requested season to query, such as '2017-18'. If
+            left blank or 'Career' is passed, the career stats will be used for
+            stats queries.
+
+        Returns
+        -------
+        Player class instance
+            Returns a new instance referencing the requested season's stats.
+        """
+        return utils._season_view(self)(requested_season)
+
     def _dataframe_fields(self):
         """
         Creates a dictionary of all fields to include with DataFrame.
@@ -721,15 +783,7 @@ class Player(AbstractPlayer):
         properties and values where each index is a different season plus the
         career stats.
         """
-        temp_index = self._index
-        rows = []
-        indices = []
-        for season in self._season:
-            self._index = self._season.index(season)
-            rows.append(self._dataframe_fields())
-            indices.append(season)
-        self._index = temp_index
-        return pd.DataFrame(rows, index=[indices])
+        return utils._career_dataframe(self)
 
     @property
     def season(self):
@@ -1379,11 +1433,18 @@ class Roster:
         the name and player ID for each player as opposed to all of their
         respective stats which greatly reduces the time to return a response if
         just the names and IDs are desired. Defaults to False.
+    processes : int (optional)
+        An ``int`` of the number of worker processes to parse the players'
+        pages in when ``slim`` is False. The pages are still downloaded on
+        background threads, while each page is parsed in one of the worker
+        processes so parsing scales with the number of cores. The pages are
+        parsed in the current process if not specified.
     """
 
-    def __init__(self, team, year=None, slim=False):
+    def __init__(self, team, year=None, slim=False, processes=None):
         self._team = team
         self._slim = slim
+        self._processes = processes
         self._coach = None
         if slim:
             self._players = {}
@@ -1422,7 +1483,7 @@ class Roster:
             Returns a PyQuery object of the team's HTML page.
         """
         try:
-            return pq(url)
+            return utils._pull_page(url)
         except HTTPError:
             return None
 
@@ -1535,7 +1596,7 @@ class Roster:
             # be pulled instead.
             if year == 2021:
                 try:
-                    doc = pq(self._create_url(year))
+                    doc = utils._pull_page(self._create_url(year))
                 except HTTPError:
                     year = str(int(year) - 1)
             # If stats for the requested season do not exist yet (as is the
@@ -1551,6 +1612,7 @@ class Roster:
             output = ("Can't pull requested team page. Ensure the following "
                       "URL exists: %s" % url)
             raise ValueError(output)
+        player_ids = []
         players = page('table#roster tbody tr').items()
         for player in players:
             player_id = self._get_id(player)
@@ -1560,9 +1622,11 @@ class Roster:
                 name = self._get_name(player)
                 self._players[player_id] = name
             else:
-                player_instance = Player(player_id)
-                self._players.append(player_instance)
+                player_ids.append(player_id)
 
+        if not self._slim:
+            self._players = utils._create_players(Player, player_ids,
+                                                  self._processes)
         self._coach = self._parse_coach(page)
 
     @property
@@ -1,10 +1,34 @@
-from pyquery import PyQuery as pq
+import copy
 import re
+import threading
+from collections import OrderedDict
 from urllib.error import HTTPError
 from .. import utils
 from .constants import CONFERENCE_URL, CONFERENCES_URL
 
 
+# The maximum number of past seasons whose conferences and teams are kept.
+# Membership of a finished season doesn't change, so the results are reused
+# by every Conferences instance for the same season instead of downloading
+# each conference page again. The current season is never kept, as teams can
+# still be added to it. Once full, the least recently requested season is
+# dropped. Set this to 0 to disable the cache.
+CONFERENCES_CACHE_SIZE = 8
+_conferences_cache = OrderedDict()
+_conferences_lock = threading.Lock()
+
+
+def _clear_conferences_cache():
+    """
+    Forget the conferences saved for every season.
+
+    Drops every season saved by the Conferences class so the next request for
+    any season downloads the conference pages again.
+    """
+    with _conferences_lock:
+        _conferences_cache.clear()
+
+
 class Conference:
     """
     Find teams that participated in a particular conference.
@@ -55,7 +79,9 @@ class Conference:
             A string of the requested year to pull conference information from.
         """
         try:
-            return pq(CONFERENCE_URL % (conference_abbreviation, year))
+            return utils._pull_page(CONFERENCE_URL %
+                                    (conference_abbreviation, year),
+                                    revalidate=True)
         except HTTPError:
             return None
 
@@ -142,6 +168,10 @@ class Conferences:
     given team, or get more detailed information including all teams for each
     conference.
 
+    The conferences for the last ``CONFERENCES_CACHE_SIZE`` past seasons are
+    kept and reused by later instances for the same season. The current
+    season is always downloaded again, as its membership can still change.
+
     Parameters
     ----------
     year : string (optional)
@@ -184,7 +214,8 @@ class Conferences:
             Returns a PyQuery object of the conference HTML page.
         """
         try:
-            return pq(CONFERENCES_URL % year)
+            return utils._pull_page(CONFERENCES_URL % year,
+                                    revalidate=True)
         except HTTPError:
             return None
 
@@ -236,16 +267,32 @@ class Conferences:
             if not utils._url_exists(CONFERENCES_URL % year) and \
                utils._url_exists(CONFERENCES_URL % str(int(year) - 1)):
                 year = str(int(year) - 1)
+        cache_key = str(year)
+        with _conferences_lock:
+            cached = _conferences_cache.get(cache_key)
+            if cached:
+                _conferences_cache.move_to_end(cache_key)
+        if cached:
+            conferences, team_conference = cached
+            self._conferences = copy.deepcopy(conferences)
+            self._team_conference = dict(team_conference)
+            return
         page = self._pull_conference_page(year)
         if not page:
             output = ("Can't pull requested conference page. Ensure the "
                       "following URL exists: %s" % (CONFERENCES_URL % year))
             raise ValueError(output)
-        conferences = page('table#conference-summary tbody tr').items()
-        for conference in conferences:
-            conference_abbreviation = self._get_conference_id(conference)
-            conference_name = conference('td[data-stat="conf_name"]').text()
-            teams_dict = Conference(conference_abbreviation, year).teams
+        conferences = [(self._get_conference_id(conference),
+                        conference('td[data-stat="conf_name"]').text())
+                       for conference in
+                       page('table#conference-summary tbody tr').items()]
+        # Each conference page is independent, so download them concurrently
+        # rather than one after another.
+        conference_teams = utils._map_concurrently(
+            lambda conference: Conference(conference[0], year).teams,
+            conferences)
+        for (conference_abbreviation, conference_name), teams_dict in \
+                zip(conferences, conference_teams):
             conference_dict = {
                     'name': conference_name,
                     'teams': teams_dict
@@ -253,6 +300,16 @@ class Conferences:
             for team in teams_dict.keys():
                 self._team_conference[team] = conference_abbreviation
             self._conferences[conference_abbreviation] = conference_dict
+        if int(year) >= int(utils._find_year_for_season('ncaab')):
+            return
+        with _conferences_lock:
+            if CONFERENCES_CACHE_SIZE <= 0:
+                return
+            _conferences_cache[cache_key] = (copy.deepcopy(self._conferences),
+                                             dict(self._team_conference))
+            _conferences_cache.move_to_end(cache_key)
+            while len(_conferences_cache) > CONFERENCES_CACHE_SIZE:
+                _conferences_cache.popitem(last=False)
 
     @property
     def conferences(self):
@@ -331,3 +331,8 @@ NCAA_TOURNAMENT = 'NCAA'
 NIT_TOURNAMENT = 'NIT'
 CBI_TOURNAMENT = 'CBI'
 CIT_TOURNAMENT = 'CIT'
+
+# The version of the parser for this league's pages. Increment whenever the
+# way pages are parsed changes so previously parsed pages aren't reused. Any
+# change to the schemes above is detected automatically.
+PARSER_VERSION = 1
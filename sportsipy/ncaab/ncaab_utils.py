@@ -84,14 +84,16 @@ def _retrieve_all_teams(year, basic_stats=None, basic_opp_stats=None,
         if not utils._url_exists(BASIC_STATS_URL % year) and \
            utils._url_exists(BASIC_STATS_URL % str(int(year) - 1)):
             year = str(int(year) - 1)
-    doc = utils._pull_page(BASIC_STATS_URL % year, basic_stats)
-    teams_list = utils._get_stats_table(doc, 'table#basic_school_stats')
-    doc = utils._pull_page(BASIC_OPPONENT_STATS_URL % year, basic_opp_stats)
-    opp_list = utils._get_stats_table(doc, 'table#basic_opp_stats')
-    doc = utils._pull_page(ADVANCED_STATS_URL % year, adv_stats)
-    adv_teams_list = utils._get_stats_table(doc, 'table#adv_school_stats')
-    doc = utils._pull_page(ADVANCED_OPPONENT_STATS_URL % year, adv_opp_stats)
-    adv_opp_list = utils._get_stats_table(doc, 'table#adv_opp_stats')
+    basic_doc, opp_doc, adv_doc, adv_opp_doc = utils._pull_pages(
+        [(BASIC_STATS_URL % year, basic_stats),
+         (BASIC_OPPONENT_STATS_URL % year, basic_opp_stats),
+         (ADVANCED_STATS_URL % year, adv_stats),
+         (ADVANCED_OPPONENT_STATS_URL % year, adv_opp_stats)],
+        revalidate=True)
+    teams_list = utils._get_stats_table(basic_doc, 'table#basic_school_stats')
+    opp_list = utils._get_stats_table(opp_doc, 'table#basic_opp_stats')
+    adv_teams_list = utils._get_stats_table(adv_doc, 'table#adv_school_stats')
+    adv_opp_list = utils._get_stats_table(adv_opp_doc, 'table#adv_opp_stats')
     if not teams_list and not opp_list and not adv_teams_list \
        and not adv_opp_list:
         utils._no_data_found()
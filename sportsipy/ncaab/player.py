@@ -1,4 +1,3 @@
-import pandas as pd
 import re
 from functools import wraps
 from pyquery import PyQuery as pq
@@ -18,32 +17,38 @@ def _cleanup(prop):
 
 
 def _int_property_decorator(func):
-    @property
-    @wraps(func)
-    def wrapper(*args):
-        index = args[0]._index
-        prop = func(*args)
+    def season_value(player, index):
+        prop = func(player)
         value = _cleanup(prop[index])
         try:
             return int(value)
         except ValueError:
             # If there is no value, default to None
             return None
-    return wrapper
 
-
-def _float_property_decorator(func):
     @property
     @wraps(func)
     def wrapper(*args):
-        index = args[0]._index
-        prop = func(*args)
+        return season_value(args[0], args[0]._index)
+    wrapper.fget._season_value = season_value
+    return wrapper
+
+
+def _float_property_decorator(func):
+    def season_value(player, index):
+        prop = func(player)
         value = _cleanup(prop[index])
         try:
             return float(value)
         except ValueError:
             # If there is no value, default to None
             return None
+
+    @property
+    @wraps(func)
+    def wrapper(*args):
+        return season_value(args[0], args[0]._index)
+    wrapper.fget._season_value = season_value
     return wrapper
 
 
@@ -76,7 +81,6 @@ class AbstractPlayer:
         information will appear in one single string concatenated togather.
     """
     def __init__(self, player_id, player_name, player_data):
-        self._player_data = player_data
         self._player_id = player_id
         self._name = player_name
         self._minutes_played = None
@@ -168,7 +172,6 @@ class AbstractPlayer:
             if short_field == 'player_id' or \
                short_field == 'index' or \
                short_field == 'most_recent_season' or \
-               short_field == 'player_data' or \
                short_field == 'name' or \
                short_field == 'height' or \
                short_field == 'weight' or \
@@ -1,10 +1,10 @@
-import pandas as pd
 import re
 from functools import wraps
 from lxml.etree import ParserError
 from pyquery import PyQuery as pq
 from urllib.error import HTTPError
 from .. import utils
+from . import constants
 from .constants import PLAYER_SCHEME, PLAYER_URL, ROSTER_URL
 from .player import AbstractPlayer
 
@@ -21,32 +21,38 @@ def _cleanup(prop):
 
 
 def _int_property_decorator(func):
-    @property
-    @wraps(func)
-    def wrapper(*args):
-        index = args[0]._index
-        prop = func(*args)
+    def season_value(player, index):
+        prop = func(player)
         value = _cleanup(prop[index])
         try:
             return int(value)
         except ValueError:
             # If there is no value, default to None
             return None
-    return wrapper
-
 
-def _float_property_decorator(func):
     @property
     @wraps(func)
     def wrapper(*args):
-        index = args[0]._index
-        prop = func(*args)
+        return season_value(args[0], args[0]._index)
+    wrapper.fget._season_value = season_value
+    return wrapper
+
+
+def _float_property_decorator(func):
+    def season_value(player, index):
+        prop = func(player)
         value = _cleanup(prop[index])
         try:
             return float(value)
         except ValueError:
             # If there is no value, default to None
             return None
+
+    @property
+    @wraps(func)
+    def wrapper(*args):
+        return season_value(args[0], args[0]._index)
+    wrapper.fget._season_value = season_value
     return wrapper
 
 
@@ -90,8 +96,13 @@ class Player(AbstractPlayer):
         lowercase, 'last' is the player's last name in lowercase, and 'N' is a
         number starting at '1' for the first time that player ID has been used
         and increments by 1 for every successive player.
+    html : string (optional)
+        The raw HTML contents of the player's page if it has already been
+        downloaded, such as while pulling every player on a roster. The page
+        is not downloaded again when specified. An empty string indicates the
+        page could not be downloaded.
     """
-    def __init__(self, player_id):
+    def __init__(self, player_id, html=None):
         self._most_recent_season = ''
         self._index = None
         self._player_id = player_id
@@ -114,9 +125,16 @@ class Player(AbstractPlayer):
         self._defensive_box_plus_minus = None
         self._box_plus_minus = None
 
-        player_data = self._pull_player_data()
+        key = None
+        if utils._parsed_cache_directory is not None:
+            html, key = utils._parsed_cache_key(self._build_url(), constants,
+                                                html)
+            if utils._load_parsed_page(self, key):
+                return
+        player_data = self._pull_player_data(html)
         self._find_initial_index()
         AbstractPlayer.__init__(self, player_id, self._name, player_data)
+        utils._save_parsed_page(self, key)
 
     def __str__(self):
         """
@@ -130,24 +148,49 @@ class Player(AbstractPlayer):
         """
         return self.__str__()
 
-    def _retrieve_html_page(self):
+    def _build_url(self):
+        """
+        Create the player's URL to pull stats from.
+
+        The player's URL requires the player ID.
+
+        Returns
+        -------
+        string
+            The string URL for the player's stats page.
+        """
+        return PLAYER_URL % self._player_id
+
+    def _retrieve_html_page(self, html=None):
         """
         Download the requested player's stats page.
 
         Download the requested page and strip all of the comment tags before
         returning a pyquery object which will be used to parse the data.
 
+        Parameters
+        ----------
+        html : string (optional)
+            The raw HTML contents of the page if it has already been
+            downloaded. An empty string indicates the page could not be
+            downloaded.
+
         Returns
         -------
         PyQuery object
             The requested page is returned as a queriable PyQuery object with
             the comment tags removed.
         """
-        url = PLAYER_URL % self._player_id
-        try:
-            url_data = pq(url)
-        except (HTTPError, ParserError):
-            return None
+        if html is not None:
+            if not html:
+                return None
+            url_data = html
+        else:
+            url = self._build_url()
+            try:
+                url_data = utils._pull_page(url)
+            except (HTTPError, ParserError):
+                return None
         return pq(utils._remove_html_comment_tags(url_data))
 
     def _parse_season(self, row):
@@ -335,7 +378,7 @@ class Player(AbstractPlayer):
         team = re.sub(r'/.*', '', team)
         return team
 
-    def _pull_player_data(self):
+    def _pull_player_data(self, html=None):
         """
         Pull and aggregate all player information.
 
@@ -344,6 +387,12 @@ class Player(AbstractPlayer):
         all seasons plus the player's career stats into a single object which
         can easily be iterated upon.
 
+        Parameters
+        ----------
+        html : string (optional)
+            The raw HTML contents of the player's stats page if it has
+            already been downloaded.
+
         Returns
         -------
         dictionary
@@ -351,7 +400,7 @@ class Player(AbstractPlayer):
             is a string of the season and the value is the season's associated
             stats.
         """
-        player_info = self._retrieve_html_page()
+        player_info = self._retrieve_html_page(html)
         self._parse_player_information(player_info)
         self._parse_player_position(player_info)
         all_stats = self._combine_all_stats(player_info)
@@ -403,6 +452,29 @@ class Player(AbstractPlayer):
             index += 1
         return self
 
+    def for_season(self, requested_season=''):
+        """
+        Return a view of the player's stats for a single season.
+
+        Unlike calling the class instance, the requested season is selected on
+        a lightweight copy of the player which shares the parsed stats, so the
+        player itself is never modified. This allows a single instance to be
+        shared between threads which each read a different season.
+
+        Parameters
+        ----------
+        requested_season : string (optional)
+            A string of the requested season to query, such as '2017-18'. If
+            left blank or 'Career' is passed, the career stats will be used for
+            stats queries.
+
+        Returns
+        -------
+        Player class instance
+            Returns a new instance referencing the requested season's stats.
+        """
+        return utils._season_view(self)(requested_season)
+
     def _dataframe_fields(self):
         """
         Creates a dictionary of all fields to include with DataFrame.
@@ -481,15 +553,7 @@ class Player(AbstractPlayer):
         properties and values where each index is a different season plus the
         career stats.
         """
-        temp_index = self._index
-        rows = []
-        indices = []
-        for season in self._season:
-            self._index = self._season.index(season)
-            rows.append(self._dataframe_fields())
-            indices.append(season)
-        self._index = temp_index
-        return pd.DataFrame(rows, index=[indices])
+        return utils._career_dataframe(self)
 
     @property
     def season(self):
@@ -652,10 +716,17 @@ class Roster:
         the name and player ID for each player as opposed to all of their
         respective stats which greatly reduces the time to return a response if
         just the names and IDs are desired. Defaults to False.
+    processes : int (optional)
+        An ``int`` of the number of worker processes to parse the players'
+        pages in when ``slim`` is False. The pages are still downloaded on
+        background threads, while each page is parsed in one of the worker
+        processes so parsing scales with the number of cores. The pages are
+        parsed in the current process if not specified.
     """
-    def __init__(self, team, year=None, slim=False):
+    def __init__(self, team, year=None, slim=False, processes=None):
         self._team = team
         self._slim = slim
+        self._processes = processes
         self._coach = None
         if slim:
             self._players = {}
@@ -695,7 +766,7 @@ class Roster:
             Returns a PyQuery object of the team's HTML page.
         """
         try:
-            return pq(url)
+            return utils._pull_page(url)
         except HTTPError:
             return None
 
@@ -815,6 +886,7 @@ class Roster:
             output = ("Can't pull requested team page. Ensure the following "
                       "URL exists: %s" % url)
             raise ValueError(output)
+        player_ids = []
         players = page('table#roster tbody tr').items()
         for player in players:
             player_id = self._get_id(player)
@@ -822,9 +894,11 @@ class Roster:
                 name = self._get_name(player)
                 self._players[player_id] = name
             else:
-                player_instance = Player(player_id)
-                self._players.append(player_instance)
+                player_ids.append(player_id)
 
+        if not self._slim:
+            self._players = utils._create_players(Player, player_ids,
+                                                  self._processes)
         self._coach = self._parse_coach(page)
 
     @property
@@ -1,15 +1,14 @@
-import pandas as pd
 import re
 from ..decorators import int_property_decorator
-from .constants import (SCHEDULE_SCHEME,
+from .constants import (BOXSCORE_URL,
+                        SCHEDULE_SCHEME,
                         SCHEDULE_URL,
                         NCAA_TOURNAMENT,
                         NIT_TOURNAMENT,
                         CBI_TOURNAMENT,
                         CIT_TOURNAMENT)
-from datetime import datetime
-from pyquery import PyQuery as pq
 from sportsipy import utils
+from sportsipy.utils import pd
 from sportsipy.constants import (WIN,
                                  LOSS,
                                  HOME,
@@ -145,6 +144,38 @@ class Game:
             value = utils._parse_field(SCHEDULE_SCHEME, game_data, short_name)
             setattr(self, field, value)
 
+    def _parse_datetime(self):
+        """
+        Parse the date and time the game took place.
+
+        The result is saved by the 'datetime' property, so the date is only
+        parsed once regardless of how many times it is requested.
+
+        Returns
+        -------
+        datetime
+            A datetime object of when the game took place.
+        """
+        # Sometimes, the time isn't displayed on the game page. In this case,
+        # the time property will be empty, causing the time parsing to fail as
+        # it can't match the expected format. To prevent the issue, and since
+        # the time can't properly be parsed, a default start time of midnight
+        # should be used in this scenario, allowing users to decide if and how
+        # they want to handle the time being empty.
+        if not self._time or self._time.upper() == '':
+            time = '12:00A'
+        else:
+            time = self._time.upper()
+        date_string = '%s %s' % (self._date, time)
+        date_string = re.sub(r'/.*', '', date_string)
+        date_string = re.sub(r' ET', '', date_string)
+        date_string += 'M'
+        date_string = re.sub(r'PMM', 'PM', date_string, flags=re.IGNORECASE)
+        date_string = re.sub(r'AMM', 'AM', date_string, flags=re.IGNORECASE)
+        date_string = re.sub(r' PM', 'PM', date_string, flags=re.IGNORECASE)
+        date_string = re.sub(r' AM', 'AM', date_string, flags=re.IGNORECASE)
+        return utils._parse_datetime(date_string, '%a, %b %d, %Y %I:%M%p')
+
     @property
     def dataframe(self):
         """
@@ -209,25 +240,9 @@ class Game:
         Returns a datetime object to indicate the month, day, year, and time
         the requested game took place.
         """
-        # Sometimes, the time isn't displayed on the game page. In this case,
-        # the time property will be empty, causing the time parsing to fail as
-        # it can't match the expected format. To prevent the issue, and since
-        # the time can't properly be parsed, a default start time of midnight
-        # should be used in this scenario, allowing users to decide if and how
-        # they want to handle the time being empty.
-        if not self._time or self._time.upper() == '':
-            time = '12:00A'
-        else:
-            time = self._time.upper()
-        date_string = '%s %s' % (self._date, time)
-        date_string = re.sub(r'/.*', '', date_string)
-        date_string = re.sub(r' ET', '', date_string)
-        date_string += 'M'
-        date_string = re.sub(r'PMM', 'PM', date_string, flags=re.IGNORECASE)
-        date_string = re.sub(r'AMM', 'AM', date_string, flags=re.IGNORECASE)
-        date_string = re.sub(r' PM', 'PM', date_string, flags=re.IGNORECASE)
-        date_string = re.sub(r' AM', 'AM', date_string, flags=re.IGNORECASE)
-        return datetime.strptime(date_string, '%a, %b %d, %Y %I:%M%p')
+        if self._datetime is None:
+            self._datetime = self._parse_datetime()
+        return self._datetime
 
     @property
     def time(self):
@@ -416,6 +431,8 @@ class Schedule:
     """
     def __init__(self, abbreviation, year=None):
         self._games = []
+        self._games_by_date = None
+        self._datetimes = None
         self._pull_schedule(abbreviation, year)
 
     def __getitem__(self, index):
@@ -463,12 +480,12 @@ class Schedule:
             If the requested date cannot be matched with a game in the
             schedule.
         """
-        for game in self._games:
-            if game.datetime.year == date.year and \
-               game.datetime.month == date.month and \
-               game.datetime.day == date.day:
-                return game
-        raise ValueError('No games found for requested date')
+        if self._games_by_date is None:
+            self._games_by_date = self._index_games()
+        game = self._games_by_date.get((date.year, date.month, date.day))
+        if not game:
+            raise ValueError('No games found for requested date')
+        return game
 
     def __str__(self):
         """
@@ -494,6 +511,32 @@ class Schedule:
         """Returns the number of scheduled games for the given team."""
         return len(self._games)
 
+    def _index_games(self):
+        """
+        Index every game in the schedule by the date it was played.
+
+        Maps the date of every game to the first game played on that date so
+        games can be found without searching the entire schedule and parsing
+        every game's date on each request.
+
+        Returns
+        -------
+        dictionary
+            A ``dictionary`` where each key is a ``tuple`` of the year, month,
+            and day, and each value is the first Game instance played on that
+            date.
+        """
+        games_by_date = {}
+        for game in self._games:
+            try:
+                date = game.datetime
+            except (AttributeError, TypeError, ValueError):
+                continue
+            if not date:
+                continue
+            games_by_date.setdefault((date.year, date.month, date.day), game)
+        return games_by_date
+
     def _pull_schedule(self, abbreviation, year):
         """
         Download and create objects for the team's schedule.
@@ -521,7 +564,8 @@ class Schedule:
                utils._url_exists(SCHEDULE_URL % (abbreviation.lower(),
                                                  str(int(year) - 1))):
                 year = str(int(year) - 1)
-        doc = pq(SCHEDULE_URL % (abbreviation.lower(), year))
+        doc = utils._pull_page(SCHEDULE_URL % (abbreviation.lower(),
+                                               year), revalidate=True)
         schedule = utils._get_stats_table(doc, 'table#schedule')
         if not schedule:
             utils._no_data_found()
@@ -565,3 +609,117 @@ class Schedule:
         if frames == []:
             return None
         return pd.concat(frames)
+
+    def boxscores(self, window=utils.PREFETCH_WINDOW, processes=None):
+        """
+        Returns a generator of the Boxscore class for every game in the
+        schedule which has been played, in order. While one game's boxscore is
+        being parsed, the pages for up to ``window`` of the following games are
+        downloaded in the background so network time overlaps with parsing. No
+        more than ``window`` downloaded pages are held in memory at once.
+
+        Parameters
+        ----------
+        window : int (optional)
+            The maximum number of boxscore pages to download ahead of the game
+            currently being parsed.
+        processes : int (optional)
+            An ``int`` of the number of worker processes to parse the
+            boxscores in. Pages are still downloaded on background threads,
+            while each page is parsed in one of the worker processes so
+            parsing scales with the number of cores. At least one page per
+            process is downloaded ahead. The boxscores are parsed in the
+            current process if not specified.
+
+        Returns
+        -------
+        generator
+            A generator of Boxscore instances for every game in the schedule
+            which has been played.
+        """
+        # Games which haven't been played yet don't have a boxscore and are
+        # skipped, matching the 'dataframe_extended' property.
+        games = [game for game in self._games
+                 if game._points_for is not None or
+                 game._points_against is not None]
+        urls = [BOXSCORE_URL % game.boxscore_index for game in games]
+        if processes:
+            window = max(window, processes)
+        pages = utils._prefetch_pages(urls, window)
+        if processes:
+            arguments = ((game.boxscore_index, html)
+                         for game, html in zip(games, pages))
+            yield from utils._parse_in_processes(Boxscore, arguments,
+                                                 processes, window)
+            return
+        for game, html in zip(games, pages):
+            yield Boxscore(game.boxscore_index, html)
+
+    def pipelined_dataframe_extended(self, window=utils.PREFETCH_WINDOW,
+                                     processes=None):
+        """
+        Returns a pandas DataFrame where each row is a representation of the
+        Boxscore class for every game in the schedule, identical to the
+        'dataframe_extended' property. Boxscore pages for upcoming games are
+        downloaded in the background while the current game is parsed, which
+        is considerably faster for full seasons.
+
+        Parameters
+        ----------
+        window : int (optional)
+            The maximum number of boxscore pages to download ahead of the game
+            currently being parsed.
+        processes : int (optional)
+            An ``int`` of the number of worker processes to parse the
+            boxscores in. Pages are still downloaded on background threads,
+            while each page is parsed in one of the worker processes so
+            parsing scales with the number of cores. At least one page per
+            process is downloaded ahead. The boxscores are parsed in the
+            current process if not specified.
+
+        Returns
+        -------
+        DataFrame
+            A pandas DataFrame of every boxscore in the schedule, indexed by
+            the boxscore string.
+        """
+        frames = []
+        for boxscore in self.boxscores(window, processes):
+            df = boxscore.dataframe
+            if df is not None:
+                frames.append(df)
+        if frames == []:
+            return None
+        return pd.concat(frames)
+
+    @property
+    def datetimes(self):
+        """
+        Returns a ``numpy array`` of the datetime every game in the schedule
+        took place as ``datetime64`` values, in the same order as the games.
+        Games without a valid date are ``NaT``. The array is only created once
+        and allows games to be filtered and sorted by date in bulk.
+        """
+        if self._datetimes is None:
+            self._datetimes = utils._datetime_array(self._games)
+        return self._datetimes
+
+    def games_between(self, start_date, end_date):
+        """
+        Return all games played within a range of dates.
+
+        Parameters
+        ----------
+        start_date : datetime
+            A datetime object of the earliest date and time to include.
+        end_date : datetime
+            A datetime object of the latest date and time to include.
+
+        Returns
+        -------
+        list
+            A ``list`` of Game instances played between the two dates,
+            inclusive, sorted in chronological order.
+        """
+        return utils._games_between(self._games, self.datetimes, start_date,
+                                    end_date)
@@ -351,3 +351,8 @@ CFP_RANKINGS_URL = 'https://www.sports-reference.com/cfb/years/%s-polls.html'
 RANKINGS_URL = 'https://www.sports-reference.com/cfb/years/%s-polls.html'
 PLAYER_URL = 'https://www.sports-reference.com/cfb/players/%s.html'
 ROSTER_URL = 'https://www.sports-reference.com/cfb/schools/%s/%s-roster.html'
+
+# The version of the parser for this league's pages. Increment whenever the
+# way pages are parsed changes so previously parsed pages aren't reused. Any
+# change to the schemes above is detected automatically.
+PARSER_VERSION = 1
@@ -84,11 +84,13 @@ def _retrieve_all_teams(year, season_page, offensive_stats, defensive_stats):
         if not utils._url_exists(SEASON_PAGE_URL % year) and \
            utils._url_exists(SEASON_PAGE_URL % str(int(year) - 1)):
             year = str(int(year) - 1)
-    doc = utils._pull_page(SEASON_PAGE_URL % year, season_page)
+    doc, offense_doc, defense_doc = utils._pull_pages(
+        [(SEASON_PAGE_URL % year, season_page),
+         (OFFENSIVE_STATS_URL % year, offensive_stats),
+         (DEFENSIVE_STATS_URL % year, defensive_stats)],
+        revalidate=True)
     teams_list = utils._get_stats_table(doc, 'div#div_standings')
-    offense_doc = utils._pull_page(OFFENSIVE_STATS_URL % year, offensive_stats)
     offense_list = utils._get_stats_table(offense_doc, 'table#offense')
-    defense_doc = utils._pull_page(DEFENSIVE_STATS_URL % year, defensive_stats)
     defense_list = utils._get_stats_table(defense_doc, 'table#defense')
     if not teams_list and not offense_list and not defense_list:
         utils._no_data_found()
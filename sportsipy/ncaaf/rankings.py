@@ -1,5 +1,4 @@
 import re
-from pyquery import PyQuery as pq
 from urllib.error import HTTPError
 from .. import utils
 from .constants import CFP_RANKINGS_URL, RANKINGS_SCHEME, RANKINGS_URL
@@ -54,7 +53,8 @@ class Rankings:
             Returns a PyQuery object of the rankings HTML page.
         """
         try:
-            return pq(RANKINGS_URL % year)
+            return utils._pull_page(RANKINGS_URL % year,
+                                    revalidate=True)
         except HTTPError:
             return None
 
@@ -269,7 +269,8 @@ class CFPRankings:
             Returns a PyQuery object of the rankings HTML page.
         """
         try:
-            return pq(RANKINGS_URL % year)
+            return utils._pull_page(RANKINGS_URL % year,
+                                    revalidate=True)
         except HTTPError:
             return None
 
@@ -1,8 +1,8 @@
-import pandas as pd
 import re
 from .constants import PARSING_SCHEME
 from ..decorators import float_property_decorator, int_property_decorator
 from .. import utils
+from ..utils import pd
 from .conferences import Conferences
 from .ncaaf_utils import _retrieve_all_teams
 from .roster import Roster
@@ -758,6 +758,7 @@ class Teams:
     def __init__(self, year=None, season_page=None, offensive_stats=None,
                  defensive_stats=None):
         self._teams = []
+        self._teams_by_abbreviation = {}
         self._conferences_dict = Conferences(year, True).team_conference
 
         team_data_dict, year = _retrieve_all_teams(year, season_page,
@@ -788,10 +789,10 @@ class Teams:
         ValueError
             If the requested team is not present within the Teams list.
         """
-        for team in self._teams:
-            if team.abbreviation.upper() == abbreviation.upper():
-                return team
-        raise ValueError('Team abbreviation %s not found' % abbreviation)
+        team = self._teams_by_abbreviation.get(abbreviation.upper())
+        if not team:
+            raise ValueError('Team abbreviation %s not found' % abbreviation)
+        return team
 
     def __call__(self, abbreviation):
         """
@@ -862,6 +863,48 @@ class Teams:
                         team_conference=conference,
                         year=year)
             self._teams.append(team)
+            if team.abbreviation:
+                self._teams_by_abbreviation.setdefault(
+                    team.abbreviation.upper(), team)
+
+    @classmethod
+    def range(cls, start_year, end_year, workers=utils.MAX_WORKERS,
+              processes=None):
+        """
+        Pull the stats for every NCAA Football team over a range of seasons.
+
+        Every season is pulled at the same time, rather than creating a
+        separate Teams instance for each season one after another.
+
+        Every page is downloaded through one shared pool which starts no more
+        than ``planner.REQUESTS_PER_MINUTE`` downloads per minute, so pulling
+        many seasons at once stays within the sports-reference.com rate
+        limit. Downloads made by other threads in the meantime share the same
+        limit.
+
+        Parameters
+        ----------
+        start_year : string or int
+            The first season to pull.
+        end_year : string or int
+            The last season to pull, inclusive.
+        workers : int (optional)
+            An ``int`` of the maximum number of seasons to pull at once.
+        processes : int (optional)
+            An ``int`` of the number of worker processes to pull the seasons
+            in, so each season page is parsed on a separate core. Takes the
+            place of ``workers`` when specified.
+
+        Returns
+        -------
+        DataFrame
+            Returns a pandas ``DataFrame`` where each row is a representation
+            of the Team class for a single season, with an additional 'year'
+            column identifying the season. Rows are indexed by the team
+            abbreviation. Returns None if no stats could be found.
+        """
+        return utils._seasons_dataframe(cls, start_year, end_year, workers,
+                                        processes)
 
     @property
     def dataframes(self):
@@ -417,3 +417,8 @@ LOST_DIVISIONAL = 'Lost Divisional'
 LOST_CONF_CHAMPS = 'Lost Conference Championship'
 LOST_SUPER_BOWL = 'Lost Super Bowl'
 WON_SUPER_BOWL = 'Won Super Bowl'
+
+# The version of the parser for this league's pages. Increment whenever the
+# way pages are parsed changes so previously parsed pages aren't reused. Any
+# change to the schemes above is detected automatically.
+PARSER_VERSION = 1
@@ -77,7 +77,8 @@ def _retrieve_all_teams(year, season_page=None):
         if not utils._url_exists(SEASON_PAGE_URL % year) and \
            utils._url_exists(SEASON_PAGE_URL % str(int(year) - 1)):
             year = str(int(year) - 1)
-    doc = utils._pull_page(SEASON_PAGE_URL % year, season_page)
+    doc = utils._pull_page(SEASON_PAGE_URL % year, season_page,
+                           revalidate=True)
     teams_list = utils._get_stats_table(doc, 'div#all_team_stats')
     afc_list = utils._get_stats_table(doc, 'table#AFC')
     nfc_list = utils._get_stats_table(doc, 'table#NFC')
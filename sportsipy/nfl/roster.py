@@ -1,10 +1,10 @@
-import pandas as pd
 import re
 from functools import wraps
 from lxml.etree import ParserError, XMLSyntaxError
 from pyquery import PyQuery as pq
 from urllib.error import HTTPError
 from .. import utils
+from . import constants
 from .constants import PLAYER_SCHEME, PLAYER_URL, ROSTER_URL, DETAILED_STATS
 from .player import AbstractPlayer
 
@@ -22,38 +22,42 @@ def _cleanup(prop):
 
 
 def _int_property_decorator(func):
-    @property
-    @wraps(func)
-    def wrapper(*args):
+    def season_value(player, index):
         if func.__name__ in DETAILED_STATS:
-            index = args[0]._detailed_stats_index
-        else:
-            index = args[0]._index
-        prop = func(*args)
+            index = player._detailed_stats_index
+        prop = func(player)
         try:
             value = _cleanup(prop[index])
             return int(value)
         except (ValueError, TypeError, IndexError):
             # If there is no value, default to None
             return None
-    return wrapper
-
 
-def _float_property_decorator(func):
     @property
     @wraps(func)
     def wrapper(*args):
+        return season_value(args[0], args[0]._index)
+    wrapper.fget._season_value = season_value
+    return wrapper
+
+
+def _float_property_decorator(func):
+    def season_value(player, index):
         if func.__name__ in DETAILED_STATS:
-            index = args[0]._detailed_stats_index
-        else:
-            index = args[0]._index
-        prop = func(*args)
+            index = player._detailed_stats_index
+        prop = func(player)
         try:
             value = _cleanup(prop[index])
             return float(value)
         except (ValueError, TypeError, IndexError):
             # If there is no value, default to None
             return None
+
+    @property
+    @wraps(func)
+    def wrapper(*args):
+        return season_value(args[0], args[0]._index)
+    wrapper.fget._season_value = season_value
     return wrapper
 
 
@@ -81,8 +85,13 @@ class Player(AbstractPlayer):
         the player's first name where the first letter is capitalized, and 'NN'
         is a number starting at '00' for the first time that player ID has been
         used and increments by 1 for every successive player.
+    html : string (optional)
+        The raw HTML contents of the player's page if it has already been
+        downloaded, such as while pulling every player on a roster. The page
+        is not downloaded again when specified. An empty string indicates the
+        page could not be downloaded.
     """
-    def __init__(self, player_id):
+    def __init__(self, player_id, html=None):
         self._most_recent_season = ''
         self._detailed_stats_seasons = None
         self._index = None
@@ -223,11 +232,18 @@ class Player(AbstractPlayer):
         self._assists_on_tackles = None
         self._safeties = None
 
-        player_data = self._pull_player_data()
+        key = None
+        if utils._parsed_cache_directory is not None:
+            html, key = utils._parsed_cache_key(self._build_url(), constants,
+                                                html)
+            if utils._load_parsed_page(self, key):
+                return
+        player_data = self._pull_player_data(html)
         if not player_data:
             return
         self._find_initial_index()
         AbstractPlayer.__init__(self, player_id, self._name, player_data)
+        utils._save_parsed_page(self, key)
 
     def __str__(self):
         """
@@ -258,7 +274,7 @@ class Player(AbstractPlayer):
         first_character = self._player_id[0]
         return PLAYER_URL % (first_character, self._player_id)
 
-    def _retrieve_html_page(self):
+    def _retrieve_html_page(self, html=None):
         """
         Download the requested player's stats page.
 
@@ -267,17 +283,29 @@ class Player(AbstractPlayer):
         Oftentimes, important data is contained in tables which are hidden in
         HTML comments and not accessible via PyQuery.
 
+        Parameters
+        ----------
+        html : string (optional)
+            The raw HTML contents of the page if it has already been
+            downloaded. An empty string indicates the page could not be
+            downloaded.
+
         Returns
         -------
         PyQuery object
             The requested page is returned as a queriable PyQuery object with
             the comment tags removed.
         """
-        url = self._build_url()
-        try:
-            url_data = pq(url)
-        except (HTTPError, ParserError):
-            return None
+        if html is not None:
+            if not html:
+                return None
+            url_data = html
+        else:
+            url = self._build_url()
+            try:
+                url_data = utils._pull_page(url)
+            except (HTTPError, ParserError):
+                return None
         # For NFL, a 404 page doesn't actually raise a 404 error, so it needs
         # to be manually checked.
         if 'Page Not Found (404 error)' in str(url_data):
@@ -444,7 +472,7 @@ class Player(AbstractPlayer):
         birth_date = player_info('span#necro-birth').attr('data-birth')
         setattr(self, '_birth_date', birth_date)
 
-    def _pull_player_data(self):
+    def _pull_player_data(self, html=None):
         """
         Pull and aggregate all player information.
 
@@ -453,6 +481,12 @@ class Player(AbstractPlayer):
         seasons plus the player's career stats into a single object which can
         easily be iterated upon.
 
+        Parameters
+        ----------
+        html : string (optional)
+            The raw HTML contents of the player's stats page if it has
+            already been downloaded.
+
         Returns
         -------
         dictionary
@@ -460,7 +494,7 @@ class Player(AbstractPlayer):
             is a string of the season and the value is the seaon's associated
             stats.
         """
-        player_info = self._retrieve_html_page()
+        player_info = self._retrieve_html_page(html)
         if not player_info:
             return
         all_stats = self._combine_all_stats(player_info)
@@ -524,6 +558,29 @@ class Player(AbstractPlayer):
             detailed_index += 1
         return self
 
+    def for_season(self, requested_season=''):
+        """
+        Return a view of the player's stats for a single season.
+
+        Unlike calling the class instance, the requested season is selected on
+        a lightweight copy of the player which shares the parsed stats, so the
+        player itself is never modified. This allows a single instance to be
+        shared between threads which each read a different season.
+
+        Parameters
+        ----------
+        requested_season : string (optional)
+            A string of the requested season to query, such as '2017'. If left
+            blank or 'Career' is passed, the career stats will be used for
+            stats queries.
+
+        Returns
+        -------
+        Player class instance
+            Returns a new instance referencing the requested season's stats.
+        """
+        return utils._season_view(self)(requested_season)
+
     def _dataframe_fields(self):
         """
         Creates a dictionary of all fields to include with DataFrame.
@@ -700,17 +757,9 @@ class Player(AbstractPlayer):
         properties and values where each index is a different season plus the
         career stats.
         """
-        temp_index = self._index
-        rows = []
-        indices = []
         if not self._season:
             return None
-        for season in self._season:
-            self._index = self._season.index(season)
-            rows.append(self._dataframe_fields())
-            indices.append(season)
-        self._index = temp_index
-        return pd.DataFrame(rows, index=[indices])
+        return utils._career_dataframe(self)
 
     @property
     def season(self):
@@ -1704,10 +1753,17 @@ class Roster:
         the name and player ID for each player as opposed to all of their
         respective stats which greatly reduces the time to return a response if
         just the names and IDs are desired. Defaults to False.
+    processes : int (optional)
+        An ``int`` of the number of worker processes to parse the players'
+        pages in when ``slim`` is False. The pages are still downloaded on
+        background threads, while each page is parsed in one of the worker
+        processes so parsing scales with the number of cores. The pages are
+        parsed in the current process if not specified.
     """
-    def __init__(self, team, year=None, slim=False):
+    def __init__(self, team, year=None, slim=False, processes=None):
         self._team = team
         self._slim = slim
+        self._processes = processes
         self._coach = None
         if slim:
             self._players = {}
@@ -1747,7 +1803,8 @@ class Roster:
             Returns a PyQuery object of the team's HTML page.
         """
         try:
-            return pq(utils._remove_html_comment_tags(pq(url)))
+            return pq(utils._remove_html_comment_tags(
+                utils._pull_page(url)))
         except HTTPError:
             return None
 
@@ -1867,15 +1924,18 @@ class Roster:
             output = ("Can't pull requested team page. Ensure the following "
                       "URL exists: %s" % url)
             raise ValueError(output)
+        player_ids = []
         for player in page('table#roster tbody tr').items():
             player_id = self._get_id(player)
             if self._slim:
                 name = self._get_name(player)
                 self._players[player_id] = name
             else:
-                player_instance = Player(player_id)
-                self._players.append(player_instance)
+                player_ids.append(player_id)
 
+        if not self._slim:
+            self._players = utils._create_players(Player, player_ids,
+                                                  self._processes)
         self._coach = self._parse_coach(page)
 
     @property
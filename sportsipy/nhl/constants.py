@@ -243,3 +243,8 @@ ROSTER_URL = 'https://www.hockey-reference.com/teams/%s/%s.html'
 
 SHOOTOUT = -1
 OVERTIME_LOSS = 'OTL'
+
+# The version of the parser for this league's pages. Increment whenever the
+# way pages are parsed changes so previously parsed pages aren't reused. Any
+# change to the schemes above is detected automatically.
+PARSER_VERSION = 1
@@ -1,4 +1,3 @@
-import pandas as pd
 from functools import wraps
 from lxml.etree import ParserError, XMLSyntaxError
 from pyquery import PyQuery as pq
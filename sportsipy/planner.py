@@ -0,0 +1,553 @@
+import os
+import requests
+import shutil
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from hashlib import sha256
+from importlib import import_module
+from urllib.error import HTTPError
+from . import utils
+from .sync import LEAGUES
+
+
+# sports-reference.com blocks clients which make more than 20 requests per
+# minute, so plans are executed at this rate by default.
+REQUESTS_PER_MINUTE = 20
+# The kinds of entities which can be requested in a plan. Entities of every
+# other kind are built from one of these, such as a team's players from its
+# roster.
+KINDS = ['teams', 'schedule', 'boxscores', 'roster']
+# The number of times a page is requested again after a temporary failure,
+# such as the server throttling requests or timing out, before giving up.
+MAX_RETRIES = 3
+# The number of seconds to wait before the first retry. The delay doubles
+# after each failed attempt unless the server specifies how long to wait.
+RETRY_DELAY = 30
+# Status codes which indicate a temporary failure worth retrying.
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+class _PagePool:
+    """
+    Store downloaded pages on disk so each page is only downloaded once.
+
+    Pages are saved to files in a directory rather than held in memory, as a
+    plan can easily contain several gigabytes of pages. Downloads are spaced
+    out evenly so no more than the requested number of downloads start in
+    any minute, regardless of the number of threads downloading pages.
+
+    Parameters
+    ----------
+    directory : string
+        A ``string`` of the path to the directory to save pages in.
+    requests_per_minute : int
+        An ``int`` of the maximum number of pages to download per minute, or
+        None to download pages as quickly as possible.
+    """
+    def __init__(self, directory, requests_per_minute):
+        self._directory = directory
+        self._requests_per_minute = requests_per_minute
+        self._interval = 0.0
+        if requests_per_minute:
+            self._interval = 60.0 / requests_per_minute
+        self._next_request = 0.0
+        self._pages = {}
+        self._lock = threading.Lock()
+        self.requests = 0
+
+    def __contains__(self, url):
+        return url in self._pages
+
+    def worker_arguments(self, workers):
+        """
+        Find the arguments for pools in worker processes downloading pages.
+
+        Each worker process needs its own pool, which saves pages to the same
+        directory as this pool. The rate limit is split evenly between the
+        workers so every worker combined stays within this pool's limit.
+
+        Parameters
+        ----------
+        workers : int
+            An ``int`` of the number of worker processes.
+
+        Returns
+        -------
+        tuple
+            Returns a ``tuple`` of the arguments to pass to
+            ``_start_worker_pool`` in each worker process.
+        """
+        requests_per_minute = self._requests_per_minute
+        if requests_per_minute:
+            requests_per_minute = requests_per_minute / max(int(workers), 1)
+        return self._directory, requests_per_minute
+
+    def _wait_for_turn(self):
+        """
+        Wait until another page can be downloaded within the rate limit.
+        """
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_request)
+            self._next_request = start + self._interval
+            self.requests += 1
+        if start > now:
+            time.sleep(start - now)
+
+    def _pause(self, seconds):
+        """
+        Delay every following download by at least the given time.
+
+        Parameters
+        ----------
+        seconds : float
+            A ``float`` of the number of seconds to wait before the next page
+            is downloaded by any thread.
+        """
+        with self._lock:
+            self._next_request = max(self._next_request,
+                                     time.monotonic() + seconds)
+
+    def _retry_delay(self, error, attempt):
+        """
+        Find how long to wait before requesting a page again.
+
+        Parameters
+        ----------
+        error : Exception
+            The ``HTTPError`` or ``RequestException`` raised by the failed
+            request.
+        attempt : int
+            An ``int`` of the number of attempts which have already failed.
+
+        Returns
+        -------
+        float
+            Returns a ``float`` of the number of seconds to wait, or None if
+            the request shouldn't be retried.
+        """
+        if attempt > MAX_RETRIES:
+            return None
+        delay = RETRY_DELAY * 2 ** (attempt - 1)
+        if not isinstance(error, HTTPError):
+            return delay
+        if error.code not in RETRY_STATUS_CODES:
+            return None
+        headers = error.headers or {}
+        try:
+            return float(headers.get('Retry-After'))
+        except (TypeError, ValueError):
+            return delay
+
+    def fetch(self, url):
+        """
+        Download a page unless it has already been downloaded.
+
+        Temporary failures are retried with an increasing delay, during which
+        no other pages are downloaded. A page is only remembered as missing
+        if the server reports it doesn't exist.
+
+        Parameters
+        ----------
+        url : string
+            A ``string`` of the URL of the page to download.
+
+        Raises
+        ------
+        HTTPError
+            Raises an ``HTTPError`` if the server responds with an
+            unsuccessful status code which isn't temporary, or a temporary one
+            after every retry.
+        RequestException
+            Raises a ``RequestException`` if the request still can't be
+            completed after every retry.
+        """
+        if url in self._pages:
+            return
+        attempt = 0
+        while True:
+            self._wait_for_turn()
+            try:
+                html = utils._request_page(url)
+                break
+            except (HTTPError, requests.exceptions.RequestException) as error:
+                attempt += 1
+                delay = self._retry_delay(error, attempt)
+                if delay is None:
+                    raise
+                self._pause(delay)
+        path = ''
+        if html:
+            name = sha256(url.encode('utf8')).hexdigest()
+            path = os.path.join(self._directory, '%s.html' % name)
+            # Pools in several processes can share a directory, so the page
+            # is written to a temporary file first to never expose a partial
+            # page to another process.
+            temporary = '%s.%s.%s.tmp' % (path, os.getpid(),
+                                          threading.get_ident())
+            with open(temporary, 'w', encoding='utf8') as filehandle:
+                filehandle.write(html)
+            os.replace(temporary, path)
+        with self._lock:
+            self._pages[url] = path
+
+    def page(self, url):
+        """
+        Read a page, downloading it first if it isn't in the pool yet.
+
+        Parameters
+        ----------
+        url : string
+            A ``string`` of the URL of the page to read.
+
+        Returns
+        -------
+        string
+            Returns a ``string`` of the raw HTML contents of the page, or an
+            empty ``string`` if the page doesn't exist.
+        """
+        self.fetch(url)
+        path = self._pages[url]
+        if not path:
+            return ''
+        with open(path, 'r', encoding='utf8') as filehandle:
+            return filehandle.read()
+
+
+def _start_worker_pool(directory, requests_per_minute):
+    """
+    Download every page in a worker process through a page pool.
+
+    Used as the initializer of worker processes so the pages they request
+    are paced along with the pages requested by every other worker.
+
+    Parameters
+    ----------
+    directory : string
+        A ``string`` of the path to the directory to save pages in.
+    requests_per_minute : float
+        A ``float`` of the maximum number of pages this worker downloads per
+        minute, or None to download pages as quickly as possible.
+    """
+    utils._page_pool = _PagePool(directory, requests_per_minute)
+
+
+@contextmanager
+def _paced_downloads(requests_per_minute=REQUESTS_PER_MINUTE):
+    """
+    Space out every page downloaded while the context is active.
+
+    Installs a temporary page pool so every page downloaded by any thread,
+    such as while pulling several seasons at once, shares a single rate
+    limit. Each page is also only downloaded once while the pool is active.
+    If a pool is already active, such as while a fetch plan is executed, it
+    is used as is.
+
+    Parameters
+    ----------
+    requests_per_minute : int (optional)
+        An ``int`` of the maximum number of pages to download per minute.
+
+    Yields
+    ------
+    _PagePool
+        The page pool which every download goes through.
+    """
+    if utils._page_pool is not None:
+        yield utils._page_pool
+        return
+    directory = tempfile.mkdtemp(prefix='sportsipy-')
+    pool = _PagePool(directory, requests_per_minute)
+    utils._page_pool = pool
+    try:
+        yield pool
+    finally:
+        utils._page_pool = None
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+class FetchPlan:
+    """
+    Download every page needed by a batch of requests exactly once.
+
+    Pulling the schedules, boxscores, and rosters for every team in a league
+    one object at a time requests many pages repeatedly. Each boxscore is
+    listed on both teams' schedules and each player's page is pulled by every
+    roster they appear on. Instead, the FetchPlan class takes the full list
+    of requested entities, expands it into the set of unique pages, and
+    downloads each page once within the rate limit before building the
+    requested objects from the downloaded pages.
+
+    A plan is executed in three steps:
+
+        1. ``discover`` pulls the season, schedule, and roster pages for the
+           requested entities, revealing the boxscores and players they
+           contain.
+        2. ``execute`` downloads every unique boxscore and player page which
+           hasn't been downloaded yet. ``estimate`` returns the number of
+           downloads remaining and the time they will take.
+        3. ``materialize`` builds the requested objects from the downloaded
+           pages without requesting them again.
+
+    Pages are saved to a temporary directory until the plan is closed.
+
+    Parameters
+    ----------
+    entities : list
+        A ``list`` of ``tuples`` of the league, kind, team abbreviation, and
+        year of each requested entity, such as ('nba', 'boxscores', 'HOU',
+        2018). The kind is one of 'teams', 'schedule', 'boxscores', or
+        'roster', and the team is ignored for 'teams'. The year can be None to
+        request the current season.
+    requests_per_minute : int (optional)
+        An ``int`` of the maximum number of pages to download per minute, or
+        None to download pages as quickly as possible.
+    workers : int (optional)
+        An ``int`` of the maximum number of pages to download at once.
+    directory : string (optional)
+        A ``string`` of the path to the directory to save downloaded pages
+        in. Defaults to a temporary directory which is removed once the plan
+        is closed.
+
+    Raises
+    ------
+    ValueError
+        If any entity is for an unsupported league or kind.
+    """
+    def __init__(self, entities, requests_per_minute=REQUESTS_PER_MINUTE,
+                 workers=utils.MAX_WORKERS, directory=None):
+        self._entities = []
+        for league, kind, team, year in entities:
+            league = league.lower()
+            if league not in LEAGUES:
+                raise ValueError('Unsupported league "%s". Expected one of: '
+                                 '%s' % (league, ', '.join(LEAGUES)))
+            if kind not in KINDS:
+                raise ValueError('Unsupported kind "%s". Expected one of: %s'
+                                 % (kind, ', '.join(KINDS)))
+            if kind == 'teams':
+                team = None
+            self._entities.append((league, kind, team, year))
+        self._requests_per_minute = requests_per_minute
+        self._workers = workers
+        self._temporary = directory is None
+        if directory is None:
+            directory = tempfile.mkdtemp(prefix='sportsipy-')
+        else:
+            os.makedirs(directory, exist_ok=True)
+        self._directory = directory
+        self._pool = _PagePool(directory, requests_per_minute)
+        self._indexes = None
+        self._executed = False
+        self._urls = []
+        self._duplicates = 0
+
+    def __str__(self):
+        """
+        Return the string representation of the class.
+        """
+        return f'Fetch plan for {len(self._entities)} entities'
+
+    def __repr__(self):
+        """
+        Return the string representation of the class.
+        """
+        return self.__str__()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        """
+        Remove the downloaded pages if they were saved to a temporary
+        directory.
+        """
+        if self._temporary:
+            shutil.rmtree(self._directory, ignore_errors=True)
+
+    def _activate(self):
+        """
+        Read every page from the plan's pool until the plan is deactivated.
+        """
+        utils._page_pool = self._pool
+
+    def _deactivate(self):
+        """
+        Download pages as usual after the plan is no longer being used.
+        """
+        utils._page_pool = None
+
+    def _index_keys(self):
+        """
+        Find the unique index pages required by the requested entities.
+
+        Returns
+        -------
+        list
+            Returns a ``list`` of ``tuples`` of the league, the kind of index,
+            the team, and the year of each index. Boxscores are found from the
+            team's schedule and players are found from the team's roster.
+        """
+        keys = []
+        for league, kind, team, year in self._entities:
+            if kind == 'boxscores':
+                kind = 'schedule'
+            key = (league, kind, team, year)
+            if key not in keys:
+                keys.append(key)
+        return keys
+
+    def _pull_index(self, key):
+        """
+        Create the object for an index page.
+
+        Parameters
+        ----------
+        key : tuple
+            A ``tuple`` of the league, the kind of index, the team, and the
+            year of the index.
+
+        Returns
+        -------
+        object
+            Returns the ``Teams``, ``Schedule``, or slim ``Roster`` instance
+            for the index.
+        """
+        league, kind, team, year = key
+        if kind == 'teams':
+            return import_module('sportsipy.%s.teams' % league).Teams(year)
+        if kind == 'schedule':
+            module = import_module('sportsipy.%s.schedule' % league)
+            return module.Schedule(team, year)
+        module = import_module('sportsipy.%s.roster' % league)
+        return module.Roster(team, year, slim=True)
+
+    def discover(self):
+        """
+        Pull every index page and find the pages they link to.
+
+        The season, schedule, and roster pages for every requested entity are
+        downloaded, and the unique boxscore and player pages required by the
+        entities are found from them.
+        """
+        keys = self._index_keys()
+        self._activate()
+        try:
+            indexes = utils._map_concurrently(self._pull_index, keys,
+                                              self._workers)
+        finally:
+            self._deactivate()
+        self._indexes = dict(zip(keys, indexes))
+        requested = []
+        for league, kind, team, year in self._entities:
+            if kind == 'boxscores':
+                schedule = self._indexes[(league, 'schedule', team, year)]
+                constants = import_module('sportsipy.%s.constants' % league)
+                requested.extend(constants.BOXSCORE_URL % game.boxscore_index
+                                 for game in schedule if game.boxscore_index)
+            elif kind == 'roster':
+                roster = self._indexes[(league, kind, team, year)]
+                module = import_module('sportsipy.%s.roster' % league)
+                requested.extend(utils._player_url(module.Player, player_id)
+                                 for player_id in roster.players)
+        self._urls = list(dict.fromkeys(requested))
+        self._duplicates = len(requested) - len(self._urls)
+
+    def estimate(self):
+        """
+        Estimate the downloads remaining to execute the plan.
+
+        Before the plan is discovered, only the index pages are known, so
+        the estimate only includes one page for each index. Once discovered,
+        every remaining page is known.
+
+        Returns
+        -------
+        dictionary
+            Returns a ``dictionary`` with the number of 'requests' remaining,
+            the estimated number of 'seconds' they will take within the rate
+            limit, the number of 'duplicates' which were removed, and whether
+            the estimate is 'complete'.
+        """
+        if self._indexes is None:
+            requests = len(self._index_keys())
+        else:
+            requests = len([url for url in self._urls
+                            if url not in self._pool])
+        seconds = 0.0
+        if self._requests_per_minute:
+            seconds = requests * 60.0 / self._requests_per_minute
+        return {
+            'requests': requests,
+            'seconds': seconds,
+            'duplicates': self._duplicates,
+            'complete': self._indexes is not None
+        }
+
+    def execute(self):
+        """
+        Download every page required by the plan.
+
+        The plan is discovered first if it hasn't been already. Pages which
+        have already been downloaded are skipped.
+
+        Returns
+        -------
+        int
+            Returns an ``int`` of the total number of pages downloaded by the
+            plan.
+        """
+        if self._indexes is None:
+            self.discover()
+        utils._map_concurrently(self._pool.fetch, self._urls, self._workers)
+        self._executed = True
+        return self._pool.requests
+
+    def materialize(self):
+        """
+        Build every requested entity from the downloaded pages.
+
+        The plan is executed first if it hasn't been already. While the
+        entities are built, every page is read from the plan instead of
+        being downloaded, and any page which wasn't planned is downloaded
+        once and kept for the rest of the plan. Boxscores listed on several
+        requested schedules are only built once.
+
+        Returns
+        -------
+        generator
+            A generator of ``tuples`` of each requested entity, as passed to
+            the plan, and its value. The value is a ``Teams``, ``Schedule``,
+            or ``Roster`` instance, or a ``list`` of ``Boxscore`` instances
+            for the 'boxscores' kind.
+        """
+        if not self._executed:
+            self.execute()
+        boxscores = {}
+        for league, kind, team, year in self._entities:
+            self._activate()
+            try:
+                if kind == 'teams' or kind == 'schedule':
+                    value = self._indexes[(league, kind, team, year)]
+                elif kind == 'roster':
+                    module = import_module('sportsipy.%s.roster' % league)
+                    value = module.Roster(team, year)
+                else:
+                    module = import_module('sportsipy.%s.boxscore' % league)
+                    schedule = self._indexes[(league, 'schedule', team, year)]
+                    value = []
+                    for game in schedule:
+                        uri = game.boxscore_index
+                        if not uri:
+                            continue
+                        if (league, uri) not in boxscores:
+                            boxscores[(league, uri)] = module.Boxscore(uri)
+                        value.append(boxscores[(league, uri)])
+            finally:
+                self._deactivate()
+            yield (league, kind, team, year), value
@@ -0,0 +1,271 @@
+import asyncio
+import time
+from importlib import import_module
+from . import utils
+from .sync import LEAGUES, WEEKLY_LEAGUES
+
+
+# The default number of seconds to wait between each refresh of the games.
+POLL_INTERVAL = 30
+# The types of events emitted when a game is first listed, when any of its
+# details such as the score or winner change, and when it is no longer listed.
+GAME_ADDED = 'added'
+GAME_UPDATED = 'updated'
+GAME_REMOVED = 'removed'
+
+
+def _game_key(game):
+    """
+    Find a stable identity for a game between pulls.
+
+    Games which haven't started yet don't have a boxscore URI, so every game
+    is identified by the teams playing in it instead, falling back to the
+    team names for teams without an abbreviation. The boxscore URI is only
+    used when neither team is known. Teams playing each other more than once
+    on the same day, such as during a doubleheader, are told apart by the
+    order they are listed in.
+
+    Parameters
+    ----------
+    game : dictionary
+        A ``dictionary`` of the game's information as returned by the
+        Boxscores class.
+
+    Returns
+    -------
+    tuple or string
+        Returns a ``tuple`` of the away and home teams, or the ``string`` of
+        the boxscore URI if neither team is known.
+    """
+    teams = (game.get('away_abbr') or game.get('away_name'),
+             game.get('home_abbr') or game.get('home_name'))
+    if any(teams):
+        return teams
+    return game.get('boxscore')
+
+
+class ScoreboardPoller:
+    """
+    Watch the scoreboard for a league and report every change to its games.
+
+    Repeatedly pulls the games being played today (or during the requested
+    week for weekly leagues, such as the NFL) and compares every game against
+    the previous pull. Only the differences are reported, either to a
+    callback, an ``asyncio.Queue``, or both, so dashboards don't need to
+    rebuild and compare the full list of games on every refresh. The
+    boxscores page is conditionally revalidated on each pull so a page which
+    hasn't changed since the previous pull isn't downloaded again, although
+    the saved copy is still parsed.
+
+    Each change is reported as a ``dictionary`` in the following format::
+
+        {
+            'type': Either 'added', 'updated', or 'removed' (`str`),
+            'date': The date or week the game is listed under, matching the
+                    keys of the Boxscores class (`str`),
+            'boxscore': The boxscore URI of the game (`str`),
+            'changes': A dictionary where each key is a field which changed,
+                       such as 'home_score', and each value is a tuple of the
+                       previous and new values (`dict`),
+            'game': The latest information for the game, matching the format
+                    of the games returned by the Boxscores class (`dict`)
+        }
+
+    Games are matched between pulls by the teams playing in them rather than
+    the boxscore URI, as games which haven't started yet don't have one.
+    Games from a previous day are not reported as removed once the date
+    rolls over. Instead, the games for the new day are reported as added.
+
+    Parameters
+    ----------
+    league : string
+        A ``string`` of the league to watch, such as 'nba'.
+    callback : function (optional)
+        A function which is called with each change as it is found.
+    queue : asyncio.Queue (optional)
+        An ``asyncio.Queue`` which each change is put on while running with
+        the ``watch`` method.
+    interval : int (optional)
+        An ``int`` of the number of seconds to wait between each pull.
+    week : int (optional)
+        An ``int`` of the week to watch for weekly leagues. Required for
+        those leagues and ignored for all others.
+    year : int (optional)
+        An ``int`` of the season to watch for weekly leagues. Required for
+        those leagues and ignored for all others.
+    """
+    def __init__(self, league, callback=None, queue=None,
+                 interval=POLL_INTERVAL, week=None, year=None):
+        league = league.lower()
+        if league not in LEAGUES:
+            raise ValueError('Unsupported league "%s". Expected one of: %s' %
+                             (league, ', '.join(LEAGUES)))
+        if league in WEEKLY_LEAGUES and not (week and year):
+            raise ValueError('A week and year are required to watch the %s' %
+                             league.upper())
+        self._league = league
+        self._callback = callback
+        self._queue = queue
+        self._interval = interval
+        self._week = week
+        self._year = year
+        self._boxscores = import_module('sportsipy.%s.boxscore' %
+                                        league).Boxscores
+        self._period = None
+        self._games = {}
+
+    def __str__(self):
+        """
+        Return the string representation of the class.
+        """
+        return f'{self._league.upper()} scoreboard'
+
+    def __repr__(self):
+        """
+        Return the string representation of the class.
+        """
+        return self.__str__()
+
+    def _pull_games(self):
+        """
+        Pull the current list of games.
+
+        Returns
+        -------
+        tuple
+            Returns a ``tuple`` of the ``string`` of the date or week the
+            games are listed under and a ``list`` of the games.
+        """
+        if self._league in WEEKLY_LEAGUES:
+            boxscores = self._boxscores(self._week, self._year,
+                                        revalidate=True)
+        else:
+            boxscores = self._boxscores(utils._todays_date(), revalidate=True)
+        for period, games in boxscores.games.items():
+            return period, games
+        return None, []
+
+    def _find_changes(self, period, games):
+        """
+        Compare the latest games against the previous pull.
+
+        Parameters
+        ----------
+        period : string
+            A ``string`` of the date or week the games are listed under.
+        games : list
+            A ``list`` of the latest games.
+
+        Returns
+        -------
+        list
+            Returns a ``list`` of every change, in the order the games are
+            listed.
+        """
+        previous = self._games if period == self._period else {}
+        latest = {}
+        for game in games:
+            key = _game_key(game)
+            count = 0
+            while (key, count) in latest:
+                count += 1
+            latest[(key, count)] = game
+        events = []
+        for key, game in latest.items():
+            if key not in previous:
+                changes = {field: (None, value)
+                           for field, value in game.items()}
+                events.append(self._event(GAME_ADDED, period, game, changes))
+                continue
+            changes = {field: (previous[key].get(field), value)
+                       for field, value in game.items()
+                       if previous[key].get(field) != value}
+            if changes:
+                events.append(self._event(GAME_UPDATED, period, game,
+                                          changes))
+        for key, game in previous.items():
+            if key not in latest:
+                events.append(self._event(GAME_REMOVED, period, game, {}))
+        self._period = period
+        self._games = latest
+        return events
+
+    def _event(self, event_type, period, game, changes):
+        """
+        Create the dictionary describing a single change.
+        """
+        return {
+            'type': event_type,
+            'date': period,
+            'boxscore': game['boxscore'],
+            'changes': changes,
+            'game': game
+        }
+
+    def poll(self):
+        """
+        Pull the games once and report any changes since the previous pull.
+
+        Each change is passed to the callback, if one was specified. The
+        first pull reports every listed game as added.
+
+        Returns
+        -------
+        list
+            Returns a ``list`` of every change found during the pull.
+        """
+        events = self._find_changes(*self._pull_games())
+        if self._callback:
+            for event in events:
+                self._callback(event)
+        return events
+
+    def run(self, polls=None):
+        """
+        Continuously pull the games, blocking the current thread.
+
+        Parameters
+        ----------
+        polls : int (optional)
+            An ``int`` of the number of pulls to run before returning. Runs
+            until interrupted if not specified.
+        """
+        count = 0
+        while polls is None or count < polls:
+            if count:
+                time.sleep(self._interval)
+            self.poll()
+            count += 1
+
+    async def watch(self, polls=None):
+        """
+        Continuously pull the games from within an asyncio event loop.
+
+        Every pull runs in the event loop's default executor so the loop is
+        never blocked while downloading the page, and each change is put on
+        the queue as well as being passed to the callback. Note the callback
+        is called from the executor's thread rather than the event loop.
+
+        Parameters
+        ----------
+        polls : int (optional)
+            An ``int`` of the number of pulls to run before returning. Runs
+            until cancelled if not specified.
+        """
+        loop = asyncio.get_running_loop()
+        count = 0
+        while polls is None or count < polls:
+            if count:
+                await asyncio.sleep(self._interval)
+            events = await loop.run_in_executor(None, self.poll)
+            if self._queue is not None:
+                for event in events:
+                    await self._queue.put(event)
+            count += 1
+
+    @property
+    def games(self):
+        """
+        Returns a ``list`` of the games found during the latest pull.
+        """
+        return list(self._games.values())
@@ -0,0 +1,541 @@
+import json
+import sqlite3
+from . import utils
+from .utils import pd
+
+
+# Every table holds the columns used to identify and filter rows, followed by
+# a 'stats' column with a JSON object of every other value. The stats differ
+# between leagues, so they are kept as JSON instead of a column per stat.
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS teams (
+    league TEXT NOT NULL,
+    year TEXT NOT NULL,
+    abbreviation TEXT NOT NULL,
+    name TEXT,
+    stats TEXT NOT NULL,
+    PRIMARY KEY (league, year, abbreviation)
+);
+CREATE TABLE IF NOT EXISTS games (
+    league TEXT NOT NULL,
+    uri TEXT NOT NULL,
+    date TEXT,
+    winning_abbr TEXT,
+    losing_abbr TEXT,
+    away_points INTEGER,
+    home_points INTEGER,
+    stats TEXT NOT NULL,
+    PRIMARY KEY (league, uri)
+);
+CREATE TABLE IF NOT EXISTS team_games (
+    league TEXT NOT NULL,
+    uri TEXT NOT NULL,
+    team TEXT NOT NULL,
+    date TEXT,
+    opponent TEXT,
+    stats TEXT NOT NULL,
+    PRIMARY KEY (league, uri, team)
+);
+CREATE INDEX IF NOT EXISTS team_games_by_team
+    ON team_games (league, team, date);
+CREATE TABLE IF NOT EXISTS player_games (
+    league TEXT NOT NULL,
+    uri TEXT NOT NULL,
+    player_id TEXT NOT NULL,
+    name TEXT,
+    team TEXT,
+    stats TEXT NOT NULL,
+    PRIMARY KEY (league, uri, player_id)
+);
+CREATE INDEX IF NOT EXISTS player_games_by_player
+    ON player_games (league, player_id);
+CREATE TABLE IF NOT EXISTS player_seasons (
+    league TEXT NOT NULL,
+    player_id TEXT NOT NULL,
+    season TEXT NOT NULL,
+    name TEXT,
+    team_abbreviation TEXT,
+    stats TEXT NOT NULL,
+    PRIMARY KEY (league, player_id, season)
+);
+CREATE INDEX IF NOT EXISTS player_seasons_by_season
+    ON player_seasons (league, season);
+"""
+
+# The columns of each table which identify and filter rows, in order,
+# excluding the final 'stats' column.
+_COLUMNS = {
+    'teams': ['league', 'year', 'abbreviation', 'name'],
+    'games': ['league', 'uri', 'date', 'winning_abbr', 'losing_abbr',
+              'away_points', 'home_points'],
+    'team_games': ['league', 'uri', 'team', 'date', 'opponent'],
+    'player_games': ['league', 'uri', 'player_id', 'name', 'team'],
+    'player_seasons': ['league', 'player_id', 'season', 'name',
+                       'team_abbreviation']
+}
+
+
+def _league(instance):
+    """
+    Find the league an object was created for.
+
+    Parameters
+    ----------
+    instance : object
+        An object created by one of the league modules, such as an instance
+        of ``sportsipy.nba.boxscore.Boxscore``.
+
+    Returns
+    -------
+    string
+        Returns a ``string`` of the league's module name, such as 'nba' or
+        'fb'.
+    """
+    return type(instance).__module__.split('.')[1]
+
+
+def _records(frame):
+    """
+    Convert every row in a DataFrame to a dictionary of plain values.
+
+    Parameters
+    ----------
+    frame : DataFrame
+        The pandas ``DataFrame`` to convert.
+
+    Returns
+    -------
+    list
+        Returns a ``list`` of a ``dictionary`` for every row. Values are
+        converted to the equivalent Python types, with dates written as ISO
+        8601 strings and missing values as None.
+    """
+    return json.loads(frame.to_json(orient='records', date_format='iso'))
+
+
+def _row(table, record):
+    """
+    Split a record into the values for each column of a table.
+
+    Parameters
+    ----------
+    table : string
+        A ``string`` of the name of the table the record is written to.
+    record : dictionary
+        A ``dictionary`` of every value in the row, including the columns
+        which identify the row.
+
+    Returns
+    -------
+    tuple
+        Returns a ``tuple`` of the value of each of the table's columns, with
+        every value which isn't in its own column saved in the stats.
+    """
+    columns = _COLUMNS[table]
+    stats = {key: value for key, value in record.items()
+             if key not in columns}
+    return tuple(record.get(column) for column in columns) + \
+        (json.dumps(stats, default=str),)
+
+
+class Store:
+    """
+    Save the data pulled from sports-reference.com to a local database.
+
+    Rather than pulling the same teams, games, and players again for every
+    analysis, the Store class saves them to normalized tables in a SQLite
+    database which can be queried directly afterwards. Each row is
+    identified by its league along with the boxscore URI, player ID, or team
+    abbreviation it describes, so saving an object which already exists
+    replaces the saved copy instead of duplicating it.
+
+    The database contains the following tables, each of which includes a
+    'stats' column with a JSON object of every other value:
+
+        * teams - every team's stats for a season.
+        * games - every game's result and team stats.
+        * team_games - every game from the point of view of each team.
+        * player_games - every player's stats for each game.
+        * player_seasons - every player's stats for each season.
+
+    Parameters
+    ----------
+    path : string
+        A ``string`` of the path to the SQLite database file. The database and
+        its tables are created if they don't exist. Pass ':memory:' to use a
+        temporary in-memory database.
+    """
+    def __init__(self, path):
+        self._path = path
+        self._connection = sqlite3.connect(path)
+        with self._connection:
+            self._connection.executescript(_SCHEMA)
+
+    def __str__(self):
+        """
+        Return the string representation of the class.
+        """
+        return f'Store at {self._path}'
+
+    def __repr__(self):
+        """
+        Return the string representation of the class.
+        """
+        return self.__str__()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        """
+        Close the connection to the database.
+        """
+        self._connection.close()
+
+    def _insert(self, table, rows):
+        """
+        Save rows to a table, replacing any existing rows with the same key.
+
+        Parameters
+        ----------
+        table : string
+            A ``string`` of the name of the table to save the rows to.
+        rows : list
+            A ``list`` of ``tuples`` of the value of each column, as created
+            by ``_row``.
+
+        Returns
+        -------
+        int
+            Returns an ``int`` of the number of rows saved.
+        """
+        if not rows:
+            return 0
+        columns = _COLUMNS[table] + ['stats']
+        self._connection.executemany(
+            'INSERT OR REPLACE INTO %s (%s) VALUES (%s)' %
+            (table, ', '.join(columns), ', '.join('?' * len(columns))),
+            rows)
+        return len(rows)
+
+    def save_teams(self, teams):
+        """
+        Save the season stats for several teams.
+
+        Parameters
+        ----------
+        teams : iterable
+            An iterable of the teams to save, such as a ``Teams`` instance or
+            a ``list`` of fb ``Team`` instances.
+
+        Returns
+        -------
+        int
+            Returns an ``int`` of the number of teams saved.
+        """
+        rows = []
+        for team in teams:
+            league = _league(team)
+            if league == 'fb':
+                record = {name[1:]: value
+                          for name, value in vars(team).items()
+                          if isinstance(value, (str, int, float))}
+                record.update({'year': team.season,
+                               'abbreviation': team.squad_id})
+            else:
+                record = _records(team.dataframe)[0]
+                record.update({'year': str(team._year),
+                               'abbreviation': team.abbreviation,
+                               'name': team.name})
+            record['league'] = league
+            rows.append(_row('teams', record))
+        with self._connection:
+            return self._insert('teams', rows)
+
+    def save_schedule(self, schedule, team):
+        """
+        Save every played game in a team's schedule.
+
+        Parameters
+        ----------
+        schedule : Schedule instance
+            The team's schedule, such as an instance of
+            ``sportsipy.nba.schedule.Schedule``.
+        team : string
+            A ``string`` of the abbreviation of the team the schedule belongs
+            to, such as 'HOU'.
+
+        Returns
+        -------
+        int
+            Returns an ``int`` of the number of games saved. Games without a
+            boxscore, such as those which haven't been played yet, are
+            skipped.
+        """
+        rows = []
+        for game in schedule:
+            frame = game.dataframe
+            if not game.boxscore_index or frame is None:
+                continue
+            record = _records(frame)[0]
+            record.pop('boxscore_index', None)
+            record.update({
+                'league': _league(game),
+                'uri': game.boxscore_index,
+                'team': team.upper(),
+                'date': record.pop('datetime', None),
+                'opponent': record.pop('opponent_abbr', None)
+            })
+            rows.append(_row('team_games', record))
+        with self._connection:
+            return self._insert('team_games', rows)
+
+    def save_boxscores(self, boxscores):
+        """
+        Save the result and player stats for several games.
+
+        Each game's players replace every player previously saved for the
+        same game.
+
+        Parameters
+        ----------
+        boxscores : iterable
+            An iterable of ``Boxscore`` instances, such as the boxscores
+            returned by a schedule's ``boxscores`` method.
+
+        Returns
+        -------
+        int
+            Returns an ``int`` of the number of games saved. Games which
+            haven't been played yet are skipped.
+        """
+        games = 0
+        with self._connection:
+            for boxscore in boxscores:
+                frame = boxscore.dataframe
+                if frame is None:
+                    continue
+                league = _league(boxscore)
+                uri = frame.index[0]
+                record = _records(frame)[0]
+                record.update({'league': league, 'uri': uri})
+                games += self._insert('games', [_row('games', record)])
+                self._connection.execute(
+                    'DELETE FROM player_games WHERE league = ? AND uri = ?',
+                    (league, uri))
+                players = boxscore.players_dataframe
+                if players is None:
+                    continue
+                rows = []
+                for player_id, record in zip(players.index,
+                                             _records(players)):
+                    record.update({'league': league, 'uri': uri,
+                                   'player_id': player_id})
+                    rows.append(_row('player_games', record))
+                self._insert('player_games', rows)
+        return games
+
+    def save_players(self, players):
+        """
+        Save every season for several players.
+
+        Each player's seasons replace every season previously saved for the
+        same player.
+
+        Parameters
+        ----------
+        players : iterable
+            An iterable of ``Player`` instances, or a ``Roster`` instance to
+            save every player on the roster.
+
+        Returns
+        -------
+        int
+            Returns an ``int`` of the number of players saved. Players whose
+            stats couldn't be found are skipped.
+        """
+        players = getattr(players, 'players', players)
+        saved = 0
+        with self._connection:
+            for player in players:
+                if not player._season:
+                    continue
+                league = _league(player)
+                rows = []
+                for index, season in enumerate(player._season):
+                    record = utils._season_view(player,
+                                                index)._dataframe_fields()
+                    record.update({'league': league,
+                                   'player_id': player.player_id,
+                                   'season': season,
+                                   'name': player.name})
+                    rows.append(_row('player_seasons', record))
+                self._connection.execute(
+                    'DELETE FROM player_seasons WHERE league = ? AND '
+                    'player_id = ?', (league, player.player_id))
+                self._insert('player_seasons', rows)
+                saved += 1
+        return saved
+
+    def query(self, sql, parameters=()):
+        """
+        Run a SQL query against the database.
+
+        Parameters
+        ----------
+        sql : string
+            A ``string`` of the SQL query to run.
+        parameters : tuple (optional)
+            A ``tuple`` of the values for each '?' placeholder in the query.
+
+        Returns
+        -------
+        DataFrame
+            Returns a pandas ``DataFrame`` with a row for every result.
+        """
+        return pd.read_sql_query(sql, self._connection, params=parameters)
+
+    def _select(self, table, **filters):
+        """
+        Read the rows of a table which match every filter.
+
+        Parameters
+        ----------
+        table : string
+            A ``string`` of the name of the table to read.
+        filters : keyword arguments
+            The value each column needs to equal. Filters which are None are
+            ignored.
+
+        Returns
+        -------
+        DataFrame
+            Returns a pandas ``DataFrame`` with a row for every match. The
+            table's columns are followed by a column for every stat.
+        """
+        columns = _COLUMNS[table]
+        filters = {column: value for column, value in filters.items()
+                   if value is not None}
+        sql = 'SELECT %s, stats FROM %s' % (', '.join(columns), table)
+        if filters:
+            sql += ' WHERE ' + ' AND '.join('%s = ?' % column
+                                            for column in filters)
+        sql += ' ORDER BY %s' % ', '.join(columns[:3])
+        records = []
+        for row in self._connection.execute(sql, tuple(filters.values())):
+            record = dict(zip(columns, row))
+            for key, value in json.loads(row[-1]).items():
+                record.setdefault(key, value)
+            records.append(record)
+        return pd.DataFrame(records, columns=None if records else columns)
+
+    def teams(self, league=None, year=None):
+        """
+        Read the saved season stats for teams.
+
+        Parameters
+        ----------
+        league : string (optional)
+            A ``string`` of the league to read, such as 'nba'.
+        year : string (optional)
+            A ``string`` of the season to read, such as '2018'.
+
+        Returns
+        -------
+        DataFrame
+            Returns a pandas ``DataFrame`` with a row for every team season.
+        """
+        if year is not None:
+            year = str(year)
+        return self._select('teams', league=league, year=year)
+
+    def games(self, league=None, uri=None):
+        """
+        Read the saved results for games.
+
+        Parameters
+        ----------
+        league : string (optional)
+            A ``string`` of the league to read, such as 'nba'.
+        uri : string (optional)
+            A ``string`` of the boxscore URI of a single game to read, such as
+            '201710310LAL'.
+
+        Returns
+        -------
+        DataFrame
+            Returns a pandas ``DataFrame`` with a row for every game.
+        """
+        return self._select('games', league=league, uri=uri)
+
+    def team_games(self, league=None, team=None):
+        """
+        Read the saved games from each team's point of view.
+
+        Parameters
+        ----------
+        league : string (optional)
+            A ``string`` of the league to read, such as 'nba'.
+        team : string (optional)
+            A ``string`` of the abbreviation of a single team to read, such
+            as 'HOU'.
+
+        Returns
+        -------
+        DataFrame
+            Returns a pandas ``DataFrame`` with a row for every game played by
+            each team.
+        """
+        if team is not None:
+            team = team.upper()
+        return self._select('team_games', league=league, team=team)
+
+    def player_games(self, league=None, player_id=None, uri=None):
+        """
+        Read the saved stats for players in each game.
+
+        Parameters
+        ----------
+        league : string (optional)
+            A ``string`` of the league to read, such as 'nba'.
+        player_id : string (optional)
+            A ``string`` of the ID of a single player to read, such as
+            'hardeja01'.
+        uri : string (optional)
+            A ``string`` of the boxscore URI of a single game to read.
+
+        Returns
+        -------
+        DataFrame
+            Returns a pandas ``DataFrame`` with a row for every player in each
+            game.
+        """
+        return self._select('player_games', league=league,
+                            player_id=player_id, uri=uri)
+
+    def player_seasons(self, league=None, player_id=None, season=None):
+        """
+        Read the saved stats for players in each season.
+
+        Parameters
+        ----------
+        league : string (optional)
+            A ``string`` of the league to read, such as 'nba'.
+        player_id : string (optional)
+            A ``string`` of the ID of a single player to read, such as
+            'hardeja01'.
+        season : string (optional)
+            A ``string`` of a single season to read, such as '2017-18', or
+            'Career' for every player's career stats.
+
+        Returns
+        -------
+        DataFrame
+            Returns a pandas ``DataFrame`` with a row for every season played
+            by each player.
+        """
+        return self._select('player_seasons', league=league,
+                            player_id=player_id, season=season)
@@ -0,0 +1,288 @@
+import json
+import os
+from datetime import datetime, timedelta
+from importlib import import_module
+from . import utils
+
+
+# Leagues which list their boxscores by week instead of by date.
+WEEKLY_LEAGUES = ['nfl']
+LEAGUES = ['mlb', 'nba', 'ncaab', 'ncaaf', 'nfl', 'nhl']
+
+
+class SeasonSync:
+    """
+    Incrementally save every completed game for a league to a local dataset.
+
+    Rebuilding a full season of boxscores every time new games are played
+    requires downloading every boxscore again. Instead, the SeasonSync class
+    keeps a watermark in a local state file which records the first date (or
+    week for the NFL) which hasn't been completely saved along with the
+    boxscores which have already been saved from that date onward. Each sync
+    only pulls the boxscore index pages from the watermark onward and only
+    downloads the boxscores which haven't been saved yet, appending them to
+    the dataset. The time taken by each sync is therefore proportional to the
+    number of new games rather than the length of the season.
+
+    A date is only considered complete once every game on that date has a
+    final score and its boxscore was saved, so games which are postponed or
+    still in progress are picked up by a later sync.
+
+    Parameters
+    ----------
+    league : string
+        A ``string`` of the league to sync, such as 'nba'.
+    dataset : string
+        A ``string`` of the path to the CSV file the boxscores are appended
+        to. The file is created during the first sync if it doesn't exist.
+    state_file : string (optional)
+        A ``string`` of the path to the JSON file used to store the
+        watermark. Defaults to the dataset path with '.state.json' appended.
+    year : int (optional)
+        An ``int`` of the season to sync for leagues which list their games
+        by week, such as the NFL. Required for those leagues and ignored for
+        all others.
+    """
+    def __init__(self, league, dataset, state_file=None, year=None):
+        league = league.lower()
+        if league not in LEAGUES:
+            raise ValueError('Unsupported league "%s". Expected one of: %s' %
+                             (league, ', '.join(LEAGUES)))
+        if league in WEEKLY_LEAGUES and not year:
+            raise ValueError('A year is required to sync the %s' %
+                             league.upper())
+        self._league = league
+        self._dataset = dataset
+        self._state_file = state_file or '%s.state.json' % dataset
+        self._year = year
+        self._boxscore_module = import_module('sportsipy.%s.boxscore' % league)
+        self._boxscore_url = import_module('sportsipy.%s.constants' %
+                                           league).BOXSCORE_URL
+        self._state = self._load_state()
+
+    def __str__(self):
+        """
+        Return the string representation of the class.
+        """
+        return f'{self._league.upper()} sync to {self._dataset}'
+
+    def __repr__(self):
+        """
+        Return the string representation of the class.
+        """
+        return self.__str__()
+
+    def _load_state(self):
+        """
+        Load the watermark from the state file.
+
+        Returns
+        -------
+        dictionary
+            Returns a ``dictionary`` with the 'watermark' and 'synced' keys,
+            which are None and an empty ``list`` respectively if nothing has
+            been synced yet.
+        """
+        if not os.path.exists(self._state_file):
+            return {'watermark': None, 'synced': []}
+        with open(self._state_file, 'r', encoding='utf8') as state_file:
+            return json.load(state_file)
+
+    def _save_state(self):
+        """
+        Save the watermark to the state file.
+
+        The state is written to a temporary file which then replaces the
+        previous state so an interrupted write can't corrupt the watermark.
+        """
+        temporary_file = '%s.tmp' % self._state_file
+        with open(temporary_file, 'w', encoding='utf8') as state_file:
+            json.dump(self._state, state_file)
+        os.replace(temporary_file, self._state_file)
+
+    def _parse_watermark(self, watermark):
+        """
+        Convert a stored watermark into a date or week.
+        """
+        if watermark is None or self._league in WEEKLY_LEAGUES:
+            return watermark
+        return datetime.strptime(watermark, '%Y-%m-%d')
+
+    def _format_watermark(self, period):
+        """
+        Convert a date or week into a watermark which can be stored.
+        """
+        if self._league in WEEKLY_LEAGUES:
+            return period
+        return period.strftime('%Y-%m-%d')
+
+    def _normalize(self, period):
+        """
+        Drop the time of day from dates so they can be compared to watermarks.
+        """
+        if self._league in WEEKLY_LEAGUES:
+            return int(period)
+        return datetime(period.year, period.month, period.day)
+
+    def _next_period(self, period):
+        """
+        Return the date or week following the passed period.
+        """
+        if self._league in WEEKLY_LEAGUES:
+            return period + 1
+        return period + timedelta(days=1)
+
+    def _pull_games(self, start, end):
+        """
+        Pull the boxscore index pages between two periods.
+
+        Parameters
+        ----------
+        start : datetime or int
+            The first date, or week for weekly leagues, to pull.
+        end : datetime or int
+            The last date, or week for weekly leagues, to pull.
+
+        Returns
+        -------
+        list
+            Returns a ``list`` of ``tuples`` of each period and a ``list`` of
+            the games listed for the period, in chronological order.
+        """
+        if self._league in WEEKLY_LEAGUES:
+            boxscores = self._boxscore_module.Boxscores(start, self._year, end)
+        else:
+            boxscores = self._boxscore_module.Boxscores(start, end)
+        periods = []
+        period = start
+        for games in boxscores.games.values():
+            periods.append((period, games))
+            period = self._next_period(period)
+        return periods
+
+    def _pull_boxscores(self, uris):
+        """
+        Download and parse the boxscore for each game.
+
+        Parameters
+        ----------
+        uris : list
+            A ``list`` of the boxscore URI of every game to pull.
+
+        Returns
+        -------
+        dictionary
+            Returns a ``dictionary`` where each key is the boxscore URI and
+            each value is the game's DataFrame. Games which couldn't be
+            downloaded or parsed are excluded.
+        """
+        frames = {}
+        urls = [self._boxscore_url % uri for uri in uris]
+        for uri, html in zip(uris, utils._prefetch_pages(urls)):
+            if not html:
+                continue
+            frame = self._boxscore_module.Boxscore(uri, html).dataframe
+            if frame is not None:
+                frames[uri] = frame
+        return frames
+
+    def _append(self, frames):
+        """
+        Append the new boxscores to the dataset.
+
+        Parameters
+        ----------
+        frames : list
+            A ``list`` of the DataFrames of every new boxscore.
+
+        Returns
+        -------
+        DataFrame
+            Returns a pandas ``DataFrame`` of every appended boxscore.
+        """
+        new_games = utils.pd.concat(frames)
+        header = not os.path.exists(self._dataset)
+        new_games.to_csv(self._dataset, mode='a', header=header,
+                         index_label='boxscore')
+        return new_games
+
+    def sync(self, start=None, end=None):
+        """
+        Save every completed game which hasn't been saved yet.
+
+        Parameters
+        ----------
+        start : datetime or int (optional)
+            The date, or week for weekly leagues, to start from when nothing
+            has been synced yet. Ignored once a watermark has been saved.
+        end : datetime or int (optional)
+            The last date, or week for weekly leagues, to sync. Defaults to
+            today for leagues which list games by date, and is required for
+            weekly leagues.
+
+        Returns
+        -------
+        DataFrame
+            Returns a pandas ``DataFrame`` of the newly saved boxscores, or
+            None if no new games were saved.
+
+        Raises
+        ------
+        ValueError
+            Raises a ``ValueError`` if there is no saved watermark and no
+            start was specified, or if the end of a weekly sync wasn't
+            specified.
+        """
+        watermark = self._parse_watermark(self._state['watermark'])
+        start = watermark if watermark is not None else start
+        if start is None:
+            raise ValueError('A start must be specified for the first sync')
+        if end is None:
+            if self._league in WEEKLY_LEAGUES:
+                raise ValueError('An end week is required to sync the %s' %
+                                 self._league.upper())
+            end = utils._todays_date()
+        start = self._normalize(start)
+        end = self._normalize(end)
+        if start > end:
+            return None
+
+        synced = set(self._state['synced'])
+        periods = self._pull_games(start, end)
+        new_uris = [game['boxscore'] for _, games in periods for game in games
+                    if game['boxscore'] not in synced and
+                    game['home_score'] is not None and
+                    game['away_score'] is not None]
+        frames = self._pull_boxscores(new_uris)
+
+        # The watermark is moved to the first period with a game which hasn't
+        # been saved, and only the saved games from that period onward need to
+        # be remembered.
+        new_watermark = self._next_period(end)
+        for period, games in periods:
+            if any(game['boxscore'] not in synced and
+                   game['boxscore'] not in frames for game in games):
+                new_watermark = period
+                break
+        remaining = [game['boxscore'] for period, games in periods
+                     for game in games if period >= new_watermark]
+        synced.update(frames)
+        new_games = None
+        if frames:
+            new_games = self._append([frames[uri] for uri in new_uris
+                                      if uri in frames])
+        self._state = {
+            'watermark': self._format_watermark(new_watermark),
+            'synced': [uri for uri in remaining if uri in synced]
+        }
+        self._save_state()
+        return new_games
+
+    @property
+    def watermark(self):
+        """
+        Returns a ``datetime`` of the first date, or an ``int`` of the first
+        week for weekly leagues, which hasn't been completely synced. Returns
+        None if nothing has been synced yet.
+        """
+        return self._parse_watermark(self._state['watermark'])
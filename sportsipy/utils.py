@@ -1,10 +1,53 @@
+import copy
+import hashlib
+import importlib
+import multiprocessing
+import os
+import pickle
 import re
 import requests
+import threading
+import zlib
+from collections import deque, OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from itertools import islice
 from lxml.etree import ParserError, XMLSyntaxError
 from pyquery import PyQuery as pq
+from urllib.error import HTTPError
 
 
+class _LazyModule:
+    """
+    A module which is only imported once one of its attributes is used.
+
+    Some dependencies, such as pandas, take a considerable amount of time to
+    import but are only required for a subset of features. Wrapping them in a
+    _LazyModule defers the import until the module is first used, keeping the
+    import time of sportsipy low for programs which never need them.
+
+    Parameters
+    ----------
+    name : string
+        A ``string`` of the fully-qualified name of the module to import, such
+        as 'pandas'.
+    """
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attribute):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attribute)
+
+
+# pandas and numpy are only needed to create DataFrames and arrays, which
+# aren't used by every program, and are imported on first use instead.
+np = _LazyModule('numpy')
+pd = _LazyModule('pandas')
+
 # {
 #   league name: {
 #     start month - integer referring to the month that a season typically
@@ -23,6 +66,62 @@ SEASON_START_MONTH = {
     'nhl': {'start': 10, 'wrap': True}
 }
 
+# The maximum number of pages which are remembered for conditional
+# revalidation. Each entry holds the validators sent by the server (the ETag
+# and Last-Modified headers) along with the compressed raw HTML of the page so
+# an unchanged page can be reused without downloading it again. Parsed pages
+# are not kept, as they use many times more memory than the HTML. Once full,
+# the least recently requested page is dropped. Set this to 0 to disable
+# revalidation entirely.
+REVALIDATION_CACHE_SIZE = 32
+_revalidation_cache = OrderedDict()
+_revalidation_lock = threading.Lock()
+
+# The pages downloaded by the fetch plan which is currently being executed, if
+# any. While set, every page is read from the pool instead of being downloaded
+# again, and pages which weren't planned are added to the pool as they are
+# downloaded.
+_page_pool = None
+
+# The directory in which fully parsed pages are saved so they don't need to be
+# parsed again on a later run. Each page is saved under a key derived from its
+# URL, a hash of its contents, and the version of the parser which created it,
+# so pages which have changed or were parsed by an older parser are never
+# reused. The cache is disabled while this is None.
+_parsed_cache_directory = None
+
+# Regular expressions for the date formats used on schedule pages which only
+# contain a month name, day, and year, optionally preceded by the day of the
+# week. Matching these directly is considerably faster than parsing the dates
+# with strptime.
+_DATE_PATTERNS = {
+    '%a, %b %d, %Y': re.compile(r'[A-Za-z]+, ([A-Za-z]+) (\d{1,2}), (\d{4})$'),
+    '%A, %b %d %Y': re.compile(r'[A-Za-z]+, ([A-Za-z]+) (\d{1,2}) (\d{4})$'),
+    '%a %B %d %Y': re.compile(r'[A-Za-z]+ ([A-Za-z]+) (\d{1,2}) (\d{4})$'),
+    '%b %d, %Y': re.compile(r'([A-Za-z]+) (\d{1,2}), (\d{4})$')
+}
+_ISO_DATE_PATTERN = re.compile(r'(\d{4})-(\d{2})-(\d{2})$')
+# Characters which are stripped from box score stats before converting them to
+# numbers, such as the '%' in '45.2%' or the '+' in '+12'.
+_NUMBER_FORMATTING = r'[%$,+]'
+_MONTH_ABBREVIATIONS = {
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6, 'jul': 7,
+    'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12
+}
+_MONTH_NAMES = {
+    'january': 1, 'february': 2, 'march': 3, 'april': 4, 'may': 5,
+    'june': 6, 'july': 7, 'august': 8, 'september': 9, 'october': 10,
+    'november': 11, 'december': 12
+}
+
+# The default number of pages which are downloaded ahead of the page currently
+# being parsed while prefetching. This also bounds the number of downloaded
+# pages held in memory at once.
+PREFETCH_WINDOW = 4
+# The maximum number of pages to download at once when several independent
+# pages are required to build a single object.
+MAX_WORKERS = 8
+
 
 def _todays_date():
     """
@@ -39,6 +138,113 @@ def _todays_date():
     return datetime.now()
 
 
+@lru_cache(maxsize=4096)
+def _parse_datetime(date_string, date_format):
+    """
+    Convert a date string from a schedule into a datetime object.
+
+    Every team's schedule lists many of the same dates, so results are cached
+    and each unique date string is only parsed once. The common date-only
+    formats used on schedule pages are matched directly instead of with
+    strptime, which is comparatively slow. Any other format, or any string the
+    fast path can't interpret, falls back to strptime.
+
+    Parameters
+    ----------
+    date_string : string
+        A ``string`` of the date to parse, such as 'Wed, Oct 18, 2017'.
+    date_format : string
+        A ``string`` of the strptime format the date is listed in, such as
+        '%a, %b %d, %Y'.
+
+    Returns
+    -------
+    datetime.datetime
+        The parsed date as a datetime object.
+
+    Raises
+    ------
+    ValueError
+        If the date string doesn't match the requested format.
+    """
+    if date_format == '%Y-%m-%d':
+        match = _ISO_DATE_PATTERN.match(date_string)
+        if match:
+            try:
+                return datetime(*[int(value) for value in match.groups()])
+            except ValueError:
+                pass
+    elif date_format in _DATE_PATTERNS:
+        match = _DATE_PATTERNS[date_format].match(date_string)
+        if match:
+            month, day, year = match.groups()
+            if '%B' in date_format:
+                months = _MONTH_NAMES
+            else:
+                months = _MONTH_ABBREVIATIONS
+            try:
+                return datetime(int(year), months[month.lower()], int(day))
+            except (KeyError, ValueError):
+                pass
+    return datetime.strptime(date_string, date_format)
+
+
+def _datetime_array(games):
+    """
+    Create an array of the datetime each game took place.
+
+    Collects the datetime of every passed game into a single numpy array so
+    games can be filtered and sorted by date in bulk.
+
+    Parameters
+    ----------
+    games : list
+        A ``list`` of Game instances with a ``datetime`` property.
+
+    Returns
+    -------
+    numpy array
+        A ``numpy array`` of ``datetime64`` values in the same order as the
+        games. Games without a valid date are represented by ``NaT``.
+    """
+    dates = []
+    for game in games:
+        try:
+            dates.append(game.datetime)
+        except (AttributeError, TypeError, ValueError):
+            dates.append(None)
+    return np.array(dates, dtype='datetime64[s]')
+
+
+def _games_between(games, dates, start_date, end_date):
+    """
+    Find all games which took place within a range of dates.
+
+    Parameters
+    ----------
+    games : list
+        A ``list`` of Game instances.
+    dates : numpy array
+        A ``numpy array`` of ``datetime64`` values for every game, as created
+        by ``_datetime_array``.
+    start_date : datetime
+        A datetime object of the earliest date to include.
+    end_date : datetime
+        A datetime object of the latest date to include.
+
+    Returns
+    -------
+    list
+        A ``list`` of Game instances played between the two dates, inclusive,
+        sorted in chronological order.
+    """
+    start = np.datetime64(start_date, 's')
+    end = np.datetime64(end_date, 's')
+    indices = np.flatnonzero((dates >= start) & (dates <= end))
+    indices = indices[np.argsort(dates[indices], kind='stable')]
+    return [games[index] for index in indices]
+
+
 def _url_exists(url):
     """
     Determine if a URL is valid and exists.
@@ -60,6 +266,9 @@ def _url_exists(url):
         False.
     """
     try:
+        html = _pooled_page(url)
+        if html is not None:
+            return bool(html)
         response = requests.head(url)
         if response.status_code == 301:
             response = requests.get(url)
@@ -139,16 +348,18 @@ def _parse_abbreviation(uri_link):
 
     Parameters
     ----------
-    uri_link : string
+    uri_link : string or PyQuery object
         A URI link which contains a team's abbreviation within other link
-        contents.
+        contents, or the link's tag.
 
     Returns
     -------
     string
         The shortened uppercase abbreviation for a given team.
     """
-    abbr = re.sub(r'/[0-9]+\..*htm.*', '', uri_link('a').attr('href'))
+    if not isinstance(uri_link, str):
+        uri_link = uri_link('a').attr('href')
+    abbr = re.sub(r'/[0-9]+\..*htm.*', '', uri_link)
     abbr = re.sub(r'/.*/schools/', '', abbr)
     abbr = re.sub(r'/teams/', '', abbr)
     return abbr.upper()
@@ -285,7 +496,372 @@ def _get_stats_table(html_page, div, footer=False):
     return teams_list
 
 
-def _pull_page(url=None, local_file=None):
+def _row_cells(row, cells=None):
+    """
+    Collect the text of every stat in a table row.
+
+    Parameters
+    ----------
+    row : PyQuery object
+        A PyQuery object of a single table row.
+    cells : dictionary (optional)
+        A ``dictionary`` of the stats already collected for the same player
+        from other rows. Stats which were already collected are not replaced,
+        matching the first value returned while parsing a field.
+
+    Returns
+    -------
+    dictionary
+        Returns a ``dictionary`` where each key is the ``string`` of the
+        stat's 'data-stat' attribute and each value is the ``string`` of the
+        stat's text.
+    """
+    if cells is None:
+        cells = {}
+    for cell in row('td[data-stat]').items():
+        cells.setdefault(cell.attr('data-stat'), cell.text())
+    return cells
+
+
+def _players_dataframe(player_dict):
+    """
+    Combine the box score stats for every player into a single DataFrame.
+
+    The stats are taken directly from the cells collected while reading the
+    box score tables, so no player instances need to be created and each
+    table is only traversed once.
+
+    Parameters
+    ----------
+    player_dict : dictionary
+        A ``dictionary`` where each key is a ``string`` of the player's ID and
+        each value is a ``dictionary`` with the player's 'name', the 'team'
+        they play for, and the 'cells' collected by ``_row_cells``.
+
+    Returns
+    -------
+    DataFrame
+        Returns a pandas ``DataFrame`` with a row for every player indexed by
+        the player ID. Each stat is named after its 'data-stat' attribute in
+        the box score tables, and stats which are numeric for every player are
+        converted to numbers. Returns None if no players were found.
+    """
+    rows = []
+    for details in player_dict.values():
+        row = {'name': details['name'], 'team': details['team']}
+        for stat, value in details['cells'].items():
+            row.setdefault(stat, value or None)
+        rows.append(row)
+    if not rows:
+        return None
+    frame = pd.DataFrame(rows, index=list(player_dict))
+    for column in frame.columns[2:]:
+        # Columns without any values are already numeric.
+        if pd.api.types.is_numeric_dtype(frame[column]):
+            continue
+        values = frame[column].str.replace(_NUMBER_FORMATTING, '', regex=True)
+        try:
+            frame[column] = pd.to_numeric(values)
+        except (TypeError, ValueError):
+            continue
+    return frame
+
+
+def _boxscore_state(boxscore):
+    """
+    Create a compact copy of a boxscore's attributes for pickling.
+
+    The raw HTML of each player's rows is only kept to create the players
+    the first time they are requested, and is typically several times larger
+    than every other attribute combined. Instead, the players are created
+    before pickling and the raw HTML is left out, so only parsed values are
+    stored.
+
+    Parameters
+    ----------
+    boxscore : Boxscore instance
+        The boxscore to pickle.
+
+    Returns
+    -------
+    dictionary
+        Returns a ``dictionary`` of the boxscore's attributes which can be
+        used to restore it.
+    """
+    state = dict(boxscore.__dict__)
+    if state.get('_player_dict') is None:
+        return state
+    state['_away_players'] = boxscore.away_players
+    state['_home_players'] = boxscore.home_players
+    state['_player_dict'] = {
+        player_id: {key: value for key, value in details.items()
+                    if key != 'data'}
+        for player_id, details in state['_player_dict'].items()
+    }
+    return state
+
+
+@lru_cache(maxsize=None)
+def _parser_version(constants):
+    """
+    Determine the version of the parser for a league.
+
+    The version combines the PARSER_VERSION declared in the league's
+    constants, which is incremented whenever the parsing logic changes, with
+    a fingerprint of every parsing scheme and other constant in the module.
+    Any change to a scheme therefore results in a new version without needing
+    to update PARSER_VERSION.
+
+    Parameters
+    ----------
+    constants : module
+        The constants module for the league, such as
+        ``sportsipy.nba.constants``.
+
+    Returns
+    -------
+    string
+        Returns a ``string`` uniquely identifying the version of the parser.
+    """
+    fingerprint = hashlib.sha256()
+    for name in sorted(vars(constants)):
+        if name.isupper():
+            value = getattr(constants, name)
+            fingerprint.update(repr((name, value)).encode('utf8'))
+    return '%s-%s' % (getattr(constants, 'PARSER_VERSION', 0),
+                      fingerprint.hexdigest())
+
+
+def _parsed_cache_key(url, constants, html=None):
+    """
+    Find the key for a page in the parsed cache.
+
+    As the key depends on the contents of the page, the page is downloaded if
+    it hasn't been already while the parsed cache is enabled. The contents
+    are returned along with the key so the page doesn't need to be downloaded
+    again if it needs to be parsed.
+
+    Parameters
+    ----------
+    url : string
+        A ``string`` of the URL of the page.
+    constants : module
+        The constants module for the league which parses the page.
+    html : string (optional)
+        The raw HTML contents of the page if it has already been downloaded.
+
+    Returns
+    -------
+    tuple
+        Returns a ``tuple`` of the raw HTML contents of the page, or None if
+        the page wasn't downloaded, and a ``string`` of the key for the page.
+        The key is None if the parsed cache is disabled or the page couldn't
+        be downloaded.
+    """
+    if _parsed_cache_directory is None:
+        return html, None
+    if html is None:
+        html = _download_page(url)
+    if not html:
+        return html, None
+    content = hashlib.sha256(html.encode('utf8')).hexdigest()
+    key = '\n'.join([url, content, _parser_version(constants)])
+    return html, hashlib.sha256(key.encode('utf8')).hexdigest()
+
+
+def _parsed_cache_path(key):
+    """
+    Get the path of the file holding a page in the parsed cache.
+
+    Parameters
+    ----------
+    key : string
+        A ``string`` of the key returned by ``_parsed_cache_key``.
+
+    Returns
+    -------
+    string
+        Returns a ``string`` of the path to the file. Files are spread across
+        subdirectories named after the first two characters of the key to
+        keep the number of files in each directory small.
+    """
+    return os.path.join(_parsed_cache_directory, key[:2], '%s.pickle' % key)
+
+
+def _load_parsed_page(instance, key):
+    """
+    Restore an object from a previously parsed copy of its page.
+
+    Parameters
+    ----------
+    instance : object
+        The object to restore, such as a Boxscore instance. Every attribute
+        is replaced with the value from the parsed copy.
+    key : string
+        A ``string`` of the key returned by ``_parsed_cache_key``, or None if
+        the page can't be found in the cache.
+
+    Returns
+    -------
+    boolean
+        Returns True if the object was restored, or False if it needs to be
+        parsed from the page.
+    """
+    if key is None:
+        return False
+    try:
+        with open(_parsed_cache_path(key), 'rb') as filehandle:
+            parsed = pickle.load(filehandle)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError,
+            ImportError):
+        return False
+    if type(parsed) is not type(instance):
+        return False
+    instance.__dict__.update(parsed.__dict__)
+    return True
+
+
+def _save_parsed_page(instance, key):
+    """
+    Save a parsed object so it can be restored without parsing its page.
+
+    The object is written to a temporary file which then replaces the cached
+    file, so other threads or processes reading the same page never see a
+    partially written file.
+
+    Parameters
+    ----------
+    instance : object
+        The object to save, such as a Boxscore instance.
+    key : string
+        A ``string`` of the key returned by ``_parsed_cache_key``. Nothing is
+        saved if the key is None.
+    """
+    if key is None:
+        return
+    path = _parsed_cache_path(key)
+    temporary = '%s.%s.%s.tmp' % (path, os.getpid(), threading.get_ident())
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(temporary, 'wb') as filehandle:
+            pickle.dump(instance, filehandle,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary, path)
+    except OSError:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+
+
+def _clear_revalidation_cache():
+    """
+    Forget all remembered page validators and pages.
+
+    Drops every entry saved by ``_pull_revalidated_page`` so the next request
+    for any page is downloaded in full.
+    """
+    with _revalidation_lock:
+        _revalidation_cache.clear()
+
+
+def _pull_revalidated_page(url):
+    """
+    Download a page which changes over time, reusing the last copy if possible.
+
+    Pages such as season summaries, schedules, and rankings are updated
+    throughout a season but are identical between most requests. The first
+    time a page is downloaded, the ETag and Last-Modified validators returned
+    by the server are saved alongside the compressed HTML of the page.
+    Subsequent requests send the validators with the If-None-Match and
+    If-Modified-Since headers, and if the server responds with a 304 (Not
+    Modified) status, the previously saved HTML is parsed again instead of
+    downloading the page. Only the transfer is saved, as the page is parsed
+    on every request either way.
+
+    Parameters
+    ----------
+    url : string
+        A ``string`` of the URL to pull data from.
+
+    Returns
+    -------
+    PyQuery object
+        Returns a ``PyQuery`` object representing the requested page.
+
+    Raises
+    ------
+    HTTPError
+        Raises an ``HTTPError`` if the server responds with an unsuccessful
+        status code, matching the behavior of downloading with ``PyQuery``.
+    """
+    with _revalidation_lock:
+        cached = _revalidation_cache.get(url)
+    headers = {}
+    if cached:
+        if cached['etag']:
+            headers['If-None-Match'] = cached['etag']
+        if cached['last_modified']:
+            headers['If-Modified-Since'] = cached['last_modified']
+    if headers:
+        response = requests.get(url=url, headers=headers)
+    else:
+        response = requests.get(url=url)
+    if cached and response.status_code == 304:
+        with _revalidation_lock:
+            if url in _revalidation_cache:
+                _revalidation_cache.move_to_end(url)
+        return pq(zlib.decompress(cached['html']).decode('utf8'))
+    if not 200 <= response.status_code < 300:
+        raise HTTPError(url, response.status_code,
+                        getattr(response, 'reason', None),
+                        getattr(response, 'headers', None), None)
+    doc = pq(response.text)
+    response_headers = getattr(response, 'headers', None) or {}
+    etag = response_headers.get('ETag')
+    last_modified = response_headers.get('Last-Modified')
+    with _revalidation_lock:
+        if (etag or last_modified) and REVALIDATION_CACHE_SIZE > 0:
+            _revalidation_cache[url] = {
+                'etag': etag,
+                'last_modified': last_modified,
+                'html': zlib.compress(response.text.encode('utf8'))
+            }
+            _revalidation_cache.move_to_end(url)
+            while len(_revalidation_cache) > REVALIDATION_CACHE_SIZE:
+                _revalidation_cache.popitem(last=False)
+        else:
+            _revalidation_cache.pop(url, None)
+    return doc
+
+
+def _pooled_page(url):
+    """
+    Read a page from the pool of the fetch plan being executed.
+
+    Parameters
+    ----------
+    url : string
+        A ``string`` of the URL of the page to read.
+
+    Returns
+    -------
+    string
+        Returns a ``string`` of the raw HTML contents of the page, or an empty
+        ``string`` if the page doesn't exist. Returns None if no fetch plan is
+        being executed, in which case the page should be downloaded as usual.
+
+    Raises
+    ------
+    HTTPError
+        Raises an ``HTTPError`` if the page couldn't be downloaded after
+        retrying.
+    """
+    pool = _page_pool
+    if pool is None:
+        return None
+    return pool.page(url)
+
+
+def _pull_page(url=None, local_file=None, revalidate=False):
     """
     Pull data from a local file if exists, or download data from the website.
 
@@ -300,6 +876,12 @@ def _pull_page(url=None, local_file=None):
         A ``string`` of the URL to pull data from.
     local_file : string (optional)
         A link to a local file which has been pre-downloaded from the website.
+    revalidate : boolean (optional)
+        Optionally remember the validators and compressed HTML of the page
+        and conditionally revalidate it on subsequent requests, which saves
+        downloading the page again while it is unchanged. The page is still
+        parsed on every request. Should be used for pages which change during
+        a season, such as schedules and season summaries.
 
     Returns
     -------
@@ -317,10 +899,492 @@ def _pull_page(url=None, local_file=None):
         with open(local_file, 'r', encoding='utf8') as filehandle:
             return pq(filehandle.read())
     if url:
+        html = _pooled_page(url)
+        if html is not None:
+            if not html:
+                raise HTTPError(url, 404, 'Not Found', None, None)
+            return pq(html)
+        if revalidate:
+            return _pull_revalidated_page(url)
         return pq(url)
     raise ValueError('Expected either a URL or a local data file!')
 
 
+def _pull_pages(pages, revalidate=False):
+    """
+    Download and parse several independent pages at once.
+
+    Some objects, such as the Teams classes, are built from multiple pages
+    which don't depend on each other. Rather than downloading and parsing the
+    pages one after another, each page is pulled in a separate thread so the
+    total time is roughly that of the slowest page.
+
+    Parameters
+    ----------
+    pages : list
+        A ``list`` of ``tuples`` containing the URL of each page and the
+        optional local file to read instead, in the same form as the
+        parameters to ``_pull_page``.
+    revalidate : boolean (optional)
+        A ``boolean`` which, when True, revalidates each URL against the
+        previously downloaded copy, if any.
+
+    Returns
+    -------
+    list
+        Returns a ``list`` of the PyQuery objects for each page in the same
+        order as the requested pages.
+    """
+    return _map_concurrently(
+        lambda page: _pull_page(page[0], page[1], revalidate=revalidate),
+        pages)
+
+
+def _download_page(url):
+    """
+    Download the raw HTML contents of a page without parsing it.
+
+    If a fetch plan is being executed, the page is read from the plan's pool
+    of pages instead.
+
+    Parameters
+    ----------
+    url : string
+        A ``string`` of the URL to download.
+
+    Returns
+    -------
+    string
+        Returns a ``string`` of the raw HTML contents of the page, or an empty
+        ``string`` if the page could not be downloaded.
+    """
+    try:
+        html = _pooled_page(url)
+        if html is not None:
+            return html
+        return _request_page(url)
+    except (HTTPError, requests.exceptions.RequestException):
+        return ''
+
+
+def _request_page(url):
+    """
+    Request the raw HTML contents of a page from the server.
+
+    Only a page which doesn't exist is returned as an empty ``string``. Any
+    other failure, such as the server being unavailable or throttling
+    requests, is raised so the caller can decide whether to try again.
+
+    Parameters
+    ----------
+    url : string
+        A ``string`` of the URL to download.
+
+    Returns
+    -------
+    string
+        Returns a ``string`` of the raw HTML contents of the page, or an empty
+        ``string`` if the page doesn't exist.
+
+    Raises
+    ------
+    HTTPError
+        Raises an ``HTTPError`` if the server responds with an unsuccessful
+        status code other than 404.
+    RequestException
+        Raises a ``RequestException`` if the request couldn't be completed,
+        such as when it times out.
+    """
+    response = requests.get(url=url)
+    if response.status_code == 404:
+        return ''
+    if not 200 <= response.status_code < 300:
+        raise HTTPError(url, response.status_code,
+                        getattr(response, 'reason', None),
+                        getattr(response, 'headers', None), None)
+    return response.text
+
+
+def _prefetch_pages(urls, window=PREFETCH_WINDOW):
+    """
+    Download pages in the background ahead of when they are needed.
+
+    Returns a generator which yields the raw HTML contents of every requested
+    URL in order. While the caller processes one page, up to ``window`` of the
+    following pages are downloaded on background threads so network time
+    overlaps with parsing. No more than ``window`` pages are downloaded or held
+    in memory at any time, regardless of the number of URLs requested.
+
+    Parameters
+    ----------
+    urls : iterable
+        An iterable of ``strings`` of the URLs to download, in the order they
+        should be returned.
+    window : int (optional)
+        The maximum number of pages to download ahead of the current page.
+
+    Returns
+    -------
+    generator
+        A generator of the raw HTML contents of each page as a ``string``.
+        Pages which could not be downloaded are returned as an empty
+        ``string``.
+    """
+    window = max(int(window), 1)
+    urls = iter(urls)
+    executor = ThreadPoolExecutor(max_workers=window)
+    pending = deque(executor.submit(_download_page, url)
+                    for url in islice(urls, window))
+    try:
+        while pending:
+            page = pending.popleft()
+            for url in islice(urls, 1):
+                pending.append(executor.submit(_download_page, url))
+            yield page.result()
+    finally:
+        for page in pending:
+            page.cancel()
+        executor.shutdown(wait=False)
+
+
+def _map_concurrently(function, items, workers=MAX_WORKERS):
+    """
+    Apply a function to each item using a pool of threads.
+
+    Most of the time spent building objects which depend on several pages is
+    spent waiting for the pages to download. Running the function for each
+    item in a separate thread allows the downloads to overlap while the
+    results are still returned in the same order as the passed items so the
+    output is deterministic.
+
+    Parameters
+    ----------
+    function : function
+        The function to call with each item as its only argument.
+    items : iterable
+        An iterable of the items to pass to the function.
+    workers : int (optional)
+        An ``int`` of the maximum number of threads to run at once.
+
+    Returns
+    -------
+    list
+        Returns a ``list`` of the values returned by the function in the same
+        order as the items. If the function raises an exception for any item,
+        the exception is re-raised.
+    """
+    items = list(items)
+    if not items:
+        return []
+    workers = max(min(int(workers), len(items)), 1)
+    if workers == 1:
+        return [function(item) for item in items]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(function, items))
+
+
+def _parse_in_processes(parser, arguments, processes=None,
+                        window=PREFETCH_WINDOW, initializer=None,
+                        initargs=()):
+    """
+    Run a parser for each set of arguments in a pool of worker processes.
+
+    Parsing a page with lxml and PyQuery is CPU-bound and holds the GIL, so
+    threads can only parse one page at a time. Instead, each page is parsed
+    in a separate process while the caller keeps downloading pages on
+    threads, allowing parsing to scale with the number of cores. The parsed
+    objects are pickled to return them to the calling process, so the parser
+    needs to be a module-level function or class which returns an object
+    holding only plain values.
+
+    The workers are always started with the 'spawn' method rather than being
+    forked, as the calling process is typically already running threads to
+    download pages, and forking a process with running threads can leave the
+    workers deadlocked on a lock held by one of those threads. As with any
+    spawned process, scripts using this need to guard their entry point with
+    ``if __name__ == '__main__':``.
+
+    Parameters
+    ----------
+    parser : function or class
+        The function or class to call with each set of arguments, such as
+        the Boxscore class.
+    arguments : iterable
+        An iterable of ``tuples`` of the arguments for each call. The iterable
+        is consumed lazily, so it can be a generator of pages which are still
+        being downloaded.
+    processes : int (optional)
+        An ``int`` of the number of worker processes to start. Defaults to the
+        number of CPUs on the machine.
+    window : int (optional)
+        The minimum number of pages to submit to the workers ahead of the
+        result currently being returned. At least one page is submitted per
+        worker so none of the workers are idle.
+    initializer : function (optional)
+        A module-level function which is called in each worker process as it
+        starts, such as to set up how the worker downloads pages.
+    initargs : tuple (optional)
+        A ``tuple`` of the arguments to pass to the initializer.
+
+    Returns
+    -------
+    generator
+        A generator of the values returned by the parser, in the same order
+        as the arguments.
+    """
+    processes = max(int(processes or os.cpu_count() or 1), 1)
+    window = max(int(window), processes)
+    arguments = iter(arguments)
+    executor = ProcessPoolExecutor(
+        max_workers=processes, mp_context=multiprocessing.get_context('spawn'),
+        initializer=initializer, initargs=initargs)
+    pending = deque(executor.submit(parser, *args)
+                    for args in islice(arguments, window))
+    try:
+        while pending:
+            result = pending.popleft()
+            for args in islice(arguments, 1):
+                pending.append(executor.submit(parser, *args))
+            yield result.result()
+    finally:
+        for result in pending:
+            result.cancel()
+        executor.shutdown(wait=False)
+
+
+def _player_url(player_class, player_id):
+    """
+    Build the URL of a player's stats page.
+
+    The URL is built by the league's own Player class so the URL matches the
+    one the player is later pulled from, without downloading anything.
+
+    Parameters
+    ----------
+    player_class : class
+        The league's Player class, such as ``sportsipy.nba.roster.Player``.
+    player_id : string
+        A ``string`` of the player's ID, such as 'hardeja01'.
+
+    Returns
+    -------
+    string
+        Returns a ``string`` of the URL of the player's stats page.
+    """
+    player = player_class.__new__(player_class)
+    player._player_id = player_id
+    return player._build_url()
+
+
+def _create_players(player_class, player_ids, processes=None,
+                    window=PREFETCH_WINDOW):
+    """
+    Create a Player instance for every player on a roster.
+
+    By default, each player's page is downloaded and parsed in the current
+    process, one player after another. If a number of processes is given,
+    the pages are instead downloaded ahead on background threads and each
+    page is parsed in one of the worker processes, the same way as the
+    boxscores for a schedule.
+
+    Parameters
+    ----------
+    player_class : class
+        The league's Player class, such as ``sportsipy.nba.roster.Player``,
+        which is created with the player's ID and the raw HTML of their page.
+    player_ids : list
+        A ``list`` of the ``string`` IDs of every player to create.
+    processes : int (optional)
+        An ``int`` of the number of worker processes to parse the pages in.
+        The pages are parsed in the current process if not specified.
+    window : int (optional)
+        The maximum number of pages to download ahead of the page currently
+        being parsed. At least one page per process is downloaded ahead.
+
+    Returns
+    -------
+    list
+        Returns a ``list`` of the Player instances in the same order as the
+        player IDs.
+    """
+    if not processes:
+        return [player_class(player_id) for player_id in player_ids]
+    window = max(window, processes)
+    urls = [_player_url(player_class, player_id) for player_id in player_ids]
+    pages = _prefetch_pages(urls, window)
+    return list(_parse_in_processes(player_class, zip(player_ids, pages),
+                                    processes, window))
+
+
+def _season_view(player, index=None):
+    """
+    Create a copy of a player which reads the stats from a single season.
+
+    The copy shares the lists of season stats with the original player, so
+    creating it doesn't duplicate any stats, and selecting a different season
+    on the copy leaves the original player's selected season untouched.
+
+    Parameters
+    ----------
+    player : Player instance
+        The player to read the stats from.
+    index : int (optional)
+        An ``int`` of the position of the season in the player's list of
+        seasons. The copy keeps the player's selected season if not
+        specified.
+
+    Returns
+    -------
+    Player instance
+        Returns a shallow copy of the player with the season selected.
+    """
+    view = copy.copy(player)
+    if index is not None:
+        view._index = index
+    return view
+
+
+def _career_dataframe(player):
+    """
+    Combine a player's stats for every season into a single DataFrame.
+
+    Stats which are read from a list of per-season values, as marked by the
+    league's property decorators with a ``_season_value`` function, are
+    converted straight from the parsed list into a whole column without
+    selecting each season in turn. The few remaining fields, such as the
+    player's name or height, are read from a single view of the player whose
+    selected season is moved from one season to the next. If any of those
+    fields isn't a property of the player, every field is read through
+    ``_dataframe_fields`` for each season instead.
+
+    Parameters
+    ----------
+    player : Player instance
+        The player to pull the stats for. The player's class needs to define
+        a ``_dataframe_fields`` method returning the stats for the selected
+        season.
+
+    Returns
+    -------
+    DataFrame
+        Returns a pandas ``DataFrame`` where each row is a season, in the
+        order the seasons are listed, indexed by the season.
+    """
+    seasons = list(player._season)
+    indices = range(len(seasons))
+    view = _season_view(player, 0)
+    fields = view._dataframe_fields() if seasons else {}
+    columns = {}
+    remaining = []
+    for field in fields:
+        prop = getattr(type(player), field, None)
+        season_value = getattr(getattr(prop, 'fget', None), '_season_value',
+                               None)
+        if season_value is None:
+            columns[field] = []
+            remaining.append(field)
+            continue
+        columns[field] = [season_value(player, index) for index in indices]
+    computed = any(not isinstance(getattr(type(player), field, None),
+                                  property) for field in remaining)
+    for index in indices:
+        view._index = index
+        values = view._dataframe_fields() if computed else None
+        for field in remaining:
+            if computed:
+                columns[field].append(values[field])
+            else:
+                columns[field].append(getattr(view, field))
+    return pd.DataFrame(columns, index=[seasons])
+
+
+def _season_frame(teams_class, year):
+    """
+    Pull the stats for every team in a single season.
+
+    Parameters
+    ----------
+    teams_class : class
+        The league's Teams class which is created with the season's year.
+    year : string
+        A ``string`` of the season to pull.
+
+    Returns
+    -------
+    DataFrame
+        Returns a pandas ``DataFrame`` of every team's stats with an
+        additional 'year' column identifying the season, or None if no stats
+        could be found.
+    """
+    teams = teams_class(year)
+    if not len(teams):
+        return None
+    frame = teams.dataframes
+    frame['year'] = year
+    return frame
+
+
+def _seasons_dataframe(teams_class, start_year, end_year,
+                       workers=MAX_WORKERS, processes=None):
+    """
+    Combine the stats for every team across a range of seasons.
+
+    Each season's Teams instance is created in a separate thread, so the
+    season pages are downloaded and parsed at the same time instead of one
+    season after another. If a number of processes is given, each season is
+    instead pulled and parsed in one of the worker processes, and only the
+    resulting stats are sent back.
+
+    However many seasons are pulled at once, every page is downloaded through
+    a single page pool which starts no more than
+    ``planner.REQUESTS_PER_MINUTE`` downloads per minute, as
+    sports-reference.com blocks clients making more requests than that. This
+    includes the pages each season pulls at the same time, such as the
+    conference pages for NCAA seasons. Worker processes each download at an
+    equal share of the rate.
+
+    Parameters
+    ----------
+    teams_class : class
+        The league's Teams class which is created with the season's year.
+    start_year : string or int
+        The first season to pull.
+    end_year : string or int
+        The last season to pull, inclusive.
+    workers : int (optional)
+        An ``int`` of the maximum number of seasons to pull at once.
+    processes : int (optional)
+        An ``int`` of the number of worker processes to pull the seasons in.
+        Takes the place of ``workers`` when specified.
+
+    Returns
+    -------
+    DataFrame
+        Returns a pandas ``DataFrame`` of every team's stats for each season
+        with an additional 'year' column identifying the season, in
+        chronological order. Returns None if no stats could be found for any
+        of the seasons.
+    """
+    # The planner depends on this module, so it is only imported once needed.
+    from .planner import _paced_downloads, _start_worker_pool
+
+    years = [str(year) for year in range(int(start_year), int(end_year) + 1)]
+    with _paced_downloads() as pool:
+        if processes:
+            arguments = ((teams_class, year) for year in years)
+            seasons = list(_parse_in_processes(
+                _season_frame, arguments, processes, processes,
+                initializer=_start_worker_pool,
+                initargs=pool.worker_arguments(processes)))
+        else:
+            seasons = _map_concurrently(
+                lambda year: _season_frame(teams_class, year), years, workers)
+    frames = [frame for frame in seasons if frame is not None]
+    if not frames:
+        return None
+    return pd.concat(frames)
+
+
 def _no_data_found():
     """
     Print a message that no data could be found on the page.
@@ -1,12 +1,18 @@
+import gc
 import mock
 import os
 import pandas as pd
+import pickle
+import weakref
 from datetime import datetime
 from flexmock import flexmock
-from sportsipy import utils
+from lxml.etree import _Element
+from pyquery import PyQuery
+from sportsipy import cache, utils
 from sportsipy.constants import AWAY
 from sportsipy.nba.constants import BOXSCORE_URL, BOXSCORES_URL
 from sportsipy.nba.boxscore import Boxscore, Boxscores
+from sportsipy.store import Store
 
 
 MONTH = 10
@@ -152,6 +158,9 @@ class TestNBABoxscore:
         for key, value in boxscore.__dict__.items():
             if key == '_uri':
                 continue
+            if key == '_player_dict':
+                assert value == {}
+                continue
             assert value is None
 
     def test_nba_boxscore_dataframe_returns_dataframe_of_all_values(self):
@@ -168,6 +177,77 @@ class TestNBABoxscore:
 
         assert df1.empty
 
+    def test_nba_boxscore_players_dataframe(self):
+        df = self.boxscore.players_dataframe
+        players = self.boxscore.away_players + self.boxscore.home_players
+
+        assert len(df) == 26
+        assert len(df[df['team'] == 'Home']) == 13
+        assert set(df.index) == {player.player_id for player in players}
+
+    @mock.patch('requests.get', side_effect=mock_pyquery)
+    def test_nba_boxscore_releases_parsed_page(self, *args, **kwargs):
+        documents = []
+        retrieve_html_page = Boxscore._retrieve_html_page
+
+        def retrieve(boxscore, uri, html=None):
+            document = retrieve_html_page(boxscore, uri, html)
+            documents.append(weakref.ref(document))
+            return document
+
+        with mock.patch.object(Boxscore, '_retrieve_html_page', retrieve):
+            boxscore = Boxscore(BOXSCORE)
+        gc.collect()
+
+        assert documents[0]() is None
+        values = list(boxscore.__dict__.values())
+        while values:
+            value = values.pop()
+            assert not isinstance(value, (PyQuery, _Element))
+            if isinstance(value, dict):
+                values.extend(value.values())
+            elif isinstance(value, (list, tuple)):
+                values.extend(value)
+
+    def test_nba_boxscore_pickles_parsed_values(self):
+        boxscore = pickle.loads(pickle.dumps(self.boxscore))
+
+        assert str(boxscore) == str(self.boxscore)
+        assert boxscore.dataframe.equals(self.boxscore.dataframe)
+        assert boxscore.players_dataframe.equals(
+            self.boxscore.players_dataframe)
+        for details in boxscore._player_dict.values():
+            assert 'data' not in details
+        for player, original in zip(boxscore.home_players,
+                                    self.boxscore.home_players):
+            assert player.dataframe.equals(original.dataframe)
+
+    def test_nba_boxscore_is_restored_from_parsed_cache(self, tmp_path):
+        cache.enable(str(tmp_path))
+        try:
+            with mock.patch('requests.get', side_effect=mock_pyquery):
+                Boxscore(BOXSCORE)
+                flexmock(Boxscore).should_receive('_retrieve_html_page') \
+                    .never()
+                boxscore = Boxscore(BOXSCORE)
+        finally:
+            cache.disable()
+
+        assert boxscore.dataframe.equals(self.boxscore.dataframe)
+        assert boxscore.players_dataframe.equals(
+            self.boxscore.players_dataframe)
+
+    def test_nba_boxscore_is_saved_to_store(self):
+        with Store(':memory:') as store:
+            store.save_boxscores([self.boxscore])
+            games = store.games(league='nba')
+            players = store.player_games(uri=BOXSCORE)
+
+        assert list(games['uri']) == [BOXSCORE]
+        assert games['away_points'][0] == self.boxscore.away_points
+        assert games['pace'][0] == self.boxscore.pace
+        assert len(players) == len(self.boxscore.players_dataframe)
+
     def test_nba_boxscore_players(self):
         assert len(self.boxscore.home_players) == 13
         assert len(self.boxscore.away_players) == 13
@@ -1,8 +1,13 @@
+import gc
 import mock
 import os
 import pandas as pd
+import pickle
+import weakref
 from datetime import datetime
 from flexmock import flexmock
+from lxml.etree import _Element
+from pyquery import PyQuery
 from sportsipy import utils
 from sportsipy.constants import HOME
 from sportsipy.nfl.constants import BOXSCORE_URL, BOXSCORES_URL
@@ -135,6 +140,9 @@ class TestNFLBoxscore:
         for key, value in boxscore.__dict__.items():
             if key == '_uri':
                 continue
+            if key == '_player_dict':
+                assert value == {}
+                continue
             assert value is None
 
     def test_nfl_boxscore_dataframe_returns_dataframe_of_all_values(self):
@@ -151,6 +159,51 @@ class TestNFLBoxscore:
 
         assert df1.empty
 
+    def test_nfl_boxscore_players_dataframe(self):
+        df = self.boxscore.players_dataframe
+        players = self.boxscore.away_players + self.boxscore.home_players
+
+        assert len(df) == 61
+        assert len(df[df['team'] == 'Home']) == 33
+        assert set(df.index) == {player.player_id for player in players}
+
+    @mock.patch('requests.get', side_effect=mock_pyquery)
+    def test_nfl_boxscore_releases_parsed_page(self, *args, **kwargs):
+        documents = []
+        retrieve_html_page = Boxscore._retrieve_html_page
+
+        def retrieve(boxscore, uri, html=None):
+            document = retrieve_html_page(boxscore, uri, html)
+            documents.append(weakref.ref(document))
+            return document
+
+        with mock.patch.object(Boxscore, '_retrieve_html_page', retrieve):
+            boxscore = Boxscore(BOXSCORE)
+        gc.collect()
+
+        assert documents[0]() is None
+        values = list(boxscore.__dict__.values())
+        while values:
+            value = values.pop()
+            assert not isinstance(value, (PyQuery, _Element))
+            if isinstance(value, dict):
+                values.extend(value.values())
+            elif isinstance(value, (list, tuple)):
+                values.extend(value)
+
+    def test_nfl_boxscore_pickles_parsed_values(self):
+        boxscore = pickle.loads(pickle.dumps(self.boxscore))
+
+        assert str(boxscore) == str(self.boxscore)
+        assert boxscore.dataframe.equals(self.boxscore.dataframe)
+        assert boxscore.players_dataframe.equals(
+            self.boxscore.players_dataframe)
+        for details in boxscore._player_dict.values():
+            assert 'data' not in details
+        for player, original in zip(boxscore.home_players,
+                                    self.boxscore.home_players):
+            assert player.dataframe.equals(original.dataframe)
+
     def test_nfl_boxscore_players(self):
         boxscore = Boxscore(BOXSCORE)
 
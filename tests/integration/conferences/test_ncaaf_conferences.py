@@ -3,6 +3,7 @@ import pytest
 from flexmock import flexmock
 from os.path import join, dirname
 from sportsipy import utils
+from sportsipy.ncaaf import conferences as conferences_module
 from sportsipy.ncaaf.conferences import Conference, Conferences
 
 
@@ -197,3 +198,42 @@ class TestNCAAFConferences:
         conference = Conference('acc')
 
         assert conference.__repr__() == 'acc - NCAAF'
+
+    def test_conferences_are_cached_per_season(self):
+        conferences_module._clear_conferences_cache()
+
+        with mock.patch('requests.get', side_effect=mock_pyquery) as get:
+            first = Conferences(YEAR)
+            requests_made = get.call_count
+            second = Conferences(YEAR)
+
+        assert requests_made > 1
+        assert get.call_count == requests_made
+        assert second.team_conference == first.team_conference
+        assert second.conferences == first.conferences
+        assert second.conferences is not first.conferences
+
+    def test_current_season_conferences_are_not_cached(self):
+        conferences_module._clear_conferences_cache()
+        flexmock(utils) \
+            .should_receive('_find_year_for_season') \
+            .and_return(YEAR)
+
+        with mock.patch('requests.get', side_effect=mock_pyquery) as get:
+            Conferences(YEAR)
+            requests_made = get.call_count
+            Conferences(YEAR)
+
+        assert get.call_count == 2 * requests_made
+        assert not conferences_module._conferences_cache
+
+    @mock.patch.object(conferences_module, 'CONFERENCES_CACHE_SIZE', 1)
+    def test_oldest_season_is_forgotten_when_full(self):
+        conferences_module._clear_conferences_cache()
+
+        with mock.patch('requests.get', side_effect=mock_pyquery):
+            Conferences(YEAR - 1)
+            Conferences(YEAR)
+
+        assert list(conferences_module._conferences_cache) == \
+            [(str(YEAR), False)]
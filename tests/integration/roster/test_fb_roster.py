@@ -3,6 +3,7 @@ import pandas as pd
 from flexmock import flexmock
 from os import path
 from pyquery import PyQuery as pq
+from sportsipy.fb.fb_utils import release_squad_page
 from sportsipy.fb.roster import Roster
 
 
@@ -27,6 +28,7 @@ def mock_pyquery(url):
 class TestFBRoster:
     @mock.patch('requests.get', side_effect=mock_pyquery)
     def setup_method(self, *args, **kwargs):
+        release_squad_page()
         self.results = {
             'name': 'Harry Kane',
             'player_id': '21a66f6a',
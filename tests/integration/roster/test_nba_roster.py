@@ -1,10 +1,11 @@
 import mock
 import os
 import pandas as pd
+import pickle
 import pytest
 from datetime import datetime
 from flexmock import flexmock
-from sportsipy import utils
+from sportsipy import cache, utils
 from sportsipy.nba.roster import Player, Roster
 from sportsipy.nba.teams import Team
 
@@ -312,6 +313,29 @@ class TestNBAPlayer:
         for attribute, value in self.results_2018.items():
             assert getattr(player, attribute) == value
 
+    def test_nba_player_season_view_leaves_player_unchanged(self):
+        season = self.player.for_season('2017-18')
+        career = self.player.for_season('Career')
+
+        for attribute, value in self.results_2018.items():
+            assert getattr(season, attribute) == value
+        for attribute, value in self.results_career.items():
+            assert getattr(career, attribute) == value
+        assert self.player.season == 'Career'
+
+    def test_nba_player_is_restored_from_parsed_cache(self, tmp_path):
+        cache.enable(str(tmp_path))
+        try:
+            with mock.patch('requests.get', side_effect=mock_pyquery):
+                Player('hardeja01')
+                flexmock(Player).should_receive('_pull_player_data').never()
+                player = Player('hardeja01')
+        finally:
+            cache.disable()
+
+        assert player.dataframe.equals(self.player.dataframe)
+        assert player('2017-18').points == self.player('2017-18').points
+
     def test_dataframe_returns_dataframe(self):
         dataframe = [
             {'field_goal_perc_ten_to_sixteen_feet': 0.463,
@@ -1246,6 +1270,35 @@ class TestNBARoster:
             assert player.name in ['James Harden', 'Tarik Black',
                                    'Ryan Anderson', 'Trevor Ariza']
 
+    @mock.patch('requests.get', side_effect=mock_pyquery)
+    def test_roster_class_pickles_parsed_values(self, *args, **kwargs):
+        flexmock(utils) \
+            .should_receive('_find_year_for_season') \
+            .and_return('2018')
+        roster = Roster('HOU')
+
+        restored = pickle.loads(pickle.dumps(roster))
+
+        assert [player.player_id for player in restored.players] == \
+            [player.player_id for player in roster.players]
+        for player, original in zip(restored.players, roster.players):
+            assert player.dataframe.equals(original.dataframe)
+
+    @mock.patch('requests.get', side_effect=mock_pyquery)
+    def test_roster_class_parses_players_in_processes(self, *args,
+                                                      **kwargs):
+        flexmock(utils) \
+            .should_receive('_find_year_for_season') \
+            .and_return('2018')
+        roster = Roster('HOU')
+
+        parallel = Roster('HOU', processes=2)
+
+        assert [player.player_id for player in parallel.players] == \
+            [player.player_id for player in roster.players]
+        for player, original in zip(parallel.players, roster.players):
+            assert player.dataframe.equals(original.dataframe)
+
     @mock.patch('requests.get', side_effect=mock_pyquery)
     def test_bad_url_raises_value_error(self, *args, **kwargs):
         with pytest.raises(ValueError):
@@ -983,6 +983,17 @@ class TestNFLPlayer:
         for attribute, value in self.qb_results_2017.items():
             assert getattr(player, attribute) == value
 
+    @mock.patch('requests.get', side_effect=mock_pyquery)
+    def test_nfl_qb_season_view_leaves_player_unchanged(self, *args,
+                                                        **kwargs):
+        player = Player('BreeDr00')
+        season = player.for_season('2017')
+
+        for attribute, value in self.qb_results_2017.items():
+            assert getattr(season, attribute) == value
+        for attribute, value in self.qb_results_career.items():
+            assert getattr(player, attribute) == value
+
     @mock.patch('requests.get', side_effect=mock_pyquery)
     def test_nfl_olb_returns_requested_career_stats(self, *args, **kwargs):
         # Request the career stats
@@ -7,6 +7,7 @@ from os import path
 from pyquery import PyQuery as pq
 from sportsipy import utils
 from sportsipy.constants import AWAY, DRAW
+from sportsipy.fb.fb_utils import release_squad_page
 from sportsipy.fb.schedule import Schedule
 
 
@@ -32,6 +33,7 @@ def mock_pyquery(url):
 class TestFBSchedule:
     @patch('requests.get', side_effect=mock_pyquery)
     def setup_method(self, *args, **kwargs):
+        release_squad_page()
         self.results = {
             'competition': 'Premier League',
             'matchweek': 'Matchweek 2',
@@ -1,6 +1,7 @@
 import mock
 import os
 import pandas as pd
+import pickle
 import pytest
 from datetime import datetime
 from flexmock import flexmock
@@ -100,6 +101,13 @@ class TestNBASchedule:
     def test_nba_schedule_returns_correct_number_of_games(self):
         assert len(self.schedule) == NUM_GAMES_IN_SCHEDULE
 
+    def test_nba_schedule_pickles_parsed_values(self):
+        schedule = pickle.loads(pickle.dumps(self.schedule))
+
+        assert schedule.dataframe.equals(self.schedule.dataframe)
+        for attribute, value in self.results.items():
+            assert getattr(schedule[1], attribute) == value
+
     def test_nba_schedule_returns_requested_match_from_index(self):
         match_two = self.schedule[1]
 
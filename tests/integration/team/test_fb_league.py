@@ -0,0 +1,71 @@
+import mock
+import pandas as pd
+import pytest
+from flexmock import flexmock
+from os import path
+from sportsipy.fb import league
+from sportsipy.fb.fb_utils import release_squad_page
+from sportsipy.fb.league import League
+
+
+def read_file(filename):
+    filepath = path.join(path.dirname(__file__), 'fb_stats', filename)
+    return open('%s' % filepath, 'r', encoding='utf8').read()
+
+
+def mock_pyquery(url):
+    class MockPQ:
+        def __init__(self, html_contents):
+            self.status_code = 200
+            self.html_contents = html_contents
+            self.text = html_contents
+
+    contents = read_file('tottenham-hotspur-2019-2020.html')
+    return MockPQ(contents)
+
+
+class TestFBLeague:
+    def setup_method(self):
+        release_squad_page()
+        flexmock(league) \
+            .should_receive('_league_squad_ids') \
+            .with_args('10728') \
+            .and_return(['361ca564', '18bb7c10'])
+
+    def test_league_pulls_each_squad_page_once(self):
+        with mock.patch('requests.get', side_effect=mock_pyquery) as get:
+            premier_league = League('10728')
+
+        assert get.call_count == 2
+        assert len(premier_league) == 2
+        assert [team.squad_id for team in premier_league] == \
+            ['361ca564', '18bb7c10']
+        assert premier_league['361CA564'].name == 'Tottenham Hotspur'
+        assert set(premier_league.schedules) == {'361ca564', '18bb7c10'}
+        assert len(premier_league.rosters['18bb7c10']) > 0
+
+    @mock.patch('requests.get', side_effect=mock_pyquery)
+    def test_league_dataframe_combines_every_squad(self, *args, **kwargs):
+        premier_league = League('10728', workers=1)
+        players = len(premier_league.rosters['361ca564'])
+
+        df = premier_league.dataframe
+
+        assert isinstance(df, pd.DataFrame)
+        assert len(df) == players * 2
+        assert set(df['squad_id']) == {'361ca564', '18bb7c10'}
+
+    def test_unknown_league_raises_value_error(self):
+        flexmock(league) \
+            .should_receive('_league_squad_ids') \
+            .and_return([])
+
+        with pytest.raises(ValueError):
+            League('invalid')
+
+    @mock.patch('requests.get', side_effect=mock_pyquery)
+    def test_missing_squad_raises_value_error(self, *args, **kwargs):
+        premier_league = League('10728')
+
+        with pytest.raises(ValueError):
+            premier_league['zzzzzzzz']
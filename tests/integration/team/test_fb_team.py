@@ -1,5 +1,7 @@
+import pickle
 from mock import patch
 from os import path
+from sportsipy.fb.fb_utils import release_squad_page
 from sportsipy.fb.team import Team
 
 
@@ -21,6 +23,7 @@ def mock_pyquery(url):
 
 class TestFBTeam:
     def setup_method(self):
+        release_squad_page()
         self.results = {
             'name': 'Tottenham Hotspur',
             'season': '2019-2020',
@@ -58,6 +61,13 @@ class TestFBTeam:
         for attribute, value in self.results.items():
             assert getattr(tottenham, attribute) == value
 
+    @patch('requests.get', side_effect=mock_pyquery)
+    def test_fb_team_pickles_parsed_values(self, *args, **kwargs):
+        tottenham = pickle.loads(pickle.dumps(Team('Tottenham Hotspur')))
+
+        for attribute, value in self.results.items():
+            assert getattr(tottenham, attribute) == value
+
     @patch('requests.get', side_effect=mock_pyquery)
     def test_team_name(self, *args, **kwargs):
         team = Team('Tottenham Hotspur')
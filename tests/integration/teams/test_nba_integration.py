@@ -1,6 +1,7 @@
 import mock
 import os
 import pandas as pd
+import pickle
 import pytest
 from flexmock import flexmock
 from sportsipy import utils
@@ -120,6 +121,11 @@ class TestNBAIntegration:
     def test_nba_integration_returns_correct_number_of_teams(self):
         assert len(self.teams) == len(self.abbreviations)
 
+    def test_nba_integration_teams_pickle_parsed_values(self):
+        teams = pickle.loads(pickle.dumps(self.teams))
+
+        assert teams.dataframes.equals(self.teams.dataframes)
+
     def test_nba_integration_returns_correct_attributes_for_team(self):
         detroit = self.teams('DET')
 
@@ -0,0 +1,119 @@
+import os
+from flexmock import flexmock
+from types import ModuleType
+from sportsipy import cache, utils
+
+
+URL = 'https://www.basketball-reference.com/boxscores/201710310LAL.html'
+
+
+def constants_module(scheme, version=1):
+    module = ModuleType('constants')
+    module.BOXSCORE_SCHEME = scheme
+    module.PARSER_VERSION = version
+    return module
+
+
+class Parsed:
+    def __init__(self, value):
+        self.value = value
+
+
+class TestParsedCache:
+    def setup_method(self):
+        self.constants = constants_module({'points': 'td[data-stat="pts"]'})
+
+    def teardown_method(self):
+        cache.disable()
+
+    def test_disabled_cache_has_no_key(self):
+        html, key = utils._parsed_cache_key(URL, self.constants, '<html>')
+
+        assert html == '<html>'
+        assert key is None
+
+    def test_page_is_downloaded_when_enabled(self, tmp_path):
+        cache.enable(str(tmp_path))
+        flexmock(utils).should_receive('_download_page').with_args(URL) \
+            .and_return('<html>').once()
+
+        html, key = utils._parsed_cache_key(URL, self.constants)
+
+        assert html == '<html>'
+        assert key is not None
+
+    def test_missing_page_has_no_key(self, tmp_path):
+        cache.enable(str(tmp_path))
+        flexmock(utils).should_receive('_download_page').and_return('')
+
+        html, key = utils._parsed_cache_key(URL, self.constants)
+
+        assert html == ''
+        assert key is None
+
+    def test_saved_page_is_restored(self, tmp_path):
+        cache.enable(str(tmp_path))
+        _, key = utils._parsed_cache_key(URL, self.constants, '<html>')
+        utils._save_parsed_page(Parsed(25), key)
+
+        restored = Parsed(None)
+
+        assert utils._load_parsed_page(restored, key)
+        assert restored.value == 25
+
+    def test_unsaved_page_is_not_restored(self, tmp_path):
+        cache.enable(str(tmp_path))
+        _, key = utils._parsed_cache_key(URL, self.constants, '<html>')
+
+        restored = Parsed(None)
+
+        assert not utils._load_parsed_page(restored, key)
+        assert restored.value is None
+
+    def test_corrupt_page_is_not_restored(self, tmp_path):
+        cache.enable(str(tmp_path))
+        _, key = utils._parsed_cache_key(URL, self.constants, '<html>')
+        path = utils._parsed_cache_path(key)
+        os.makedirs(os.path.dirname(path))
+        with open(path, 'wb') as filehandle:
+            filehandle.write(b'not a pickle')
+
+        assert not utils._load_parsed_page(Parsed(None), key)
+
+    def test_key_changes_with_page_contents(self, tmp_path):
+        cache.enable(str(tmp_path))
+        _, key = utils._parsed_cache_key(URL, self.constants, '<html>')
+        _, changed = utils._parsed_cache_key(URL, self.constants, '<html> ')
+
+        assert key != changed
+
+    def test_key_changes_with_parsing_scheme(self, tmp_path):
+        cache.enable(str(tmp_path))
+        updated = constants_module({'points': 'td[data-stat="points"]'})
+        _, key = utils._parsed_cache_key(URL, self.constants, '<html>')
+        _, changed = utils._parsed_cache_key(URL, updated, '<html>')
+
+        assert key != changed
+
+    def test_key_changes_with_parser_version(self, tmp_path):
+        cache.enable(str(tmp_path))
+        updated = constants_module(self.constants.BOXSCORE_SCHEME, version=2)
+        _, key = utils._parsed_cache_key(URL, self.constants, '<html>')
+        _, changed = utils._parsed_cache_key(URL, updated, '<html>')
+
+        assert key != changed
+
+    def test_clear_removes_saved_pages(self, tmp_path):
+        cache.enable(str(tmp_path))
+        _, key = utils._parsed_cache_key(URL, self.constants, '<html>')
+        utils._save_parsed_page(Parsed(25), key)
+
+        cache.clear()
+
+        assert not utils._load_parsed_page(Parsed(None), key)
+
+    def test_disable_stops_using_cache(self, tmp_path):
+        cache.enable(str(tmp_path))
+        cache.disable()
+
+        assert utils._parsed_cache_directory is None
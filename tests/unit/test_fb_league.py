@@ -0,0 +1,80 @@
+import pandas as pd
+import pytest
+from flexmock import flexmock
+from sportsipy.fb import league
+from sportsipy.fb.league import League
+
+
+class MockTeam:
+    def __init__(self, squad_id, name):
+        self.squad_id = squad_id
+        self.name = name
+
+
+class MockItem:
+    def __init__(self, frame):
+        self.dataframe = frame
+
+
+class TestFBLeague:
+    def setup_method(self):
+        squads = {
+            '361ca564': (MockTeam('361ca564', 'Tottenham Hotspur'),
+                         [MockItem(pd.DataFrame([{'goals_for': 2}],
+                                                index=['a'])),
+                          MockItem(None)],
+                         [MockItem(pd.DataFrame([{'goals': 1}],
+                                                index=['kane']))]),
+            '18bb7c10': (MockTeam('18bb7c10', 'Arsenal'),
+                         [MockItem(None)],
+                         [])
+        }
+        flexmock(league) \
+            .should_receive('_league_squad_ids') \
+            .and_return(['361ca564', '18bb7c10'])
+        flexmock(League) \
+            .should_receive('_pull_squad') \
+            .replace_with(lambda squad_id: squads[squad_id])
+        self.league = League('10728')
+
+    def test_squads_are_kept_in_league_order(self):
+        assert [team.name for team in self.league] == ['Tottenham Hotspur',
+                                                       'Arsenal']
+        assert str(self.league) == 'Tottenham Hotspur (361ca564)\n' \
+            'Arsenal (18bb7c10)'
+
+    def test_schedule_dataframe_skips_unplayed_games(self):
+        df = self.league.schedule_dataframe
+
+        assert list(df.index) == ['a']
+        assert list(df['squad_id']) == ['361ca564']
+
+    def test_dataframe_includes_squad_id(self):
+        df = self.league.dataframe
+
+        assert list(df.index) == ['kane']
+        assert list(df['squad_id']) == ['361ca564']
+
+
+class TestFBLeagueSquadPages:
+    def test_squad_page_is_released_after_pulling(self):
+        team = flexmock(schedule='schedule', roster='roster')
+        flexmock(league).should_receive('Team').and_return(team)
+        flexmock(league) \
+            .should_receive('release_squad_page') \
+            .with_args('361ca564') \
+            .once()
+
+        result = League._pull_squad(None, '361ca564')
+
+        assert result == (team, 'schedule', 'roster')
+
+    def test_squad_page_is_released_after_error(self):
+        flexmock(league).should_receive('Team').and_raise(ValueError)
+        flexmock(league) \
+            .should_receive('release_squad_page') \
+            .with_args('361ca564') \
+            .once()
+
+        with pytest.raises(ValueError):
+            League._pull_squad(None, '361ca564')
@@ -50,6 +50,16 @@ class TestFBRoster:
         with pytest.raises(ValueError):
             self.roster('')
 
+    def test_player_found_by_id_or_name(self):
+        kane = MockSquadPlayer('Harry Kane', '21a66f6a')
+        son = MockSquadPlayer('Son Heung-min', '92e7e919')
+        self.roster._players = [kane, son]
+
+        assert self.roster('21A66F6A') is kane
+        assert self.roster(' son heung-min ') is son
+        with pytest.raises(ValueError):
+            self.roster('Dele Alli')
+
     def test_invalid_player_id_returns_none(self):
         result = self.roster._player_id(pq('<th data-stat="player"></th>'))
 
@@ -60,6 +70,45 @@ class TestFBRoster:
 
         assert result == {}
 
+    def test_stats_rows_are_merged_by_player(self):
+        standard = pq("""<table><tbody>
+            <tr><th data-stat="player"><a href="/en/players/21a66f6a/Kane">
+            Harry Kane</a></th><td data-stat="nationality">
+            <a href="/en/country/ENG/England-Football">ENG</a></td>
+            <td data-stat="goals">18</td></tr>
+            <tr class="thead"><th data-stat="player">Player</th></tr>
+            </tbody></table>""")
+        shooting = pq("""<table><tbody>
+            <tr><th data-stat="player"><a href="/en/players/21a66f6a/Kane">
+            Harry Kane</a></th><td data-stat="goals">17</td>
+            <td data-stat="shots_total">84</td></tr>
+            </tbody></table>""")
+
+        result = self.roster._add_stats_data(standard('tbody tr').items(), {})
+        result = self.roster._add_stats_data(shooting('tbody tr').items(),
+                                             result)
+
+        assert result == {'21a66f6a': {
+            'player': 'Harry Kane',
+            'nationality': '/en/country/ENG/England-Football',
+            'goals': '18',
+            'shots_total': '84'
+        }}
+
+    def test_player_stats_parsed_from_merged_stats(self):
+        flexmock(SquadPlayer) \
+            .should_call('_parse_player_stats')
+        stats = {'player': 'Harry Kane',
+                 'nationality': '/en/country/ENG/England-Football',
+                 'goals': '18'}
+
+        player = SquadPlayer(stats, '21a66f6a')
+
+        assert player.name == 'Harry Kane'
+        assert player.nationality == 'England'
+        assert player.goals == 18
+        assert player.assists is None
+
     @mock.patch('requests.get', side_effect=mock_httperror)
     def test_invalid_http_page_error(self, *args, **kwargs):
         flexmock(Roster) \
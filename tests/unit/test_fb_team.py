@@ -189,6 +189,21 @@ class TestFBTeam:
 
         assert len(self.team.roster) == 0
 
+    def test_fb_schedule_and_roster_reuse_team_page(self):
+        doc = '<html></html>'
+        self.team._doc = doc
+        flexmock(Schedule) \
+            .should_receive('_pull_schedule') \
+            .with_args('361ca564', doc) \
+            .once()
+        flexmock(Roster) \
+            .should_receive('_pull_stats') \
+            .with_args(doc) \
+            .once()
+
+        self.team.schedule
+        self.team.roster
+
     def test_fb_no_doc_returns_roster(self):
         flexmock(Team) \
             .should_receive('__init__') \
@@ -1,7 +1,21 @@
+import mock
 import pytest
-from sportsipy.fb.fb_utils import (_lookup_team,
+from flexmock import flexmock
+from pyquery import PyQuery as pq
+from sportsipy import utils
+from sportsipy.fb import fb_utils
+from sportsipy.fb.fb_utils import (_build_squad_name_index,
+                                   _closest_squad_names,
+                                   _is_squad_id,
+                                   _league_ids,
+                                   _league_squad_ids,
+                                   _SortedTable,
+                                   _squad_ids,
+                                   _lookup_team,
                                    lookup_squad_id,
-                                   _parse_squad_name)
+                                   _parse_squad_name,
+                                   _pull_squad_document,
+                                   release_squad_page)
 
 
 class TestFBUtils:
@@ -36,3 +50,109 @@ class TestFBUtils:
     def test_team_name_lookup_no_match(self):
         with pytest.raises(ValueError):
             result = _lookup_team('noteamname')
+
+    def test_squad_lookup_returns_ranked_matches(self):
+        output = lookup_squad_id('Tottenham', quiet=True)
+
+        assert list(output)[0] == 'Tottenham Hotspur'
+        assert output['Tottenham Hotspur'] == '361ca564'
+        assert len(output) <= 5
+
+    def test_quiet_squad_lookup_prints_nothing(self, capsys):
+        lookup_squad_id('Tottenham', quiet=True)
+
+        assert capsys.readouterr().out == ''
+
+    def test_closest_squad_names_uses_cutoff(self):
+        assert _closest_squad_names('qqqqqqqqqqqq') == []
+
+    def test_squad_name_index_maps_trigrams_to_names(self):
+        names, sizes, index = _build_squad_name_index(['ajax', 'arsenal'])
+
+        assert names == ['ajax', 'arsenal']
+        assert sizes == [5, 8]
+        assert index['  a'] == [0, 1]
+        assert index['jax'] == [0]
+
+    def test_sorted_table_lookups(self, tmp_path):
+        data_file = tmp_path / 'table.tsv'
+        data_file.write_text('arsenal\t18bb7c10\nchelsea\tcff3d9bb\n',
+                             encoding='utf8')
+
+        table = _SortedTable(str(data_file))
+
+        assert table['chelsea'] == 'cff3d9bb'
+        assert table.get('everton') is None
+        assert 'arsenal' in table
+        assert 'aston villa' not in table
+        assert list(table.items()) == [('arsenal', '18bb7c10'),
+                                       ('chelsea', 'cff3d9bb')]
+        with pytest.raises(KeyError):
+            table['everton']
+
+    def test_id_tables_are_sorted(self):
+        for table in [_squad_ids(), _league_ids()]:
+            keys = list(table)
+            assert keys == sorted(keys)
+
+    def test_squad_id_lookup(self):
+        assert _is_squad_id('361ca564')
+        assert not _is_squad_id('zzzzzzzz')
+
+    def test_league_squad_ids_reverse_index(self):
+        squads = _league_squad_ids('10728')
+
+        assert '361ca564' in squads
+        assert squads == sorted(squads)
+        assert _league_squad_ids('invalid') == []
+
+
+class TestSquadDocumentCache:
+    def setup_method(self):
+        release_squad_page()
+
+    def teardown_method(self):
+        release_squad_page()
+
+    def test_squad_page_is_parsed_once_without_comments(self):
+        flexmock(utils) \
+            .should_receive('_pull_page') \
+            .and_return(pq('<div><!--<table id="stats"></table>--></div>')) \
+            .once()
+
+        first = _pull_squad_document('361ca564')
+        second = _pull_squad_document('361ca564')
+
+        assert first is second
+        assert first('table#stats')
+
+    def test_released_squad_page_is_pulled_again(self):
+        flexmock(utils) \
+            .should_receive('_pull_page') \
+            .and_return(pq('<div></div>')) \
+            .twice()
+
+        _pull_squad_document('361ca564')
+        release_squad_page('361CA564')
+        _pull_squad_document('361ca564')
+
+    def test_expired_squad_page_is_pulled_again(self):
+        flexmock(utils) \
+            .should_receive('_pull_page') \
+            .and_return(pq('<div></div>')) \
+            .twice()
+
+        _pull_squad_document('361ca564')
+        with mock.patch.object(fb_utils, 'SQUAD_DOCUMENT_MAX_AGE', 0):
+            _pull_squad_document('361ca564')
+
+    def test_cache_keeps_most_recent_squad_pages(self):
+        flexmock(utils) \
+            .should_receive('_pull_page') \
+            .and_return(pq('<div></div>'))
+
+        with mock.patch.object(fb_utils, 'SQUAD_DOCUMENT_CACHE_SIZE', 2):
+            for squad_id in ['a', 'b', 'a', 'c']:
+                _pull_squad_document(squad_id)
+
+        assert list(fb_utils._squad_documents) == ['a', 'c']
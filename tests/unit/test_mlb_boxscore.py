@@ -8,14 +8,6 @@ from sportsipy.mlb.constants import DAY, NIGHT
 from urllib.error import HTTPError
 
 
-class MockName:
-    def __init__(self, name):
-        self._name = name
-
-    def text(self):
-        return self._name
-
-
 class MockField:
     def __init__(self, field):
         self._field = field
@@ -77,7 +69,7 @@ class TestMLBBoxscore:
         expected_name = 'Home Name'
 
         fake_winner = PropertyMock(return_value=HOME)
-        fake_home_name = PropertyMock(return_value=MockName(expected_name))
+        fake_home_name = PropertyMock(return_value=expected_name)
         type(self.boxscore).winner = fake_winner
         type(self.boxscore)._home_name = fake_home_name
 
@@ -87,7 +79,7 @@ class TestMLBBoxscore:
         expected_name = 'Away Name'
 
         fake_winner = PropertyMock(return_value=AWAY)
-        fake_away_name = PropertyMock(return_value=MockName(expected_name))
+        fake_away_name = PropertyMock(return_value=expected_name)
         type(self.boxscore).winner = fake_winner
         type(self.boxscore)._away_name = fake_away_name
 
@@ -101,7 +93,7 @@ class TestMLBBoxscore:
             .and_return(expected_name)
 
         fake_winner = PropertyMock(return_value=HOME)
-        fake_home_abbr = PropertyMock(return_value=MockName(expected_name))
+        fake_home_abbr = PropertyMock(return_value=expected_name)
         type(self.boxscore).winner = fake_winner
         type(self.boxscore)._home_abbr = fake_home_abbr
 
@@ -115,7 +107,7 @@ class TestMLBBoxscore:
             .and_return(expected_name)
 
         fake_winner = PropertyMock(return_value=AWAY)
-        fake_away_abbr = PropertyMock(return_value=MockName(expected_name))
+        fake_away_abbr = PropertyMock(return_value=expected_name)
         type(self.boxscore).winner = fake_winner
         type(self.boxscore)._away_abbr = fake_away_abbr
 
@@ -125,7 +117,7 @@ class TestMLBBoxscore:
         expected_name = 'Home Name'
 
         fake_winner = PropertyMock(return_value=AWAY)
-        fake_home_name = PropertyMock(return_value=MockName(expected_name))
+        fake_home_name = PropertyMock(return_value=expected_name)
         type(self.boxscore).winner = fake_winner
         type(self.boxscore)._home_name = fake_home_name
 
@@ -135,7 +127,7 @@ class TestMLBBoxscore:
         expected_name = 'Away Name'
 
         fake_winner = PropertyMock(return_value=HOME)
-        fake_away_name = PropertyMock(return_value=MockName(expected_name))
+        fake_away_name = PropertyMock(return_value=expected_name)
         type(self.boxscore).winner = fake_winner
         type(self.boxscore)._away_name = fake_away_name
 
@@ -149,7 +141,7 @@ class TestMLBBoxscore:
             .and_return(expected_name)
 
         fake_winner = PropertyMock(return_value=AWAY)
-        fake_home_abbr = PropertyMock(return_value=MockName(expected_name))
+        fake_home_abbr = PropertyMock(return_value=expected_name)
         type(self.boxscore).winner = fake_winner
         type(self.boxscore)._home_abbr = fake_home_abbr
 
@@ -163,7 +155,7 @@ class TestMLBBoxscore:
             .and_return(expected_name)
 
         fake_winner = PropertyMock(return_value=HOME)
-        fake_away_abbr = PropertyMock(return_value=MockName(expected_name))
+        fake_away_abbr = PropertyMock(return_value=expected_name)
         type(self.boxscore).winner = fake_winner
         type(self.boxscore)._away_abbr = fake_away_abbr
 
@@ -345,6 +337,19 @@ Day Game, on grass
         assert self.boxscore.time_of_day == DAY
 
 
+class TestMLBEmptyBoxscore:
+    def test_empty_page_has_no_players(self):
+        flexmock(Boxscore) \
+            .should_receive('_retrieve_html_page') \
+            .and_return(None)
+
+        boxscore = Boxscore('BOS/BOS201806070')
+
+        assert boxscore.players_dataframe is None
+        assert boxscore.away_players == []
+        assert boxscore.home_players == []
+
+
 class TestMLBBoxscores:
     @patch('requests.get', side_effect=mock_pyquery)
     def setup_method(self, *args, **kwargs):
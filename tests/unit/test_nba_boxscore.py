@@ -6,14 +6,6 @@ from sportsipy.constants import AWAY, HOME
 from sportsipy.nba.boxscore import Boxscore, Boxscores
 
 
-class MockName:
-    def __init__(self, name):
-        self._name = name
-
-    def text(self):
-        return self._name
-
-
 class MockField:
     def __init__(self, field):
         self._field = field
@@ -73,7 +65,7 @@ class TestNBABoxscore:
         expected_name = 'Home Name'
 
         fake_winner = PropertyMock(return_value=HOME)
-        fake_home_name = PropertyMock(return_value=MockName(expected_name))
+        fake_home_name = PropertyMock(return_value=expected_name)
         type(self.boxscore).winner = fake_winner
         type(self.boxscore)._home_name = fake_home_name
 
@@ -83,7 +75,7 @@ class TestNBABoxscore:
         expected_name = 'Away Name'
 
         fake_winner = PropertyMock(return_value=AWAY)
-        fake_away_name = PropertyMock(return_value=MockName(expected_name))
+        fake_away_name = PropertyMock(return_value=expected_name)
         type(self.boxscore).winner = fake_winner
         type(self.boxscore)._away_name = fake_away_name
 
@@ -97,7 +89,7 @@ class TestNBABoxscore:
             .and_return(expected_name)
 
         fake_winner = PropertyMock(return_value=HOME)
-        fake_home_abbr = PropertyMock(return_value=MockName(expected_name))
+        fake_home_abbr = PropertyMock(return_value=expected_name)
         type(self.boxscore).winner = fake_winner
         type(self.boxscore)._home_abbr = fake_home_abbr
 
@@ -111,7 +103,7 @@ class TestNBABoxscore:
             .and_return(expected_name)
 
         fake_winner = PropertyMock(return_value=AWAY)
-        fake_away_abbr = PropertyMock(return_value=MockName(expected_name))
+        fake_away_abbr = PropertyMock(return_value=expected_name)
         type(self.boxscore).winner = fake_winner
         type(self.boxscore)._away_abbr = fake_away_abbr
 
@@ -121,7 +113,7 @@ class TestNBABoxscore:
         expected_name = 'Home Name'
 
         fake_winner = PropertyMock(return_value=AWAY)
-        fake_home_name = PropertyMock(return_value=MockName(expected_name))
+        fake_home_name = PropertyMock(return_value=expected_name)
         type(self.boxscore).winner = fake_winner
         type(self.boxscore)._home_name = fake_home_name
 
@@ -131,7 +123,7 @@ class TestNBABoxscore:
         expected_name = 'Away Name'
 
         fake_winner = PropertyMock(return_value=HOME)
-        fake_away_name = PropertyMock(return_value=MockName(expected_name))
+        fake_away_name = PropertyMock(return_value=expected_name)
         type(self.boxscore).winner = fake_winner
         type(self.boxscore)._away_name = fake_away_name
 
@@ -145,7 +137,7 @@ class TestNBABoxscore:
             .and_return(expected_name)
 
         fake_winner = PropertyMock(return_value=AWAY)
-        fake_home_abbr = PropertyMock(return_value=MockName(expected_name))
+        fake_home_abbr = PropertyMock(return_value=expected_name)
         type(self.boxscore).winner = fake_winner
         type(self.boxscore)._home_abbr = fake_home_abbr
 
@@ -159,7 +151,7 @@ class TestNBABoxscore:
             .and_return(expected_name)
 
         fake_winner = PropertyMock(return_value=HOME)
-        fake_away_abbr = PropertyMock(return_value=MockName(expected_name))
+        fake_away_abbr = PropertyMock(return_value=expected_name)
         type(self.boxscore).winner = fake_winner
         type(self.boxscore)._away_abbr = fake_away_abbr
 
@@ -391,6 +383,19 @@ Logos via Sports Logos.net / About logos"""
             assert value == result
 
 
+class TestNBAEmptyBoxscore:
+    def test_empty_page_has_no_players(self):
+        flexmock(Boxscore) \
+            .should_receive('_retrieve_html_page') \
+            .and_return(None)
+
+        boxscore = Boxscore('201710310LAL')
+
+        assert boxscore.players_dataframe is None
+        assert boxscore.away_players == []
+        assert boxscore.home_players == []
+
+
 class TestNBABoxscores:
     @patch('requests.get', side_effect=mock_pyquery)
     def setup_method(self, *args, **kwargs):
@@ -479,3 +484,13 @@ class TestNBABoxscores:
                 'away_score': None
             }
         ]
+
+    def test_revalidated_boxscores_reuse_the_revalidation_cache(self):
+        flexmock(utils) \
+            .should_receive('_pull_page') \
+            .with_args('url', revalidate=True) \
+            .and_return('page') \
+            .once()
+        boxscores = Boxscores(None, revalidate=True)
+
+        assert boxscores._get_requested_page('url') == 'page'
@@ -1,9 +1,13 @@
+import pytest
+from datetime import datetime
 from flexmock import flexmock
 from mock import PropertyMock
+from sportsipy import utils
 from sportsipy.constants import (AWAY,
                                  HOME,
                                  LOSS,
                                  WIN)
+from sportsipy.nba.boxscore import Boxscore
 from sportsipy.nba.schedule import Game, Schedule
 
 
@@ -67,3 +71,75 @@ class TestNBASchedule:
         type(schedule).__iter__ = fake_games
 
         assert schedule.dataframe_extended is None
+
+    def test_pipelined_dataframe_extended_parses_prefetched_pages(self):
+        flexmock(Schedule) \
+            .should_receive('_pull_schedule') \
+            .and_return(None)
+        schedule = Schedule('DET')
+        schedule._games = [flexmock(boxscore_index='201710310LAL'),
+                           flexmock(boxscore_index='201711010DET')]
+        flexmock(utils) \
+            .should_receive('_prefetch_pages') \
+            .and_return(iter(['<html>first</html>', '']))
+        flexmock(Boxscore) \
+            .should_receive('_parse_game_data') \
+            .with_args('201710310LAL', '<html>first</html>') \
+            .once()
+        flexmock(Boxscore) \
+            .should_receive('_parse_game_data') \
+            .with_args('201711010DET', '') \
+            .once()
+
+        assert schedule.pipelined_dataframe_extended(window=2) is None
+
+    def test_boxscores_are_parsed_in_worker_processes(self):
+        flexmock(Schedule) \
+            .should_receive('_pull_schedule') \
+            .and_return(None)
+        schedule = Schedule('DET')
+        schedule._games = [flexmock(boxscore_index='201710310LAL'),
+                           flexmock(boxscore_index='201711010DET')]
+        flexmock(utils) \
+            .should_receive('_prefetch_pages') \
+            .with_args(list, 3) \
+            .and_return(iter(['<html>first</html>', '']))
+
+        def parse(parser, arguments, processes, window):
+            assert parser is Boxscore
+            assert processes == 3
+            assert window == 3
+            return ['%s: %s' % pair for pair in arguments]
+
+        flexmock(utils) \
+            .should_receive('_parse_in_processes') \
+            .replace_with(parse)
+
+        boxscores = list(schedule.boxscores(window=2, processes=3))
+
+        assert boxscores == ['201710310LAL: <html>first</html>',
+                             '201711010DET: ']
+
+    def test_schedule_lookup_by_date_returns_first_game(self):
+        flexmock(Schedule) \
+            .should_receive('_pull_schedule') \
+            .and_return(None)
+        schedule = Schedule('DET')
+        first = flexmock(datetime=datetime(2017, 10, 18))
+        second = flexmock(datetime=datetime(2017, 10, 20))
+        third = flexmock(datetime=datetime(2017, 10, 20))
+        schedule._games = [first, second, third]
+
+        assert schedule(datetime(2017, 10, 20, 19, 30)) is second
+        assert schedule(datetime(2017, 10, 18)) is first
+        with pytest.raises(ValueError):
+            schedule(datetime(2017, 10, 19))
+
+    def test_game_datetime_is_only_parsed_once(self):
+        self.game._date = 'Wed, Oct 18, 2017'
+        flexmock(Game) \
+            .should_call('_parse_datetime') \
+            .once()
+
+        assert self.game.datetime == datetime(2017, 10, 18)
+        assert self.game.datetime == datetime(2017, 10, 18)
@@ -1,6 +1,10 @@
+import pytest
 from flexmock import flexmock
+from pyquery import PyQuery as pq
+from sportsipy import utils
+from sportsipy.nba import teams
 from sportsipy.nba.schedule import Schedule
-from sportsipy.nba.teams import Team
+from sportsipy.nba.teams import Team, Teams
 
 
 class TestNBATeams:
@@ -15,3 +19,35 @@ class TestNBATeams:
         team = Team(None, 1)
 
         assert len(team.schedule) == 0
+
+    def test_nba_teams_lookup_by_abbreviation(self, *args, **kwargs):
+        rows = pq('<table>'
+                  '<tr><td data-stat="team">'
+                  '<a href="/teams/DET/2017.html">Detroit Pistons</a>'
+                  '</td></tr>'
+                  '<tr><td data-stat="team">'
+                  '<a href="/teams/HOU/2017.html">Houston Rockets</a>'
+                  '</td></tr>'
+                  '</table>')
+        detroit, houston = rows('tr').items()
+        flexmock(teams) \
+            .should_receive('_retrieve_all_teams') \
+            .and_return(({'DET': {'data': detroit, 'rank': 1},
+                          'HOU': {'data': houston, 'rank': 2}}, '2017'))
+
+        nba_teams = Teams('2017')
+
+        assert list(nba_teams._teams_by_abbreviation) == ['DET', 'HOU']
+        assert nba_teams('det') is nba_teams._teams[0]
+        assert nba_teams['HOU'].name == 'Houston Rockets'
+        with pytest.raises(ValueError):
+            nba_teams['BOS']
+
+    def test_nba_teams_range_pulls_every_season(self, *args, **kwargs):
+        flexmock(utils) \
+            .should_receive('_seasons_dataframe') \
+            .with_args(Teams, 2000, 2020, 4, None) \
+            .and_return('seasons') \
+            .once()
+
+        assert Teams.range(2000, 2020, workers=4) == 'seasons'
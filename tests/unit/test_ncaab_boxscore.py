@@ -14,17 +14,6 @@ class MockBoxscore:
         return self._name
 
 
-class MockName:
-    def __init__(self, name):
-        self._name = name
-
-    def __str__(self):
-        return self._name
-
-    def text(self):
-        return self._name.replace('<a>cbb/schools</a>', '')
-
-
 class MockField:
     def __init__(self, field):
         self._field = field
@@ -82,209 +71,257 @@ class TestNCAABBoxscore:
 
     def test_winning_name_di_is_home(self):
         expected_name = 'Home Name'
-        test_name = '<a>cbb/schools</a>Home Name'
+        test_name = 'Home Name'
+        test_link = '/cbb/schools/home/2020.html'
 
         fake_winner = PropertyMock(return_value=HOME)
-        fake_home_name = PropertyMock(return_value=MockName(test_name))
+        fake_home_name = PropertyMock(return_value=test_name)
+        fake_home_link = PropertyMock(return_value=test_link)
         type(self.boxscore).winner = fake_winner
         type(self.boxscore)._home_name = fake_home_name
+        type(self.boxscore)._home_link = fake_home_link
 
         assert self.boxscore.winning_name == expected_name
 
     def test_winning_name_non_di_is_home(self):
         expected_name = 'Home Name'
         test_name = 'Home Name'
+        test_link = None
 
         fake_winner = PropertyMock(return_value=HOME)
-        fake_home_name = PropertyMock(return_value=MockName(test_name))
+        fake_home_name = PropertyMock(return_value=test_name)
+        fake_home_link = PropertyMock(return_value=test_link)
         type(self.boxscore).winner = fake_winner
         type(self.boxscore)._home_name = fake_home_name
+        type(self.boxscore)._home_link = fake_home_link
 
         assert self.boxscore.winning_name == expected_name
 
     def test_winning_name_di_is_away(self):
         expected_name = 'Away Name'
-        test_name = '<a>cbb/schools</a>Away Name'
+        test_name = 'Away Name'
+        test_link = '/cbb/schools/away/2020.html'
 
         fake_winner = PropertyMock(return_value=AWAY)
-        fake_away_name = PropertyMock(return_value=MockName(test_name))
+        fake_away_name = PropertyMock(return_value=test_name)
+        fake_away_link = PropertyMock(return_value=test_link)
         type(self.boxscore).winner = fake_winner
         type(self.boxscore)._away_name = fake_away_name
+        type(self.boxscore)._away_link = fake_away_link
 
         assert self.boxscore.winning_name == expected_name
 
     def test_winning_name_non_di_is_away(self):
         expected_name = 'Away Name'
         test_name = 'Away Name'
+        test_link = None
 
         fake_winner = PropertyMock(return_value=AWAY)
-        fake_away_name = PropertyMock(return_value=MockName(test_name))
+        fake_away_name = PropertyMock(return_value=test_name)
+        fake_away_link = PropertyMock(return_value=test_link)
         type(self.boxscore).winner = fake_winner
         type(self.boxscore)._away_name = fake_away_name
+        type(self.boxscore)._away_link = fake_away_link
 
         assert self.boxscore.winning_name == expected_name
 
     def test_winning_abbr_di_is_home(self):
         expected_name = 'Home'
-        test_name = '<a>cbb/schools</a>HOME'
+        test_name = 'HOME'
+        test_link = '/cbb/schools/home/2020.html'
 
         flexmock(utils) \
             .should_receive('_parse_abbreviation') \
             .and_return(expected_name)
 
         fake_winner = PropertyMock(return_value=HOME)
-        fake_home_name = PropertyMock(return_value=MockName(test_name))
+        fake_home_name = PropertyMock(return_value=test_name)
+        fake_home_link = PropertyMock(return_value=test_link)
         type(self.boxscore).winner = fake_winner
         type(self.boxscore)._home_name = fake_home_name
+        type(self.boxscore)._home_link = fake_home_link
 
         assert self.boxscore.winning_abbr == expected_name
 
     def test_winning_abbr_non_di_is_home(self):
         expected_name = 'HOME'
         test_name = 'HOME'
+        test_link = None
 
         flexmock(utils) \
             .should_receive('_parse_abbreviation') \
             .and_return(expected_name)
 
         fake_winner = PropertyMock(return_value=HOME)
-        fake_home_name = PropertyMock(return_value=MockName(test_name))
+        fake_home_name = PropertyMock(return_value=test_name)
+        fake_home_link = PropertyMock(return_value=test_link)
         type(self.boxscore).winner = fake_winner
         type(self.boxscore)._home_name = fake_home_name
+        type(self.boxscore)._home_link = fake_home_link
 
         assert self.boxscore.winning_abbr == expected_name
 
     def test_winning_abbr_di_is_away(self):
         expected_name = 'AWAY'
-        test_name = '<a>cbb/schools</a>AWAY'
+        test_name = 'AWAY'
+        test_link = '/cbb/schools/away/2020.html'
 
         flexmock(utils) \
             .should_receive('_parse_abbreviation') \
             .and_return(expected_name)
 
         fake_winner = PropertyMock(return_value=AWAY)
-        fake_away_name = PropertyMock(return_value=MockName(test_name))
+        fake_away_name = PropertyMock(return_value=test_name)
+        fake_away_link = PropertyMock(return_value=test_link)
         type(self.boxscore).winner = fake_winner
         type(self.boxscore)._away_name = fake_away_name
+        type(self.boxscore)._away_link = fake_away_link
 
         assert self.boxscore.winning_abbr == expected_name
 
     def test_winning_abbr_non_di_is_away(self):
         expected_name = 'AWAY'
         test_name = 'AWAY'
+        test_link = None
 
         flexmock(utils) \
             .should_receive('_parse_abbreviation') \
             .and_return(expected_name)
 
         fake_winner = PropertyMock(return_value=AWAY)
-        fake_away_name = PropertyMock(return_value=MockName(test_name))
+        fake_away_name = PropertyMock(return_value=test_name)
+        fake_away_link = PropertyMock(return_value=test_link)
         type(self.boxscore).winner = fake_winner
         type(self.boxscore)._away_name = fake_away_name
+        type(self.boxscore)._away_link = fake_away_link
 
         assert self.boxscore.winning_abbr == expected_name
 
     def test_losing_name_di_is_home(self):
         expected_name = 'Home Name'
-        test_name = '<a>cbb/schools</a>Home Name'
+        test_name = 'Home Name'
+        test_link = '/cbb/schools/home/2020.html'
 
         fake_winner = PropertyMock(return_value=AWAY)
-        fake_home_name = PropertyMock(return_value=MockName(test_name))
+        fake_home_name = PropertyMock(return_value=test_name)
+        fake_home_link = PropertyMock(return_value=test_link)
         type(self.boxscore).winner = fake_winner
         type(self.boxscore)._home_name = fake_home_name
+        type(self.boxscore)._home_link = fake_home_link
 
         assert self.boxscore.losing_name == expected_name
 
     def test_losing_name_non_di_is_home(self):
         expected_name = 'Home Name'
         test_name = 'Home Name'
+        test_link = None
 
         fake_winner = PropertyMock(return_value=AWAY)
-        fake_home_name = PropertyMock(return_value=MockName(test_name))
+        fake_home_name = PropertyMock(return_value=test_name)
+        fake_home_link = PropertyMock(return_value=test_link)
         type(self.boxscore).winner = fake_winner
         type(self.boxscore)._home_name = fake_home_name
+        type(self.boxscore)._home_link = fake_home_link
 
         assert self.boxscore.losing_name == expected_name
 
     def test_losing_name_di_is_away(self):
         expected_name = 'Away Name'
-        test_name = '<a>cbb/schools</a>Away Name'
+        test_name = 'Away Name'
+        test_link = '/cbb/schools/away/2020.html'
 
         fake_winner = PropertyMock(return_value=HOME)
-        fake_away_name = PropertyMock(return_value=MockName(test_name))
+        fake_away_name = PropertyMock(return_value=test_name)
+        fake_away_link = PropertyMock(return_value=test_link)
         type(self.boxscore).winner = fake_winner
         type(self.boxscore)._away_name = fake_away_name
+        type(self.boxscore)._away_link = fake_away_link
 
         assert self.boxscore.losing_name == expected_name
 
     def test_losing_name_non_di_is_away(self):
         expected_name = 'Away Name'
         test_name = 'Away Name'
+        test_link = None
 
         fake_winner = PropertyMock(return_value=HOME)
-        fake_away_name = PropertyMock(return_value=MockName(test_name))
+        fake_away_name = PropertyMock(return_value=test_name)
+        fake_away_link = PropertyMock(return_value=test_link)
         type(self.boxscore).winner = fake_winner
         type(self.boxscore)._away_name = fake_away_name
+        type(self.boxscore)._away_link = fake_away_link
 
         assert self.boxscore.losing_name == expected_name
 
     def test_losing_abbr_di_is_home(self):
         expected_name = 'HOME'
-        test_name = '<a>cbb/schools</a>HOME'
+        test_name = 'HOME'
+        test_link = '/cbb/schools/home/2020.html'
 
         flexmock(utils) \
             .should_receive('_parse_abbreviation') \
             .and_return(expected_name)
 
         fake_winner = PropertyMock(return_value=AWAY)
-        fake_home_name = PropertyMock(return_value=MockName(test_name))
+        fake_home_name = PropertyMock(return_value=test_name)
+        fake_home_link = PropertyMock(return_value=test_link)
         type(self.boxscore).winner = fake_winner
         type(self.boxscore)._home_name = fake_home_name
+        type(self.boxscore)._home_link = fake_home_link
 
         assert self.boxscore.losing_abbr == expected_name
 
     def test_losing_abbr_non_di_is_home(self):
         expected_name = 'HOME'
         test_name = 'HOME'
+        test_link = None
 
         flexmock(utils) \
             .should_receive('_parse_abbreviation') \
             .and_return(expected_name)
 
         fake_winner = PropertyMock(return_value=AWAY)
-        fake_home_name = PropertyMock(return_value=MockName(test_name))
+        fake_home_name = PropertyMock(return_value=test_name)
+        fake_home_link = PropertyMock(return_value=test_link)
         type(self.boxscore).winner = fake_winner
         type(self.boxscore)._home_name = fake_home_name
+        type(self.boxscore)._home_link = fake_home_link
 
         assert self.boxscore.losing_abbr == expected_name
 
     def test_losing_abbr_di_is_away(self):
         expected_name = 'AWAY'
-        test_name = '<a>cbb/schools</a>AWAY'
+        test_name = 'AWAY'
+        test_link = '/cbb/schools/away/2020.html'
 
         flexmock(utils) \
             .should_receive('_parse_abbreviation') \
             .and_return(expected_name)
 
         fake_winner = PropertyMock(return_value=HOME)
-        fake_away_name = PropertyMock(return_value=MockName(test_name))
+        fake_away_name = PropertyMock(return_value=test_name)
+        fake_away_link = PropertyMock(return_value=test_link)
         type(self.boxscore).winner = fake_winner
         type(self.boxscore)._away_name = fake_away_name
+        type(self.boxscore)._away_link = fake_away_link
 
         assert self.boxscore.losing_abbr == expected_name
 
     def test_losing_abbr_non_di_is_away(self):
         expected_name = 'AWAY'
         test_name = 'AWAY'
+        test_link = None
 
         flexmock(utils) \
             .should_receive('_parse_abbreviation') \
             .and_return(expected_name)
 
         fake_winner = PropertyMock(return_value=HOME)
-        fake_away_name = PropertyMock(return_value=MockName(test_name))
+        fake_away_name = PropertyMock(return_value=test_name)
+        fake_away_link = PropertyMock(return_value=test_link)
         type(self.boxscore).winner = fake_winner
         type(self.boxscore)._away_name = fake_away_name
+        type(self.boxscore)._away_link = fake_away_link
 
         assert self.boxscore.losing_abbr == expected_name
 
@@ -344,7 +381,7 @@ class TestNCAABBoxscore:
 
         result = self.boxscore._parse_name('away_name', boxscore)
 
-        assert result == name
+        assert result == (name, None)
 
     def test_no_home_free_throw_percentage_returns_default(self):
         fake_percentage = PropertyMock(return_value='')
@@ -424,6 +461,19 @@ Logos via Sports Logos.net / About logos"""
             assert value == result
 
 
+class TestNCAABEmptyBoxscore:
+    def test_empty_page_has_no_players(self):
+        flexmock(Boxscore) \
+            .should_receive('_retrieve_html_page') \
+            .and_return(None)
+
+        boxscore = Boxscore('2020-01-22-19-louisville')
+
+        assert boxscore.players_dataframe is None
+        assert boxscore.away_players == []
+        assert boxscore.home_players == []
+
+
 class TestNCAABBoxscores:
     @patch('requests.get', side_effect=mock_pyquery)
     def setup_method(self, *args, **kwargs):
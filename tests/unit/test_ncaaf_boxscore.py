@@ -27,17 +27,6 @@ class MockBoxscoreData:
         return [self._fields]
 
 
-class MockName:
-    def __init__(self, name):
-        self._name = name
-
-    def __str__(self):
-        return self._name
-
-    def text(self):
-        return self._name.replace('<a>cfb/schools</a>', '')
-
-
 def mock_pyquery(url):
     class MockPQ:
         def __init__(self, html_contents):
@@ -76,209 +65,257 @@ class TestNCAAFBoxscore:
 
     def test_winning_name_di_is_home(self):
         expected_name = 'Home Name'
-        test_name = '<a>cfb/schools</a>Home Name'
+        test_name = 'Home Name'
+        test_link = '/cfb/schools/home/2020.html'
 
         fake_winner = PropertyMock(return_value=HOME)
-        fake_home_name = PropertyMock(return_value=MockName(test_name))
+        fake_home_name = PropertyMock(return_value=test_name)
+        fake_home_link = PropertyMock(return_value=test_link)
         type(self.boxscore).winner = fake_winner
         type(self.boxscore)._home_name = fake_home_name
+        type(self.boxscore)._home_link = fake_home_link
 
         assert self.boxscore.winning_name == expected_name
 
     def test_winning_name_non_di_is_home(self):
         expected_name = 'Home Name'
         test_name = 'Home Name'
+        test_link = None
 
         fake_winner = PropertyMock(return_value=HOME)
-        fake_home_name = PropertyMock(return_value=MockName(test_name))
+        fake_home_name = PropertyMock(return_value=test_name)
+        fake_home_link = PropertyMock(return_value=test_link)
         type(self.boxscore).winner = fake_winner
         type(self.boxscore)._home_name = fake_home_name
+        type(self.boxscore)._home_link = fake_home_link
 
         assert self.boxscore.winning_name == expected_name
 
     def test_winning_name_di_is_away(self):
         expected_name = 'Away Name'
-        test_name = '<a>cfb/schools</a>Away Name'
+        test_name = 'Away Name'
+        test_link = '/cfb/schools/away/2020.html'
 
         fake_winner = PropertyMock(return_value=AWAY)
-        fake_away_name = PropertyMock(return_value=MockName(test_name))
+        fake_away_name = PropertyMock(return_value=test_name)
+        fake_away_link = PropertyMock(return_value=test_link)
         type(self.boxscore).winner = fake_winner
         type(self.boxscore)._away_name = fake_away_name
+        type(self.boxscore)._away_link = fake_away_link
 
         assert self.boxscore.winning_name == expected_name
 
     def test_winning_name_non_di_is_away(self):
         expected_name = 'Away Name'
         test_name = 'Away Name'
+        test_link = None
 
         fake_winner = PropertyMock(return_value=AWAY)
-        fake_away_name = PropertyMock(return_value=MockName(test_name))
+        fake_away_name = PropertyMock(return_value=test_name)
+        fake_away_link = PropertyMock(return_value=test_link)
         type(self.boxscore).winner = fake_winner
         type(self.boxscore)._away_name = fake_away_name
+        type(self.boxscore)._away_link = fake_away_link
 
         assert self.boxscore.winning_name == expected_name
 
     def test_winning_abbr_di_is_home(self):
         expected_name = 'HOME'
-        test_name = '<a>cfb/schools</a>HOME'
+        test_name = 'HOME'
+        test_link = '/cfb/schools/home/2020.html'
 
         flexmock(utils) \
             .should_receive('_parse_abbreviation') \
             .and_return(expected_name)
 
         fake_winner = PropertyMock(return_value=HOME)
-        fake_home_name = PropertyMock(return_value=MockName(test_name))
+        fake_home_name = PropertyMock(return_value=test_name)
+        fake_home_link = PropertyMock(return_value=test_link)
         type(self.boxscore).winner = fake_winner
         type(self.boxscore)._home_name = fake_home_name
+        type(self.boxscore)._home_link = fake_home_link
 
         assert self.boxscore.winning_abbr == expected_name
 
     def test_winning_abbr_non_di_is_home(self):
         expected_name = 'HOME'
         test_name = 'HOME'
+        test_link = None
 
         flexmock(utils) \
             .should_receive('_parse_abbreviation') \
             .and_return(expected_name)
 
         fake_winner = PropertyMock(return_value=HOME)
-        fake_home_name = PropertyMock(return_value=MockName(test_name))
+        fake_home_name = PropertyMock(return_value=test_name)
+        fake_home_link = PropertyMock(return_value=test_link)
         type(self.boxscore).winner = fake_winner
         type(self.boxscore)._home_name = fake_home_name
+        type(self.boxscore)._home_link = fake_home_link
 
         assert self.boxscore.winning_abbr == expected_name
 
     def test_winning_abbr_di_is_away(self):
         expected_name = 'AWAY'
-        test_name = '<a>cfb/schools</a>AWAY'
+        test_name = 'AWAY'
+        test_link = '/cfb/schools/away/2020.html'
 
         flexmock(utils) \
             .should_receive('_parse_abbreviation') \
             .and_return(expected_name)
 
         fake_winner = PropertyMock(return_value=AWAY)
-        fake_away_name = PropertyMock(return_value=MockName(test_name))
+        fake_away_name = PropertyMock(return_value=test_name)
+        fake_away_link = PropertyMock(return_value=test_link)
         type(self.boxscore).winner = fake_winner
         type(self.boxscore)._away_name = fake_away_name
+        type(self.boxscore)._away_link = fake_away_link
 
         assert self.boxscore.winning_abbr == expected_name
 
     def test_winning_abbr_non_di_is_away(self):
         expected_name = 'AWAY'
         test_name = 'AWAY'
+        test_link = None
 
         flexmock(utils) \
             .should_receive('_parse_abbreviation') \
             .and_return(expected_name)
 
         fake_winner = PropertyMock(return_value=AWAY)
-        fake_away_name = PropertyMock(return_value=MockName(test_name))
+        fake_away_name = PropertyMock(return_value=test_name)
+        fake_away_link = PropertyMock(return_value=test_link)
         type(self.boxscore).winner = fake_winner
         type(self.boxscore)._away_name = fake_away_name
+        type(self.boxscore)._away_link = fake_away_link
 
         assert self.boxscore.winning_abbr == expected_name
 
     def test_losing_name_di_is_home(self):
         expected_name = 'Home Name'
-        test_name = '<a>cfb/schools</a>Home Name'
+        test_name = 'Home Name'
+        test_link = '/cfb/schools/home/2020.html'
 
         fake_winner = PropertyMock(return_value=AWAY)
-        fake_home_name = PropertyMock(return_value=MockName(test_name))
+        fake_home_name = PropertyMock(return_value=test_name)
+        fake_home_link = PropertyMock(return_value=test_link)
         type(self.boxscore).winner = fake_winner
         type(self.boxscore)._home_name = fake_home_name
+        type(self.boxscore)._home_link = fake_home_link
 
         assert self.boxscore.losing_name == expected_name
 
     def test_losing_name_non_di_is_home(self):
         expected_name = 'Home Name'
         test_name = 'Home Name'
+        test_link = None
 
         fake_winner = PropertyMock(return_value=AWAY)
-        fake_home_name = PropertyMock(return_value=MockName(test_name))
+        fake_home_name = PropertyMock(return_value=test_name)
+        fake_home_link = PropertyMock(return_value=test_link)
         type(self.boxscore).winner = fake_winner
         type(self.boxscore)._home_name = fake_home_name
+        type(self.boxscore)._home_link = fake_home_link
 
         assert self.boxscore.losing_name == expected_name
 
     def test_losing_name_di_is_away(self):
         expected_name = 'Away Name'
-        test_name = '<a>cfb/schools</a>Away Name'
+        test_name = 'Away Name'
+        test_link = '/cfb/schools/away/2020.html'
 
         fake_winner = PropertyMock(return_value=HOME)
-        fake_away_name = PropertyMock(return_value=MockName(test_name))
+        fake_away_name = PropertyMock(return_value=test_name)
+        fake_away_link = PropertyMock(return_value=test_link)
         type(self.boxscore).winner = fake_winner
         type(self.boxscore)._away_name = fake_away_name
+        type(self.boxscore)._away_link = fake_away_link
 
         assert self.boxscore.losing_name == expected_name
 
     def test_losing_name_non_di_is_away(self):
         expected_name = 'Away Name'
         test_name = 'Away Name'
+        test_link = None
 
         fake_winner = PropertyMock(return_value=HOME)
-        fake_away_name = PropertyMock(return_value=MockName(test_name))
+        fake_away_name = PropertyMock(return_value=test_name)
+        fake_away_link = PropertyMock(return_value=test_link)
         type(self.boxscore).winner = fake_winner
         type(self.boxscore)._away_name = fake_away_name
+        type(self.boxscore)._away_link = fake_away_link
 
         assert self.boxscore.losing_name == expected_name
 
     def test_losing_abbr_di_is_home(self):
         expected_name = 'HOME'
-        test_name = '<a>cfb/schools</a>HOME'
+        test_name = 'HOME'
+        test_link = '/cfb/schools/home/2020.html'
 
         flexmock(utils) \
             .should_receive('_parse_abbreviation') \
             .and_return(expected_name)
 
         fake_winner = PropertyMock(return_value=AWAY)
-        fake_home_name = PropertyMock(return_value=MockName(test_name))
+        fake_home_name = PropertyMock(return_value=test_name)
+        fake_home_link = PropertyMock(return_value=test_link)
         type(self.boxscore).winner = fake_winner
         type(self.boxscore)._home_name = fake_home_name
+        type(self.boxscore)._home_link = fake_home_link
 
         assert self.boxscore.losing_abbr == expected_name
 
     def test_losing_abbr_non_di_is_home(self):
         expected_name = 'HOME'
         test_name = 'HOME'
+        test_link = None
 
         flexmock(utils) \
             .should_receive('_parse_abbreviation') \
             .and_return(expected_name)
 
         fake_winner = PropertyMock(return_value=AWAY)
-        fake_home_name = PropertyMock(return_value=MockName(test_name))
+        fake_home_name = PropertyMock(return_value=test_name)
+        fake_home_link = PropertyMock(return_value=test_link)
         type(self.boxscore).winner = fake_winner
         type(self.boxscore)._home_name = fake_home_name
+        type(self.boxscore)._home_link = fake_home_link
 
         assert self.boxscore.losing_abbr == expected_name
 
     def test_losing_abbr_di_is_away(self):
         expected_name = 'AWAY'
-        test_name = '<a>cfb/schools</a>AWAY'
+        test_name = 'AWAY'
+        test_link = '/cfb/schools/away/2020.html'
 
         flexmock(utils) \
             .should_receive('_parse_abbreviation') \
             .and_return(expected_name)
 
         fake_winner = PropertyMock(return_value=HOME)
-        fake_away_name = PropertyMock(return_value=MockName(test_name))
+        fake_away_name = PropertyMock(return_value=test_name)
+        fake_away_link = PropertyMock(return_value=test_link)
         type(self.boxscore).winner = fake_winner
         type(self.boxscore)._away_name = fake_away_name
+        type(self.boxscore)._away_link = fake_away_link
 
         assert self.boxscore.losing_abbr == expected_name
 
     def test_losing_abbr_non_di_is_away(self):
         expected_name = 'AWAY'
         test_name = 'AWAY'
+        test_link = None
 
         flexmock(utils) \
             .should_receive('_parse_abbreviation') \
             .and_return(expected_name)
 
         fake_winner = PropertyMock(return_value=HOME)
-        fake_away_name = PropertyMock(return_value=MockName(test_name))
+        fake_away_name = PropertyMock(return_value=test_name)
+        fake_away_link = PropertyMock(return_value=test_link)
         type(self.boxscore).winner = fake_winner
         type(self.boxscore)._away_name = fake_away_name
+        type(self.boxscore)._away_link = fake_away_link
 
         assert self.boxscore.losing_abbr == expected_name
 
@@ -436,6 +473,19 @@ Logos via Sports Logos.net / About logos
         assert self.boxscore.away_rush_attempts is None
 
 
+class TestNCAAFEmptyBoxscore:
+    def test_empty_page_has_no_players(self):
+        flexmock(Boxscore) \
+            .should_receive('_retrieve_html_page') \
+            .and_return(None)
+
+        boxscore = Boxscore('2018-01-08-georgia')
+
+        assert boxscore.players_dataframe is None
+        assert boxscore.away_players == []
+        assert boxscore.home_players == []
+
+
 class TestNCAABBoxscores:
     @patch('requests.get', side_effect=mock_pyquery)
     def setup_method(self, *args, **kwargs):
@@ -8,14 +8,6 @@ from sportsipy.constants import AWAY, HOME
 from sportsipy.nfl.boxscore import Boxscore, Boxscores
 
 
-class MockName:
-    def __init__(self, name):
-        self._name = name
-
-    def text(self):
-        return self._name
-
-
 class MockField:
     def __init__(self, field):
         self._field = field
@@ -86,7 +78,7 @@ class TestNFLBoxscore:
         expected_name = 'Home Name'
 
         fake_winner = PropertyMock(return_value=HOME)
-        fake_home_name = PropertyMock(return_value=MockName(expected_name))
+        fake_home_name = PropertyMock(return_value=expected_name)
         type(self.boxscore).winner = fake_winner
         type(self.boxscore)._home_name = fake_home_name
 
@@ -96,7 +88,7 @@ class TestNFLBoxscore:
         expected_name = 'Away Name'
 
         fake_winner = PropertyMock(return_value=AWAY)
-        fake_away_name = PropertyMock(return_value=MockName(expected_name))
+        fake_away_name = PropertyMock(return_value=expected_name)
         type(self.boxscore).winner = fake_winner
         type(self.boxscore)._away_name = fake_away_name
 
@@ -130,7 +122,7 @@ class TestNFLBoxscore:
         expected_name = 'Home Name'
 
         fake_winner = PropertyMock(return_value=AWAY)
-        fake_home_name = PropertyMock(return_value=MockName(expected_name))
+        fake_home_name = PropertyMock(return_value=expected_name)
         type(self.boxscore).winner = fake_winner
         type(self.boxscore)._home_name = fake_home_name
 
@@ -140,7 +132,7 @@ class TestNFLBoxscore:
         expected_name = 'Away Name'
 
         fake_winner = PropertyMock(return_value=HOME)
-        fake_away_name = PropertyMock(return_value=MockName(expected_name))
+        fake_away_name = PropertyMock(return_value=expected_name)
         type(self.boxscore).winner = fake_winner
         type(self.boxscore)._away_name = fake_away_name
 
@@ -265,16 +257,14 @@ Logos via Sports Logos.net / About logos
             assert getattr(self.boxscore, field) == value
 
     def test_nfl_away_abbreviation(self):
-        away_name = PropertyMock(return_value='<a href="/teams/kan/2018.htm" \
-itemprop="name">Kansas City Chiefs</a>')
-        type(self.boxscore)._away_name = away_name
+        away_link = PropertyMock(return_value='/teams/kan/2018.htm')
+        type(self.boxscore)._away_link = away_link
 
         assert self.boxscore.away_abbreviation == 'kan'
 
     def test_nfl_home_abbreviation(self):
-        home_name = PropertyMock(return_value='<a href="/teams/nwe/2018.htm" \
-itemprop="name">New England Patriots</a>')
-        type(self.boxscore)._home_name = home_name
+        home_link = PropertyMock(return_value='/teams/nwe/2018.htm')
+        type(self.boxscore)._home_link = home_link
 
         assert self.boxscore.home_abbreviation == 'nwe'
 
@@ -343,6 +333,19 @@ itemprop="name">New England Patriots</a>')
         assert output == (None, None)
 
 
+class TestNFLEmptyBoxscore:
+    def test_empty_page_has_no_players(self):
+        flexmock(Boxscore) \
+            .should_receive('_retrieve_html_page') \
+            .and_return(None)
+
+        boxscore = Boxscore('201802040nwe')
+
+        assert boxscore.players_dataframe is None
+        assert boxscore.away_players == []
+        assert boxscore.home_players == []
+
+
 class TestNFLBoxscores:
     @patch('requests.get', side_effect=mock_pyquery)
     def setup_method(self, *args, **kwargs):
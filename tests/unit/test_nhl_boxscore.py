@@ -25,14 +25,6 @@ class MockBoxscoreData:
         return [self._fields]
 
 
-class MockName:
-    def __init__(self, name):
-        self._name = name
-
-    def text(self):
-        return self._name
-
-
 def mock_pyquery(url):
     class MockPQ:
         def __init__(self, html_contents):
@@ -73,7 +65,7 @@ class TestNHLBoxscore:
         expected_name = 'Home Name'
 
         fake_winner = PropertyMock(return_value=HOME)
-        fake_home_name = PropertyMock(return_value=MockName(expected_name))
+        fake_home_name = PropertyMock(return_value=expected_name)
         type(self.boxscore).winner = fake_winner
         type(self.boxscore)._home_name = fake_home_name
 
@@ -83,7 +75,7 @@ class TestNHLBoxscore:
         expected_name = 'Away Name'
 
         fake_winner = PropertyMock(return_value=AWAY)
-        fake_away_name = PropertyMock(return_value=MockName(expected_name))
+        fake_away_name = PropertyMock(return_value=expected_name)
         type(self.boxscore).winner = fake_winner
         type(self.boxscore)._away_name = fake_away_name
 
@@ -97,7 +89,7 @@ class TestNHLBoxscore:
             .and_return(expected_name)
 
         fake_winner = PropertyMock(return_value=HOME)
-        fake_home_abbr = PropertyMock(return_value=MockName(expected_name))
+        fake_home_abbr = PropertyMock(return_value=expected_name)
         type(self.boxscore).winner = fake_winner
         type(self.boxscore)._home_abbr = fake_home_abbr
 
@@ -111,7 +103,7 @@ class TestNHLBoxscore:
             .and_return(expected_name)
 
         fake_winner = PropertyMock(return_value=AWAY)
-        fake_away_abbr = PropertyMock(return_value=MockName(expected_name))
+        fake_away_abbr = PropertyMock(return_value=expected_name)
         type(self.boxscore).winner = fake_winner
         type(self.boxscore)._away_abbr = fake_away_abbr
 
@@ -121,7 +113,7 @@ class TestNHLBoxscore:
         expected_name = 'Home Name'
 
         fake_winner = PropertyMock(return_value=AWAY)
-        fake_home_name = PropertyMock(return_value=MockName(expected_name))
+        fake_home_name = PropertyMock(return_value=expected_name)
         type(self.boxscore).winner = fake_winner
         type(self.boxscore)._home_name = fake_home_name
 
@@ -131,7 +123,7 @@ class TestNHLBoxscore:
         expected_name = 'Away Name'
 
         fake_winner = PropertyMock(return_value=HOME)
-        fake_away_name = PropertyMock(return_value=MockName(expected_name))
+        fake_away_name = PropertyMock(return_value=expected_name)
         type(self.boxscore).winner = fake_winner
         type(self.boxscore)._away_name = fake_away_name
 
@@ -145,7 +137,7 @@ class TestNHLBoxscore:
             .and_return(expected_name)
 
         fake_winner = PropertyMock(return_value=AWAY)
-        fake_home_abbr = PropertyMock(return_value=MockName(expected_name))
+        fake_home_abbr = PropertyMock(return_value=expected_name)
         type(self.boxscore).winner = fake_winner
         type(self.boxscore)._home_abbr = fake_home_abbr
 
@@ -159,7 +151,7 @@ class TestNHLBoxscore:
             .and_return(expected_name)
 
         fake_winner = PropertyMock(return_value=HOME)
-        fake_away_abbr = PropertyMock(return_value=MockName(expected_name))
+        fake_away_abbr = PropertyMock(return_value=expected_name)
         type(self.boxscore).winner = fake_winner
         type(self.boxscore)._away_abbr = fake_away_abbr
 
@@ -507,6 +499,19 @@ Logos via Sports Logos.net / About logos
         assert player_dict == {}
 
 
+class TestNHLEmptyBoxscore:
+    def test_empty_page_has_no_players(self):
+        flexmock(Boxscore) \
+            .should_receive('_retrieve_html_page') \
+            .and_return(None)
+
+        boxscore = Boxscore('201806070VEG')
+
+        assert boxscore.players_dataframe is None
+        assert boxscore.away_players == []
+        assert boxscore.home_players == []
+
+
 class TestMLBBoxscores:
     @patch('requests.get', side_effect=mock_pyquery)
     def setup_method(self, *args, **kwargs):
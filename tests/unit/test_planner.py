@@ -0,0 +1,245 @@
+import os
+import pytest
+import requests
+from flexmock import flexmock
+from sportsipy import planner, utils
+from sportsipy.nba import boxscore, roster, schedule
+from sportsipy.planner import FetchPlan, _PagePool
+from urllib.error import HTTPError
+
+
+class MockGame:
+    def __init__(self, uri):
+        self.boxscore_index = uri
+
+
+class MockSchedule:
+    def __init__(self, team, year=None):
+        games = {'HOU': ['201801010HOU', '201801030DET', None],
+                 'DET': ['201801030DET']}
+        self._games = [MockGame(uri) for uri in games[team]]
+
+    def __iter__(self):
+        return iter(self._games)
+
+
+class MockRoster:
+    def __init__(self, team, year=None, slim=False):
+        self.slim = slim
+        self.players = {'hardeja01': 'James Harden'}
+
+
+class MockBoxscore:
+    def __init__(self, uri):
+        self.uri = uri
+
+
+class TestPagePool:
+    def test_page_is_only_requested_once(self, tmp_path):
+        flexmock(utils).should_receive('_request_page') \
+            .with_args('https://example.com') \
+            .and_return('<html>').once()
+        pool = _PagePool(str(tmp_path), None)
+
+        assert pool.page('https://example.com') == '<html>'
+        assert pool.page('https://example.com') == '<html>'
+        assert pool.requests == 1
+
+    def test_missing_page_is_empty(self, tmp_path):
+        flexmock(utils).should_receive('_request_page').and_return('').once()
+        pool = _PagePool(str(tmp_path), None)
+
+        assert pool.page('https://example.com') == ''
+        assert pool.page('https://example.com') == ''
+
+    def test_throttled_page_is_retried_after_delay(self, tmp_path):
+        throttled = HTTPError('https://example.com', 429, 'Too Many Requests',
+                              {'Retry-After': '120'}, None)
+        flexmock(utils).should_receive('_request_page') \
+            .and_raise(throttled).and_return('<html>').twice()
+        sleeps = []
+        flexmock(planner.time).should_receive('sleep') \
+            .replace_with(sleeps.append)
+        pool = _PagePool(str(tmp_path), None)
+
+        assert pool.page('https://example.com') == '<html>'
+        assert len(sleeps) == 1
+        assert 119 < sleeps[0] <= 120
+
+    def test_timed_out_page_is_retried(self, tmp_path):
+        flexmock(utils).should_receive('_request_page') \
+            .and_raise(requests.exceptions.Timeout).and_return('<html>') \
+            .twice()
+        flexmock(planner.time).should_receive('sleep')
+        pool = _PagePool(str(tmp_path), None)
+
+        assert pool.page('https://example.com') == '<html>'
+
+    def test_failed_page_is_not_remembered(self, tmp_path):
+        unavailable = HTTPError('https://example.com', 503,
+                                'Service Unavailable', None, None)
+        flexmock(utils).should_receive('_request_page') \
+            .and_raise(unavailable)
+        flexmock(planner.time).should_receive('sleep')
+        pool = _PagePool(str(tmp_path), None)
+
+        with pytest.raises(HTTPError):
+            pool.fetch('https://example.com')
+        assert 'https://example.com' not in pool
+        assert pool.requests == planner.MAX_RETRIES + 1
+
+    def test_forbidden_page_is_not_retried(self, tmp_path):
+        forbidden = HTTPError('https://example.com', 403, 'Forbidden', None,
+                              None)
+        flexmock(utils).should_receive('_request_page') \
+            .and_raise(forbidden).once()
+        pool = _PagePool(str(tmp_path), None)
+
+        with pytest.raises(HTTPError):
+            pool.fetch('https://example.com')
+        assert 'https://example.com' not in pool
+
+    def test_requests_are_spaced_out(self, tmp_path):
+        flexmock(utils).should_receive('_request_page').and_return('<html>')
+        sleeps = []
+        flexmock(planner.time).should_receive('sleep') \
+            .replace_with(sleeps.append)
+        pool = _PagePool(str(tmp_path), 60)
+
+        pool.fetch('https://example.com/1')
+        pool.fetch('https://example.com/2')
+
+        assert len(sleeps) == 1
+        assert 0 < sleeps[0] <= 1.0
+
+    def test_pooled_pages_are_used_by_utils(self, tmp_path):
+        flexmock(utils).should_receive('_request_page') \
+            .and_return('<html><td>1</td></html>').once()
+        pool = _PagePool(str(tmp_path), None)
+        utils._page_pool = pool
+        try:
+            first = utils._pull_page('https://example.com')
+            second = utils._download_page('https://example.com')
+        finally:
+            utils._page_pool = None
+
+        assert first('td').text() == '1'
+        assert second == '<html><td>1</td></html>'
+
+
+class TestPacedDownloads:
+    def test_pool_is_installed_while_active(self):
+        with planner._paced_downloads(30) as pool:
+            assert utils._page_pool is pool
+            assert pool._interval == 2.0
+            directory = pool._directory
+
+        assert utils._page_pool is None
+        assert not os.path.exists(directory)
+
+    def test_active_pool_is_reused(self, tmp_path):
+        pool = _PagePool(str(tmp_path), None)
+        utils._page_pool = pool
+        try:
+            with planner._paced_downloads() as active:
+                assert active is pool
+            assert utils._page_pool is pool
+        finally:
+            utils._page_pool = None
+
+    def test_workers_share_the_rate_limit(self, tmp_path):
+        pool = _PagePool(str(tmp_path), 20)
+
+        directory, requests_per_minute = pool.worker_arguments(4)
+        try:
+            planner._start_worker_pool(directory, requests_per_minute)
+            worker = utils._page_pool
+        finally:
+            utils._page_pool = None
+
+        assert directory == str(tmp_path)
+        assert requests_per_minute == 5
+        assert worker._interval == 12.0
+        assert _PagePool(str(tmp_path), None).worker_arguments(4)[1] is None
+
+
+class TestFetchPlan:
+    def setup_method(self):
+        flexmock(schedule).should_receive('Schedule') \
+            .replace_with(MockSchedule)
+        flexmock(roster).should_receive('Roster').replace_with(MockRoster)
+        flexmock(boxscore).should_receive('Boxscore') \
+            .replace_with(MockBoxscore)
+        self.requested = []
+        flexmock(utils).should_receive('_request_page') \
+            .replace_with(self.request_page)
+
+    def request_page(self, url):
+        self.requested.append(url)
+        return '<html>'
+
+    def test_invalid_league_raises_value_error(self):
+        with pytest.raises(ValueError):
+            FetchPlan([('xfl', 'schedule', 'HOU', 2018)])
+
+    def test_invalid_kind_raises_value_error(self):
+        with pytest.raises(ValueError):
+            FetchPlan([('nba', 'standings', 'HOU', 2018)])
+
+    def test_shared_boxscores_are_downloaded_once(self):
+        with FetchPlan([('nba', 'boxscores', 'HOU', 2018),
+                        ('nba', 'boxscores', 'DET', 2018),
+                        ('nba', 'roster', 'HOU', 2018)],
+                       requests_per_minute=None) as plan:
+            plan.discover()
+            estimate = plan.estimate()
+            requests = plan.execute()
+
+        assert estimate['requests'] == 3
+        assert estimate['duplicates'] == 1
+        assert estimate['complete']
+        assert requests == 3
+        assert len(self.requested) == len(set(self.requested))
+
+    def test_estimate_before_discovery_counts_index_pages(self):
+        with FetchPlan([('nba', 'boxscores', 'HOU', 2018),
+                        ('nba', 'schedule', 'HOU', 2018),
+                        ('nba', 'roster', 'HOU', 2018)]) as plan:
+            estimate = plan.estimate()
+
+        assert estimate['requests'] == 2
+        assert estimate['seconds'] == 6.0
+        assert not estimate['complete']
+
+    def test_materialize_shares_boxscores_between_teams(self):
+        with FetchPlan([('nba', 'boxscores', 'HOU', 2018),
+                        ('nba', 'boxscores', 'DET', 2018),
+                        ('nba', 'roster', 'HOU', 2018)],
+                       requests_per_minute=None) as plan:
+            results = dict(plan.materialize())
+
+        houston = results[('nba', 'boxscores', 'HOU', 2018)]
+        detroit = results[('nba', 'boxscores', 'DET', 2018)]
+        team_roster = results[('nba', 'roster', 'HOU', 2018)]
+
+        uris = [game.uri for game in houston]
+
+        assert uris == ['201801010HOU', '201801030DET']
+        assert houston[1] is detroit[0]
+        assert not team_roster.slim
+        assert utils._page_pool is None
+
+    def test_materialize_executes_discovered_plan(self):
+        with FetchPlan([('nba', 'boxscores', 'HOU', 2018)],
+                       requests_per_minute=None) as plan:
+            plan.discover()
+            flexmock(plan).should_receive('execute').once()
+            list(plan.materialize())
+
+    def test_temporary_directory_is_removed_on_close(self):
+        plan = FetchPlan([('nba', 'schedule', 'HOU', 2018)])
+        directory = plan._directory
+
+        plan.close()
+
+        assert not os.path.exists(directory)
@@ -0,0 +1,160 @@
+import asyncio
+import pytest
+from datetime import datetime
+from flexmock import flexmock
+from sportsipy import scoreboard, utils
+from sportsipy.nba import boxscore as nba_boxscore
+from sportsipy.nfl import boxscore as nfl_boxscore
+from sportsipy.scoreboard import ScoreboardPoller
+
+
+def game(uri, home_score=None, away_score=None, winner=None):
+    return {'boxscore': uri, 'home_score': home_score,
+            'away_score': away_score, 'winning_abbr': winner}
+
+
+def unplayed(away, home, uri=''):
+    return {'boxscore': uri, 'away_abbr': away, 'home_abbr': home,
+            'home_score': None, 'away_score': None, 'winning_abbr': None}
+
+
+class MockBoxscores:
+    def __init__(self, games):
+        self.games = games
+
+
+class TestScoreboardPoller:
+    def setup_method(self):
+        self.pulls = []
+        self.requests = []
+
+        def boxscores(*args, **kwargs):
+            self.requests.append((args, kwargs))
+            return MockBoxscores(self.pulls.pop(0))
+
+        flexmock(nba_boxscore).should_receive('Boxscores') \
+            .replace_with(boxscores)
+        flexmock(nfl_boxscore).should_receive('Boxscores') \
+            .replace_with(boxscores)
+        flexmock(utils).should_receive('_todays_date') \
+            .and_return(datetime(2021, 1, 1, 19))
+
+    def test_first_poll_reports_every_game_as_added(self):
+        self.pulls = [{'1-1-2021': [game('game-1'), game('game-2')]}]
+        found = []
+        poller = ScoreboardPoller('nba', callback=found.append)
+
+        events = poller.poll()
+
+        assert [event['type'] for event in events] == ['added', 'added']
+        assert found == events
+        assert events[0]['date'] == '1-1-2021'
+        assert events[0]['changes']['boxscore'] == (None, 'game-1')
+        assert self.requests == [((datetime(2021, 1, 1, 19),),
+                                  {'revalidate': True})]
+
+    def test_poll_only_reports_changed_games(self):
+        self.pulls = [
+            {'1-1-2021': [game('game-1'), game('game-2')]},
+            {'1-1-2021': [game('game-1', 3, 0), game('game-2')]},
+            {'1-1-2021': [game('game-1', 3, 0), game('game-2')]},
+            {'1-1-2021': [game('game-1', 103, 99, 'HOU')]}
+        ]
+        poller = ScoreboardPoller('nba')
+        poller.poll()
+
+        events = poller.poll()
+
+        assert len(events) == 1
+        assert events[0]['type'] == 'updated'
+        assert events[0]['boxscore'] == 'game-1'
+        assert events[0]['changes'] == {'home_score': (None, 3),
+                                        'away_score': (None, 0)}
+        assert poller.poll() == []
+        events = poller.poll()
+        assert [event['type'] for event in events] == ['updated', 'removed']
+        assert events[0]['changes']['winning_abbr'] == (None, 'HOU')
+        assert events[1]['boxscore'] == 'game-2'
+        assert poller.games == [game('game-1', 103, 99, 'HOU')]
+
+    def test_unplayed_games_are_tracked_separately(self):
+        started = unplayed('HOU', 'DET', '202101010DET')
+        started['home_score'] = 2
+        self.pulls = [
+            {'1-1-2021': [unplayed('HOU', 'DET'), unplayed('BOS', 'NYK'),
+                          unplayed('PHO', 'LAL')]},
+            {'1-1-2021': [started, unplayed('BOS', 'NYK'),
+                          unplayed('PHO', 'LAL')]}
+        ]
+        poller = ScoreboardPoller('nba')
+
+        events = poller.poll()
+
+        assert [event['type'] for event in events] == ['added'] * 3
+        assert len(poller.games) == 3
+        events = poller.poll()
+        assert len(events) == 1
+        assert events[0]['type'] == 'updated'
+        assert events[0]['changes'] == {'boxscore': ('', '202101010DET'),
+                                        'home_score': (None, 2)}
+
+    def test_repeated_matchups_are_tracked_separately(self):
+        self.pulls = [
+            {'1-1-2021': [unplayed('HOU', 'DET'), unplayed('HOU', 'DET')]},
+            {'1-1-2021': [unplayed('HOU', 'DET')]}
+        ]
+        poller = ScoreboardPoller('nba')
+
+        assert len(poller.poll()) == 2
+        assert [event['type'] for event in poller.poll()] == ['removed']
+
+    def test_new_day_reports_games_as_added(self):
+        self.pulls = [{'1-1-2021': [game('game-1', 3, 0)]},
+                      {'1-2-2021': [game('game-2')]}]
+        poller = ScoreboardPoller('nba')
+        poller.poll()
+
+        events = poller.poll()
+
+        assert [(event['type'], event['boxscore']) for event in events] == \
+            [('added', 'game-2')]
+
+    def test_run_waits_between_polls(self):
+        self.pulls = [{'1-1-2021': []}, {'1-1-2021': []}, {'1-1-2021': []}]
+        flexmock(scoreboard.time).should_receive('sleep').with_args(5).twice()
+        poller = ScoreboardPoller('nba', interval=5)
+
+        poller.run(polls=3)
+
+        assert self.pulls == []
+
+    def test_watch_puts_changes_on_queue(self):
+        self.pulls = [{'1-1-2021': [game('game-1')]},
+                      {'1-1-2021': [game('game-1', 2, 0)]}]
+
+        async def watch():
+            queue = asyncio.Queue()
+            poller = ScoreboardPoller('nba', queue=queue, interval=0)
+            await poller.watch(polls=2)
+            return [queue.get_nowait() for _ in range(queue.qsize())]
+
+        events = asyncio.run(watch())
+
+        assert [event['type'] for event in events] == ['added', 'updated']
+
+    def test_weekly_league_polls_requested_week(self):
+        self.pulls = [{'3-2020': [game('game-1')]}]
+        poller = ScoreboardPoller('nfl', week=3, year=2020)
+
+        events = poller.poll()
+
+        assert events[0]['date'] == '3-2020'
+        assert self.requests == [((3, 2020), {'revalidate': True})]
+
+    def test_weekly_league_requires_week_and_year(self):
+        with pytest.raises(ValueError):
+            ScoreboardPoller('nfl', year=2020)
+
+    def test_unknown_league_raises_value_error(self):
+        with pytest.raises(ValueError):
+            ScoreboardPoller('xfl')
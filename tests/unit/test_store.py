@@ -0,0 +1,167 @@
+import pandas as pd
+from datetime import datetime
+from sportsipy.store import Store
+
+
+class MockTeam:
+    __module__ = 'sportsipy.nba.teams'
+
+    def __init__(self, abbreviation, wins, year=2018):
+        self._year = year
+        self.abbreviation = abbreviation
+        self.name = 'Team %s' % abbreviation
+        self.dataframe = pd.DataFrame([{'abbreviation': abbreviation,
+                                        'name': self.name,
+                                        'wins': wins}],
+                                      index=[abbreviation])
+
+
+class MockSquad:
+    __module__ = 'sportsipy.fb.team'
+
+    def __init__(self):
+        self._squad_id = '361ca564'
+        self._name = 'Tottenham Hotspur'
+        self._season = '2019-2020'
+        self._points = 59
+        self._doc = object()
+        self.squad_id = self._squad_id
+        self.season = self._season
+
+
+class MockGame:
+    __module__ = 'sportsipy.nba.schedule'
+
+    def __init__(self, uri, points):
+        self.boxscore_index = uri
+        self.dataframe = pd.DataFrame([{'boxscore_index': uri,
+                                        'datetime': datetime(2018, 1, 1),
+                                        'opponent_abbr': 'DET',
+                                        'points_scored': points}],
+                                      index=[uri])
+
+
+class MockBoxscore:
+    __module__ = 'sportsipy.nba.boxscore'
+
+    def __init__(self, uri, players, points=100):
+        self.dataframe = pd.DataFrame([{'date': 'January 1, 2018',
+                                        'winning_abbr': 'HOU',
+                                        'losing_abbr': 'DET',
+                                        'away_points': points,
+                                        'home_points': 90}],
+                                      index=[uri])
+        self.players_dataframe = pd.DataFrame(
+            [{'name': name, 'team': 'Away', 'pts': 10} for name in players],
+            index=players)
+
+
+class MockPlayer:
+    __module__ = 'sportsipy.nba.roster'
+
+    def __init__(self, player_id, seasons):
+        self._index = 0
+        self._season = seasons
+        self.player_id = player_id
+        self.name = 'Player %s' % player_id
+
+    def _dataframe_fields(self):
+        return {'team_abbreviation': 'HOU',
+                'points': 100 * (self._index + 1)}
+
+
+class MockRoster:
+    def __init__(self, players):
+        self.players = players
+
+
+class TestStore:
+    def setup_method(self):
+        self.store = Store(':memory:')
+
+    def teardown_method(self):
+        self.store.close()
+
+    def test_teams_are_saved_and_replaced(self):
+        self.store.save_teams([MockTeam('HOU', 60), MockTeam('DET', 40)])
+        self.store.save_teams([MockTeam('HOU', 65)])
+
+        teams = self.store.teams(league='nba', year=2018)
+
+        assert list(teams['abbreviation']) == ['DET', 'HOU']
+        assert list(teams['wins']) == [40, 65]
+
+    def test_fb_teams_are_saved_by_squad_id(self):
+        self.store.save_teams([MockSquad()])
+
+        teams = self.store.teams(league='fb')
+
+        assert teams['abbreviation'][0] == '361ca564'
+        assert teams['year'][0] == '2019-2020'
+        assert teams['points'][0] == 59
+        assert 'doc' not in teams.columns
+
+    def test_schedule_skips_games_without_boxscores(self):
+        saved = self.store.save_schedule([MockGame('201801010HOU', 110),
+                                          MockGame(None, 0)], 'hou')
+
+        games = self.store.team_games(team='HOU')
+
+        assert saved == 1
+        assert list(games['uri']) == ['201801010HOU']
+        assert games['date'][0].startswith('2018-01-01')
+        assert games['opponent'][0] == 'DET'
+        assert games['points_scored'][0] == 110
+
+    def test_boxscore_players_are_replaced(self):
+        self.store.save_boxscores([MockBoxscore('201801010HOU',
+                                                ['hardeja01', 'paulch01'])])
+        self.store.save_boxscores([MockBoxscore('201801010HOU',
+                                                ['hardeja01'], points=105)])
+
+        games = self.store.games()
+        players = self.store.player_games(uri='201801010HOU')
+
+        assert list(games['away_points']) == [105]
+        assert list(players['player_id']) == ['hardeja01']
+        assert players['pts'][0] == 10
+
+    def test_unplayed_boxscores_are_skipped(self):
+        boxscore = MockBoxscore('201801010HOU', [])
+        boxscore.dataframe = None
+
+        assert self.store.save_boxscores([boxscore]) == 0
+        assert self.store.games().empty
+
+    def test_player_seasons_are_replaced(self):
+        self.store.save_players(MockRoster([
+            MockPlayer('hardeja01', ['2016-17', '2017-18', 'Career'])
+        ]))
+        self.store.save_players([MockPlayer('hardeja01', ['Career'])])
+
+        seasons = self.store.player_seasons(player_id='hardeja01')
+
+        assert list(seasons['season']) == ['Career']
+        assert seasons['team_abbreviation'][0] == 'HOU'
+
+    def test_players_without_stats_are_skipped(self):
+        saved = self.store.save_players([MockPlayer('BAD', None)])
+
+        assert saved == 0
+        assert self.store.player_seasons().empty
+
+    def test_query_returns_dataframe(self):
+        self.store.save_teams([MockTeam('HOU', 60), MockTeam('DET', 40)])
+
+        result = self.store.query("SELECT abbreviation FROM teams WHERE "
+                                  "json_extract(stats, '$.wins') > ?", (50,))
+
+        assert list(result['abbreviation']) == ['HOU']
+
+    def test_data_persists_between_connections(self, tmp_path):
+        path = str(tmp_path / 'sports.db')
+        with Store(path) as store:
+            store.save_teams([MockTeam('HOU', 60)])
+
+        with Store(path) as store:
+            assert list(store.teams()['abbreviation']) == ['HOU']
@@ -0,0 +1,153 @@
+import json
+import os
+import pandas as pd
+import pytest
+from datetime import datetime
+from flexmock import flexmock
+from sportsipy import utils
+from sportsipy.nba import boxscore as nba_boxscore
+from sportsipy.nfl import boxscore as nfl_boxscore
+from sportsipy.sync import SeasonSync
+
+
+def game(uri, finished=True):
+    score = 100 if finished else None
+    return {'boxscore': uri, 'home_score': score, 'away_score': score}
+
+
+class MockBoxscores:
+    def __init__(self, games):
+        self.games = games
+
+
+class MockBoxscore:
+    def __init__(self, uri, html):
+        self.dataframe = pd.DataFrame([{'points': len(html)}], index=[uri])
+
+
+class TestSeasonSync:
+    def setup_method(self):
+        self.requested_pages = []
+        self.requested_indexes = []
+
+        def prefetch(urls):
+            urls = list(urls)
+            self.requested_pages.extend(urls)
+            return ['<html>' for _ in urls]
+
+        flexmock(utils).should_receive('_prefetch_pages') \
+            .replace_with(prefetch)
+        flexmock(nba_boxscore).should_receive('Boxscore') \
+            .replace_with(MockBoxscore)
+        flexmock(nfl_boxscore).should_receive('Boxscore') \
+            .replace_with(MockBoxscore)
+
+    def mock_index(self, module, games):
+        def boxscores(start, *args):
+            self.requested_indexes.append((start,) + args)
+            return MockBoxscores(games[len(self.requested_indexes) - 1])
+
+        flexmock(module).should_receive('Boxscores') \
+            .replace_with(boxscores)
+
+    def test_first_sync_saves_completed_games(self, tmp_path):
+        dataset = str(tmp_path / 'nba.csv')
+        self.mock_index(nba_boxscore, [{
+            '1-1-2021': [game('game-1'), game('game-2')],
+            '1-2-2021': [game('game-3'), game('game-4', finished=False)],
+            '1-3-2021': []
+        }])
+        season = SeasonSync('nba', dataset)
+
+        new_games = season.sync(datetime(2021, 1, 1, 8),
+                                datetime(2021, 1, 3, 20))
+
+        assert list(new_games.index) == ['game-1', 'game-2', 'game-3']
+        assert self.requested_indexes == [(datetime(2021, 1, 1),
+                                           datetime(2021, 1, 3))]
+        assert len(self.requested_pages) == 3
+        assert season.watermark == datetime(2021, 1, 2)
+        with open(dataset + '.state.json') as state_file:
+            assert json.load(state_file) == {'watermark': '2021-01-02',
+                                             'synced': ['game-3']}
+        saved = pd.read_csv(dataset, index_col='boxscore')
+        assert list(saved.index) == ['game-1', 'game-2', 'game-3']
+
+    def test_sync_only_pulls_games_after_watermark(self, tmp_path):
+        dataset = str(tmp_path / 'nba.csv')
+        self.mock_index(nba_boxscore, [{
+            '1-1-2021': [game('game-1')],
+            '1-2-2021': [game('game-2'), game('game-3', finished=False)]
+        }, {
+            '1-2-2021': [game('game-2'), game('game-3')],
+            '1-3-2021': [game('game-4')]
+        }])
+        SeasonSync('nba', dataset).sync(datetime(2021, 1, 1),
+                                        datetime(2021, 1, 2))
+        self.requested_pages = []
+
+        season = SeasonSync('nba', dataset)
+        new_games = season.sync(end=datetime(2021, 1, 3))
+
+        assert list(new_games.index) == ['game-3', 'game-4']
+        assert self.requested_indexes[1] == (datetime(2021, 1, 2),
+                                             datetime(2021, 1, 3))
+        assert len(self.requested_pages) == 2
+        assert season.watermark == datetime(2021, 1, 4)
+        saved = pd.read_csv(dataset, index_col='boxscore')
+        assert list(saved.index) == ['game-1', 'game-2', 'game-3', 'game-4']
+
+    def test_failed_download_holds_watermark(self, tmp_path):
+        dataset = str(tmp_path / 'nba.csv')
+        self.mock_index(nba_boxscore, [{
+            '1-1-2021': [game('game-1'), game('game-2')],
+            '1-2-2021': [game('game-3')]
+        }])
+        flexmock(utils).should_receive('_prefetch_pages') \
+            .and_return(['<html>', '', '<html>'])
+        season = SeasonSync('nba', dataset)
+
+        new_games = season.sync(datetime(2021, 1, 1), datetime(2021, 1, 2))
+
+        assert list(new_games.index) == ['game-1', 'game-3']
+        assert season.watermark == datetime(2021, 1, 1)
+
+    def test_sync_without_new_games_returns_none(self, tmp_path):
+        dataset = str(tmp_path / 'nba.csv')
+        self.mock_index(nba_boxscore, [{
+            '1-1-2021': [game('game-1', finished=False)]
+        }])
+        season = SeasonSync('nba', dataset)
+
+        assert season.sync(datetime(2021, 1, 1), datetime(2021, 1, 1)) is None
+        assert not os.path.exists(dataset)
+        assert season.watermark == datetime(2021, 1, 1)
+
+    def test_weekly_league_syncs_by_week(self, tmp_path):
+        dataset = str(tmp_path / 'nfl.csv')
+        self.mock_index(nfl_boxscore, [{
+            '1-2020': [game('week-1')],
+            '2-2020': [game('week-2')]
+        }])
+        season = SeasonSync('nfl', dataset, year=2020)
+
+        new_games = season.sync(1, 2)
+
+        assert list(new_games.index) == ['week-1', 'week-2']
+        assert self.requested_indexes == [(1, 2020, 2)]
+        assert season.watermark == 3
+        assert season.sync(end=2) is None
+
+    def test_first_sync_requires_start(self, tmp_path):
+        season = SeasonSync('nba', str(tmp_path / 'nba.csv'))
+
+        with pytest.raises(ValueError):
+            season.sync()
+
+    def test_weekly_league_requires_year(self, tmp_path):
+        with pytest.raises(ValueError):
+            SeasonSync('nfl', str(tmp_path / 'nfl.csv'))
+
+    def test_unknown_league_raises_value_error(self, tmp_path):
+        with pytest.raises(ValueError):
+            SeasonSync('xfl', str(tmp_path / 'xfl.csv'))
@@ -1,7 +1,17 @@
+import pandas as pd
 import pytest
+import requests
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from mock import patch
 from flexmock import flexmock
-from sportsipy import utils
+from pyquery import PyQuery as pq
+from sportsipy import planner, utils
+from sportsipy.nba.player import _int_property_decorator
+from urllib.error import HTTPError
 
 
 class SeasonStarts:
@@ -334,3 +344,503 @@ class TestUtils:
                                     index=3,
                                     secondary_index=4)
         assert not result
+
+
+class MockValidatedResponse:
+    def __init__(self, html_contents, status_code=200, headers=None):
+        self.status_code = status_code
+        self.text = html_contents
+        self.reason = 'OK'
+        self.headers = headers or {}
+
+
+class TestRevalidation:
+    def setup_method(self, *args, **kwargs):
+        utils._clear_revalidation_cache()
+
+    def teardown_method(self, *args, **kwargs):
+        utils._clear_revalidation_cache()
+
+    @patch('requests.get')
+    def test_unchanged_page_reuses_saved_html(self, mock_get):
+        mock_get.side_effect = [
+            MockValidatedResponse('<div>first</div>',
+                                  headers={'ETag': '"abc"',
+                                           'Last-Modified': 'Mon'}),
+            MockValidatedResponse('', status_code=304)
+        ]
+
+        first = utils._pull_page('http://season.com', revalidate=True)
+        second = utils._pull_page('http://season.com', revalidate=True)
+
+        assert first is not second
+        assert second.text() == 'first'
+        assert mock_get.call_args[1]['headers'] == {
+            'If-None-Match': '"abc"',
+            'If-Modified-Since': 'Mon'
+        }
+
+    @patch('requests.get')
+    def test_modified_page_is_parsed_again(self, mock_get):
+        mock_get.side_effect = [
+            MockValidatedResponse('<div>first</div>',
+                                  headers={'ETag': '"abc"'}),
+            MockValidatedResponse('<div>second</div>',
+                                  headers={'ETag': '"def"'})
+        ]
+
+        utils._pull_page('http://season.com', revalidate=True)
+        second = utils._pull_page('http://season.com', revalidate=True)
+
+        assert second.text() == 'second'
+        assert mock_get.call_args[1]['headers'] == {'If-None-Match': '"abc"'}
+
+    @patch('requests.get')
+    def test_page_without_validators_is_not_remembered(self, mock_get):
+        mock_get.return_value = MockValidatedResponse('<div>first</div>')
+
+        utils._pull_page('http://season.com', revalidate=True)
+        utils._pull_page('http://season.com', revalidate=True)
+
+        assert 'headers' not in mock_get.call_args[1]
+
+    @patch('requests.get')
+    @patch.object(utils, 'REVALIDATION_CACHE_SIZE', 2)
+    def test_oldest_page_is_forgotten_when_full(self, mock_get):
+        mock_get.side_effect = lambda url, **kwargs: MockValidatedResponse(
+            '<div>%s</div>' % url, headers={'ETag': '"abc"'})
+
+        for url in ['http://1.com', 'http://2.com', 'http://3.com']:
+            utils._pull_page(url, revalidate=True)
+
+        assert list(utils._revalidation_cache) == ['http://2.com',
+                                                   'http://3.com']
+
+    @patch('requests.get')
+    def test_revalidated_page_error_raises_httperror(self, mock_get):
+        mock_get.return_value = MockValidatedResponse('', status_code=404)
+
+        with pytest.raises(HTTPError):
+            utils._pull_page('http://season.com', revalidate=True)
+
+
+class TestPrefetch:
+    @patch('requests.get')
+    def test_prefetched_pages_are_returned_in_order(self, mock_get):
+        def mock_request(url):
+            if '404' in url:
+                return MockValidatedResponse('', status_code=404)
+            return MockValidatedResponse(url)
+        mock_get.side_effect = mock_request
+        urls = ['http://1.com', 'http://404.com', 'http://3.com',
+                'http://4.com']
+
+        pages = list(utils._prefetch_pages(urls, window=2))
+
+        assert pages == ['http://1.com', '', 'http://3.com', 'http://4.com']
+
+    @patch('requests.get')
+    def test_prefetch_stops_downloading_when_closed(self, mock_get):
+        mock_get.side_effect = lambda url: MockValidatedResponse(url)
+        urls = ['http://%s.com' % index for index in range(100)]
+
+        pages = utils._prefetch_pages(urls, window=2)
+        first = next(pages)
+        pages.close()
+
+        assert first == 'http://0.com'
+        assert mock_get.call_count <= 3
+
+
+class TestRequestPage:
+    @patch('requests.get')
+    def test_missing_page_is_empty(self, mock_get):
+        mock_get.return_value = MockValidatedResponse('', status_code=404)
+
+        assert utils._request_page('http://missing.com') == ''
+
+    @patch('requests.get')
+    def test_throttled_page_raises_httperror(self, mock_get):
+        mock_get.return_value = MockValidatedResponse('', status_code=429)
+
+        with pytest.raises(HTTPError):
+            utils._request_page('http://throttled.com')
+
+    @patch('requests.get')
+    def test_download_page_is_empty_after_error(self, mock_get):
+        mock_get.side_effect = requests.exceptions.Timeout
+
+        assert utils._download_page('http://slow.com') == ''
+
+
+class TestParseInProcesses:
+    def test_results_are_returned_in_argument_order(self):
+        arguments = ((str(value),) for value in range(10))
+
+        results = utils._parse_in_processes(int, arguments, processes=2,
+                                            window=1)
+
+        assert list(results) == list(range(10))
+
+    def test_closing_stops_submitting_arguments(self):
+        submitted = []
+
+        def arguments():
+            for value in range(100):
+                submitted.append(value)
+                yield (str(value),)
+
+        results = utils._parse_in_processes(int, arguments(), processes=2,
+                                            window=2)
+        first = next(results)
+        results.close()
+
+        assert first == 0
+        assert len(submitted) <= 3
+
+    def test_workers_are_spawned_rather_than_forked(self):
+        start_methods = []
+
+        def executor(max_workers, mp_context, initializer, initargs):
+            start_methods.append(mp_context.get_start_method())
+            return ThreadPoolExecutor(max_workers, initializer=initializer,
+                                      initargs=initargs)
+
+        flexmock(utils) \
+            .should_receive('ProcessPoolExecutor') \
+            .replace_with(executor)
+
+        results = utils._parse_in_processes(int, [('1',)], processes=1)
+
+        assert list(results) == [1]
+        assert start_methods == ['spawn']
+
+
+def parse_here(parser, arguments, processes, window, **kwargs):
+    return (parser(*args) for args in arguments)
+
+
+class MockPlayer:
+    def __init__(self, player_id, html=None):
+        self.player_id = player_id
+        self.html = html
+
+    def _build_url(self):
+        return 'https://example.com/%s.html' % self._player_id
+
+
+class TestCreatePlayers:
+    def test_players_are_pulled_in_order(self):
+        players = utils._create_players(MockPlayer, ['a01', 'b01'])
+
+        assert [player.player_id for player in players] == ['a01', 'b01']
+        assert [player.html for player in players] == [None, None]
+
+    def test_players_are_parsed_from_prefetched_pages(self):
+        flexmock(utils) \
+            .should_receive('_prefetch_pages') \
+            .with_args(['https://example.com/a01.html',
+                        'https://example.com/b01.html'], 4) \
+            .and_return(iter(['<html>a</html>', '']))
+        flexmock(utils) \
+            .should_receive('_parse_in_processes') \
+            .replace_with(parse_here)
+
+        players = utils._create_players(MockPlayer, ['a01', 'b01'],
+                                        processes=2)
+
+        assert [(player.player_id, player.html) for player in players] == \
+            [('a01', '<html>a</html>'), ('b01', '')]
+
+
+class TestMapConcurrently:
+    def test_results_are_returned_in_item_order(self):
+        def slow_square(value):
+            time.sleep(0.01 * (5 - value))
+            return value * value
+
+        result = utils._map_concurrently(slow_square, range(5), workers=5)
+
+        assert result == [0, 1, 4, 9, 16]
+
+    def test_exceptions_are_raised(self):
+        def fail(value):
+            raise ValueError(value)
+
+        with pytest.raises(ValueError):
+            utils._map_concurrently(fail, [1, 2], workers=2)
+
+    def test_no_items_returns_empty_list(self):
+        assert utils._map_concurrently(str, []) == []
+
+    def test_pull_pages_returns_pages_in_requested_order(self):
+        def pull_page(url, local_file, revalidate):
+            time.sleep(0.01 * len(url))
+            return url, local_file, revalidate
+
+        flexmock(utils) \
+            .should_receive('_pull_page') \
+            .replace_with(pull_page)
+
+        pages = [('http://a-longer-url.com', None),
+                 ('http://b.com', 'b.html'),
+                 ('http://c-url.com', None)]
+
+        result = utils._pull_pages(pages, revalidate=True)
+
+        assert result == [('http://a-longer-url.com', None, True),
+                          ('http://b.com', 'b.html', True),
+                          ('http://c-url.com', None, True)]
+
+    def test_seasons_dataframe_adds_year_to_each_season(self):
+        class MockTeams:
+            def __init__(self, year):
+                self.year = year
+                self.teams = [] if year == '2019' else ['DET']
+
+            def __len__(self):
+                return len(self.teams)
+
+            @property
+            def dataframes(self):
+                return pd.DataFrame([{'wins': int(self.year)}],
+                                    index=['DET'])
+
+        result = utils._seasons_dataframe(MockTeams, 2018, '2020', workers=3)
+
+        assert list(result['year']) == ['2018', '2020']
+        assert list(result['wins']) == [2018, 2020]
+
+    def test_seasons_dataframe_paces_every_download(self):
+        pools = []
+
+        def teams(year):
+            pools.append(utils._page_pool)
+            return []
+
+        utils._seasons_dataframe(teams, 2018, 2020, workers=3)
+
+        assert len(pools) == 3
+        assert pools[0] is not None
+        assert pools.count(pools[0]) == 3
+        assert pools[0]._interval == 60.0 / planner.REQUESTS_PER_MINUTE
+        assert utils._page_pool is None
+
+    def test_seasons_dataframe_pulls_seasons_in_processes(self):
+        def parse(parser, arguments, processes, window, initializer,
+                  initargs):
+            assert initializer is planner._start_worker_pool
+            assert initargs[1] == planner.REQUESTS_PER_MINUTE / 2
+            return parse_here(parser, arguments, processes, window)
+
+        flexmock(utils) \
+            .should_receive('_parse_in_processes') \
+            .replace_with(parse) \
+            .once()
+        flexmock(utils) \
+            .should_receive('_map_concurrently') \
+            .never()
+
+        result = utils._seasons_dataframe(MockSeason, 2018, 2019,
+                                          processes=2)
+
+        assert list(result['year']) == ['2018', '2019']
+
+    def test_seasons_dataframe_without_stats_returns_none(self):
+        result = utils._seasons_dataframe(lambda year: [], 2018, 2019)
+
+        assert result is None
+
+
+class MockSeason:
+    def __init__(self, year):
+        self.year = year
+
+    def __len__(self):
+        return 1
+
+    @property
+    def dataframes(self):
+        return pd.DataFrame([{'wins': int(self.year)}], index=['DET'])
+
+
+class MockGame:
+    def __init__(self, date):
+        self.datetime = date
+
+
+class TestDates:
+    def test_fast_date_formats_match_strptime(self):
+        dates = [('Wed, Oct 18, 2017', '%a, %b %d, %Y'),
+                 ('Sunday, May 14 2017', '%A, %b %d %Y'),
+                 ('Sun September 10 2017', '%a %B %d %Y'),
+                 ('Aug 31, 2017', '%b %d, %Y'),
+                 ('2018-06-07', '%Y-%m-%d'),
+                 ('Thu, Dec 13, 2018 7:00PM', '%a, %b %d, %Y %I:%M%p')]
+
+        for date_string, date_format in dates:
+            expected = datetime.strptime(date_string, date_format)
+
+            assert utils._parse_datetime(date_string, date_format) == expected
+
+    def test_invalid_fast_date_raises_value_error(self):
+        invalid_dates = [('Wed, Feb 30, 2017', '%a, %b %d, %Y'),
+                         ('Sun Sept 10 2017', '%a %B %d %Y'),
+                         ('2018-13-07', '%Y-%m-%d')]
+
+        for date_string, date_format in invalid_dates:
+            with pytest.raises(ValueError):
+                utils._parse_datetime(date_string, date_format)
+
+    def test_games_between_returns_sorted_games(self):
+        games = [MockGame(datetime(2017, 10, 20)),
+                 MockGame(None),
+                 MockGame(datetime(2017, 10, 18)),
+                 MockGame(datetime(2017, 11, 1))]
+        dates = utils._datetime_array(games)
+
+        result = utils._games_between(games, dates, datetime(2017, 10, 1),
+                                      datetime(2017, 10, 31))
+
+        assert result == [games[2], games[0]]
+
+
+class TestLazyImports:
+    @pytest.mark.parametrize('league', ['fb', 'mlb', 'nba', 'ncaab', 'ncaaf',
+                                        'nfl', 'nhl'])
+    def test_import_does_not_load_pandas_or_numpy(self, league):
+        # Run in a fresh interpreter as other tests have already imported
+        # pandas into this one.
+        script = ('import importlib, pkgutil, sys\n'
+                  'package = "sportsipy.%s"\n'
+                  'path = importlib.import_module(package).__path__\n'
+                  'for module in pkgutil.iter_modules(path):\n'
+                  '    importlib.import_module(package + "." + module.name)\n'
+                  'loaded = {"pandas", "numpy"} & set(sys.modules)\n'
+                  'assert not loaded, loaded\n' % league)
+
+        subprocess.run([sys.executable, '-c', script], check=True)
+
+    def test_import_does_not_load_squad_ids(self):
+        script = ('import sys\n'
+                  'import sportsipy.fb.team\n'
+                  'assert "sportsipy.fb.squad_ids" not in sys.modules\n'
+                  'assert "sportsipy.fb.league_ids" not in sys.modules\n')
+
+        subprocess.run([sys.executable, '-c', script], check=True)
+
+    def test_lazy_module_imports_on_first_use(self):
+        module = utils._LazyModule('json')
+
+        assert module._module is None
+        assert module.loads('[1]') == [1]
+        assert module._module is not None
+
+
+class TestPlayersDataFrame:
+    def test_row_cells_keeps_first_value_of_each_stat(self):
+        row = pq('<tr><th data-stat="player">A</th><td data-stat="pts">12</td>'
+                 '<td data-stat="mp">30:15</td></tr>')
+        cells = {'pts': '10'}
+
+        utils._row_cells(row, cells)
+
+        assert cells == {'pts': '10', 'mp': '30:15'}
+
+    def test_players_dataframe_combines_every_player(self):
+        player_dict = {
+            'player01': {'name': 'A', 'team': 'Away',
+                         'cells': {'pts': '12', 'pm': '+3', 'mp': '30:15'}},
+            'player02': {'name': 'B', 'team': 'Home',
+                         'cells': {'pts': '', 'pm': '-1', 'mp': '2:00',
+                                   'fg_pct': '.500'}}
+        }
+
+        frame = utils._players_dataframe(player_dict)
+
+        assert list(frame.index) == ['player01', 'player02']
+        assert list(frame.columns) == ['name', 'team', 'pts', 'pm', 'mp',
+                                       'fg_pct']
+        assert list(frame['team']) == ['Away', 'Home']
+        assert frame.loc['player01', 'pts'] == 12
+        assert pd.isna(frame.loc['player02', 'pts'])
+        assert list(frame['pm']) == [3, -1]
+        assert list(frame['mp']) == ['30:15', '2:00']
+        assert frame.loc['player02', 'fg_pct'] == 0.5
+
+    def test_players_dataframe_without_players_returns_none(self):
+        assert utils._players_dataframe({}) is None
+
+
+class MockCareer:
+    def __init__(self, seasons, points):
+        self._season = seasons
+        self._points = points
+        self._index = 1
+
+    def _dataframe_fields(self):
+        return {'season': self._season[self._index],
+                'points': self._points[self._index]}
+
+
+class MockDecoratedCareer:
+    def __init__(self, seasons, points):
+        self._season = seasons
+        self._points = points
+        self._index = 1
+
+    @property
+    def season(self):
+        return self._season[self._index]
+
+    @_int_property_decorator
+    def points(self):
+        return self._points
+
+    def _dataframe_fields(self):
+        return {'season': self.season,
+                'points': self.points}
+
+
+class TestCareerDataFrame:
+    def test_season_view_leaves_player_unchanged(self):
+        player = MockCareer(['2018', '2019'], [10, 20])
+
+        view = utils._season_view(player, 0)
+
+        assert view._index == 0
+        assert player._index == 1
+        assert view._points is player._points
+
+    def test_career_dataframe_includes_every_season(self):
+        player = MockCareer(['2018', '2019', 'Career'], [10, 20, 30])
+
+        frame = utils._career_dataframe(player)
+
+        assert list(frame['season']) == ['2018', '2019', 'Career']
+        assert list(frame['points']) == [10, 20, 30]
+        assert list(frame.index.get_level_values(0)) == ['2018', '2019',
+                                                         'Career']
+        assert player._index == 1
+
+    def test_career_dataframe_converts_season_columns(self):
+        player = MockDecoratedCareer(['2018', '2019', 'Career'],
+                                     ['10', '', '1,030'])
+        flexmock(MockDecoratedCareer) \
+            .should_call('_dataframe_fields') \
+            .once()
+
+        frame = utils._career_dataframe(player)
+
+        assert list(frame['season']) == ['2018', '2019', 'Career']
+        assert frame['points'].tolist()[0] == 10
+        assert pd.isnull(frame['points'].tolist()[1])
+        assert frame['points'].tolist()[2] == 1030
+        assert player._index == 1
+
+    def test_career_dataframe_repeated_seasons_keep_their_stats(self):
+        player = MockCareer(['2018', '2018'], [10, 20])
+
+        frame = utils._career_dataframe(player)
+
+        assert list(frame['points']) == [10, 20]